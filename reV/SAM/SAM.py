@@ -253,11 +253,15 @@ class Sam:
     # callable attributes to be ignored in the get/set logic
     IGNORE_ATTRS = ['assign', 'execute', 'export']
 
+    # memo of raw input keys to filtered PySAM input keys
+    _FILTERED_KEYS = {}
+
     def __init__(self):
         self._pysam = self.PYSAM.new()
         self._attr_dict = None
         self._default = None
         self._inputs = []
+        self._assigned = {}
         if 'constant' in self.input_list:
             self['constant'] = 0.0
 
@@ -311,6 +315,8 @@ class Sam:
                        .format(key, group, self.pysam, value, type(value), e))
                 logger.exception(msg)
                 raise SAMInputError(msg)
+            else:
+                self._assigned[key] = value
 
     @property
     def pysam(self):
@@ -449,6 +455,11 @@ class Sam:
     def assign_inputs(self, inputs, raise_warning=False):
         """Assign a flat dictionary of inputs to the PySAM object.
 
+        Inputs that were already assigned to this PySAM object with the
+        exact same value object are skipped (without re-filtering the input
+        key), so re-assigning a static parameter set to a re-used object
+        only sets the inputs that changed.
+
         Parameters
         ----------
         inputs : dict
@@ -458,8 +469,14 @@ class Sam:
             are not found in the PySAM object.
         """
         for k, v in inputs.items():
-            k = self._filter_inputs(k)
-            if k in self.input_list:
+            if k in self._FILTERED_KEYS:
+                k = self._FILTERED_KEYS[k]
+            else:
+                k = self._FILTERED_KEYS.setdefault(k, self._filter_inputs(k))
+
+            if k in self._assigned and self._assigned[k] is v:
+                continue
+            elif k in self.input_list:
                 self[k] = v
             elif raise_warning:
                 wmsg = ('Not setting input "{}". Not found in PySAM inputs.'
@@ -109,7 +109,62 @@ class Economic(RevPySam):
         return sys_cap
 
     @staticmethod
-    def _get_annual_energy(site, site_df, site_gids, cf_arr, inputs, calc_aey):
+    def _get_cf_sites(cfh, dset, sites):
+        """Read a cf dataset for a set of sites with a single hyperslab read.
+
+        The site (last) axis of the read is aligned to the dataset chunks so
+        that every chunk is only read once for all of the sites.
+
+        Parameters
+        ----------
+        cfh : reV.handlers.outputs.Outputs
+            Open reV generation capacity factor output file handler.
+        dset : str
+            Dataset to read (e.g. cf_mean or cf_profile).
+        sites : list | np.ndarray
+            Site gids to read from the dataset.
+
+        Returns
+        -------
+        data : np.ndarray
+            Dataset values for the requested sites. The last axis
+            corresponds to the sites in the order of gid_index.
+        gid_index : dict
+            Dictionary mapping the site gids to their position in the last
+            axis of data.
+        """
+        gids = cfh.get_meta_arr('gid')
+        col_lookup = dict(zip(gids, range(len(gids))))
+        missing = [site for site in sites if site not in col_lookup]
+        if missing:
+            raise KeyError('Could not find sites {} in the cf file meta.'
+                           .format(missing))
+
+        cols = np.array([col_lookup[site] for site in sites], dtype=np.int64)
+        shape, _, chunks = cfh.get_dset_properties(dset)
+        i0 = cols.min()
+        i1 = cols.max() + 1
+        if chunks is not None:
+            i0 = (i0 // chunks[-1]) * chunks[-1]
+            i1 = min(int(np.ceil(i1 / chunks[-1])) * chunks[-1], shape[-1])
+
+        axes = (slice(None), ) * (len(shape) - 1)
+        if (i1 - i0) <= 2 * len(cols):
+            data = cfh[(dset, ) + axes + (slice(i0, i1), )]
+            cols -= i0
+        else:
+            # sparse sites, only read the required columns
+            ucols = np.unique(cols)
+            data = cfh[(dset, ) + axes + (list(ucols), )]
+            cols = np.searchsorted(ucols, cols)
+
+        data = data[..., cols]
+        gid_index = {site: i for i, site in enumerate(sites)}
+
+        return data, gid_index
+
+    @staticmethod
+    def _get_annual_energy(site, site_df, gid_index, cf_arr, inputs, calc_aey):
         """Get the single-site cf and annual energy and add to site_df.
 
         Parameters
@@ -120,10 +175,10 @@ class Economic(RevPySam):
             Dataframe of site-specific input variables. Row index corresponds
             to site number/gid (via df.loc not df.iloc), column labels are the
             variable keys that will be passed forward as SAM parameters.
-        site_gids : list
-            List of all site gid values from the cf_file.
+        gid_index : dict
+            Dictionary mapping site gids to their position in cf_arr.
         cf_arr : np.ndarray
-            Array of cf_mean values for all sites in the cf_file for the
+            Array of cf_mean values for the sites in gid_index for the
             given year.
         inputs : dict
             Dictionary of SAM input parameters.
@@ -138,7 +193,7 @@ class Economic(RevPySam):
         """
 
         # get the index location of the site in question
-        isite = site_gids.index(site)
+        isite = gid_index[site]
 
         # calculate the capacity factor
         cf = cf_arr[isite]
@@ -160,7 +215,48 @@ class Economic(RevPySam):
         return site_df
 
     @staticmethod
-    def _get_gen_profile(site, site_df, cf_file, cf_year, inputs):
+    def _get_cf_profiles(sites, cf_file, cf_year):
+        """Get the cf profiles for all sites with a single read of cf_file.
+
+        Parameters
+        ----------
+        sites : list | np.ndarray
+            Site gids to get cf profiles for.
+        cf_file : str
+            reV generation capacity factor output file with path.
+        cf_year : int | str | None
+            reV generation year to calculate econ for. Looks for cf_mean_{year}
+            or cf_profile_{year}. None will default to a non-year-specific cf
+            dataset (cf_mean, cf_profile).
+
+        Returns
+        -------
+        cf_profiles : np.ndarray
+            2D array (time, sites) of cf profiles for the sites in gid_index.
+        gid_index : dict
+            Dictionary mapping site gids to their column in cf_profiles.
+        """
+
+        with Outputs(cf_file) as cfh:
+
+            # look for the cf_profile dataset
+            if 'cf_profile' in cfh.datasets:
+                dset = 'cf_profile'
+            elif 'cf_profile-{}'.format(cf_year) in cfh.datasets:
+                dset = 'cf_profile-{}'.format(cf_year)
+            elif 'cf_profile_{}'.format(cf_year) in cfh.datasets:
+                dset = 'cf_profile_{}'.format(cf_year)
+            else:
+                raise KeyError('Could not find cf_profile values for '
+                               'SingleOwner. Available datasets: {}'
+                               .format(cfh.datasets))
+
+            cf_profiles, gid_index = Economic._get_cf_sites(cfh, dset, sites)
+
+        return cf_profiles, gid_index
+
+    @staticmethod
+    def _get_gen_profile(site, site_df, cf_profile, inputs):
         """Get the single-site generation time series and add to inputs dict.
 
         Parameters
@@ -171,12 +267,8 @@ class Economic(RevPySam):
             Dataframe of site-specific input variables. Row index corresponds
             to site number/gid (via df.loc not df.iloc), column labels are the
             variable keys that will be passed forward as SAM parameters.
-        cf_file : str
-            reV generation capacity factor output file with path.
-        cf_year : int | str | None
-            reV generation year to calculate econ for. Looks for cf_mean_{year}
-            or cf_profile_{year}. None will default to a non-year-specific cf
-            dataset (cf_mean, cf_profile).
+        cf_profile : np.ndarray
+            1D array of the site cf profile from the cf_file.
         inputs : dict
             Dictionary of SAM input parameters.
 
@@ -191,25 +283,8 @@ class Economic(RevPySam):
         sys_cap = Economic._parse_sys_cap(site, inputs, site_df)
 
         # Retrieve the generation profile for single owner input
-        with Outputs(cf_file) as cfh:
-
-            # get the index location of the site in question
-            site_gids = list(cfh.meta['gid'])
-            isite = site_gids.index(site)
+        gen = cf_profile * sys_cap
 
-            # look for the cf_profile dataset
-            if 'cf_profile' in cfh.datasets:
-                gen = cfh['cf_profile', :, isite] * sys_cap
-            elif 'cf_profile-{}'.format(cf_year) in cfh.datasets:
-                gen = (cfh['cf_profile-{}'.format(cf_year), :, isite]
-                       * sys_cap)
-            elif 'cf_profile_{}'.format(cf_year) in cfh.datasets:
-                gen = (cfh['cf_profile_{}'.format(cf_year), :, isite]
-                       * sys_cap)
-            else:
-                raise KeyError('Could not find cf_profile values for '
-                               'SingleOwner. Available datasets: {}'
-                               .format(cfh.datasets))
         # add to input dict
         inputs['gen'] = gen
 
@@ -327,6 +402,10 @@ class LCOE(Economic):
     MODULE = 'lcoefcr'
     PYSAM = PySamLCOE
 
+    # SAM lcoefcr cost inputs used in the closed-form LCOE calculation
+    COST_INPUTS = ('fixed_charge_rate', 'capital_cost', 'fixed_operating_cost',
+                   'variable_operating_cost')
+
     def __init__(self, parameters=None, site_parameters=None,
                  output_request=('lcoe_fcr',)):
         """Initialize a SAM LCOE economic model object."""
@@ -334,11 +413,13 @@ class LCOE(Economic):
                          output_request=output_request)
 
     @staticmethod
-    def _parse_lcoe_inputs(site_df, cf_file, cf_year):
+    def _parse_lcoe_inputs(sites, site_df, cf_file, cf_year):
         """Parse for non-site-specific LCOE inputs.
 
         Parameters
         ----------
+        sites : list | np.ndarray
+            Site gids to get LCOE inputs for.
         site_df : pd.DataFrame
             Dataframe of site-specific input variables. Row index corresponds
             to site number/gid (via df.loc not df.iloc), column labels are the
@@ -352,20 +433,16 @@ class LCOE(Economic):
 
         Returns
         -------
-        site_gids : list
-            List of all site gid values from the cf_file.
+        gid_index : dict
+            Dictionary mapping site gids to their position in cf_arr.
         calc_aey : bool
             Flag to require calculation of the annual energy yield before
             running LCOE.
         cf_arr : np.ndarray
-            Array of cf_mean values for all sites in the cf_file for the
+            Array of cf_mean values for the sites in gid_index for the
             given year.
         """
 
-        # get the cf_file meta data gid's to use as indexing tools
-        with Outputs(cf_file) as cfh:
-            site_gids = list(cfh.meta['gid'])
-
         calc_aey = False
         if 'annual_energy' not in site_df:
             # annual energy yield has not been input, flag to calculate
@@ -376,20 +453,23 @@ class LCOE(Economic):
         if 'capacity_factor' not in site_df:
             site_df.loc[:, 'capacity_factor'] = np.nan
 
-        # pull all cf mean values for LCOE calc
+        # pull the cf mean values for the requested sites for LCOE calc
         with Outputs(cf_file) as cfh:
             if 'cf_mean' in cfh.datasets:
-                cf_arr = cfh['cf_mean']
+                dset = 'cf_mean'
             elif 'cf_mean-{}'.format(cf_year) in cfh.datasets:
-                cf_arr = cfh['cf_mean-{}'.format(cf_year)]
+                dset = 'cf_mean-{}'.format(cf_year)
             elif 'cf_mean_{}'.format(cf_year) in cfh.datasets:
-                cf_arr = cfh['cf_mean_{}'.format(cf_year)]
+                dset = 'cf_mean_{}'.format(cf_year)
             elif 'cf' in cfh.datasets:
-                cf_arr = cfh['cf']
+                dset = 'cf'
             else:
                 raise KeyError('Could not find cf_mean values for LCOE. '
                                'Available datasets: {}'.format(cfh.datasets))
-        return site_gids, calc_aey, cf_arr
+
+            cf_arr, gid_index = Economic._get_cf_sites(cfh, dset, sites)
+
+        return gid_index, calc_aey, cf_arr
 
     @property
     def default(self):
@@ -404,9 +484,152 @@ class LCOE(Economic):
             self._default = DefaultLCOE.default()
         return self._default
 
+    @staticmethod
+    def _get_cost_input(var, sites, site_df, inputs):
+        """Get a numeric LCOE cost input for an array of sites.
+
+        Parameters
+        ----------
+        var : str
+            SAM lcoefcr input variable name.
+        sites : np.ndarray
+            Site gids to get the input for.
+        site_df : pd.DataFrame
+            Dataframe of site-specific input variables. Site-specific values
+            take precedence over the generic inputs (same as SAM).
+        inputs : dict
+            Dictionary of SAM input parameters.
+
+        Returns
+        -------
+        arr : np.ndarray | None
+            Float array of the input values for every site. None if the input
+            is missing or cannot be interpreted as a number.
+        """
+        arr = None
+        try:
+            if var in site_df:
+                arr = site_df.loc[sites, var].values.astype(np.float64)
+            elif var in inputs and not isinstance(inputs[var], (str, bool)):
+                arr = np.full(len(sites), float(inputs[var]))
+        except (TypeError, ValueError):
+            arr = None
+
+        return arr
+
+    @classmethod
+    def _get_annual_energy_arr(cls, sites, site_df, gid_index, cf_arr,
+                               inputs, calc_aey):
+        """Get the cf and annual energy for an array of sites and add to
+        site_df (vectorized version of Economic._get_annual_energy).
+
+        Parameters
+        ----------
+        sites : np.ndarray
+            Site gids to get the annual energy for.
+        site_df : pd.DataFrame
+            Dataframe of site-specific input variables. Row index corresponds
+            to site number/gid (via df.loc not df.iloc), column labels are the
+            variable keys that will be passed forward as SAM parameters.
+        gid_index : dict
+            Dictionary mapping site gids to their position in cf_arr.
+        cf_arr : np.ndarray
+            Array of cf_mean values for the sites in gid_index for the
+            given year.
+        inputs : dict
+            Dictionary of SAM input parameters.
+        calc_aey : bool
+            Flag to add annual_energy to df.
+
+        Returns
+        -------
+        aey : np.ndarray | None
+            Annual energy yield (kWh) for every site. None if the system
+            capacity cannot be interpreted as a number.
+        """
+        isites = [gid_index[site] for site in sites]
+        cf = np.array(cf_arr[isites], dtype=np.float64)
+        if (cf > 1).any():
+            warn('Capacity factor > 1. Dividing by 100.')
+            cf = np.where(cf > 1, cf / 100, cf)
+
+        site_df.loc[sites, 'capacity_factor'] = cf
+
+        if calc_aey:
+            # raises an error if the system capacity cannot be found
+            cls._parse_sys_cap(sites[0], inputs, site_df)
+
+            # generic inputs take precedence (same as _parse_sys_cap)
+            for var in ('system_capacity', 'turbine_capacity'):
+                if var in inputs:
+                    sys_cap = cls._get_cost_input(var, sites, {}, inputs)
+                    break
+            else:
+                var = ('system_capacity' if 'system_capacity' in site_df
+                       else 'turbine_capacity')
+                sys_cap = cls._get_cost_input(var, sites, site_df, inputs)
+
+            if sys_cap is None:
+                return None
+
+            # Calc annual energy, mult by 8760 to convert kW to kWh
+            site_df.loc[sites, 'annual_energy'] = sys_cap * cf * 8760
+
+        return cls._get_cost_input('annual_energy', sites, site_df, inputs)
+
+    @classmethod
+    def lcoe_fcr_arr(cls, sites, site_df, gid_index, cf_arr, inputs,
+                     calc_aey):
+        """Calculate the fixed charge rate LCOE for an array of sites.
+
+        This is the same closed-form calculation as the SAM lcoefcr module
+        (LCOE = (FCR * CC + FOC) / AEP + VOC) but is vectorized with numpy
+        for all sites that share a SAM config.
+
+        Parameters
+        ----------
+        sites : np.ndarray
+            Site gids that share the same SAM inputs.
+        site_df : pd.DataFrame
+            Dataframe of site-specific input variables. Row index corresponds
+            to site number/gid (via df.loc not df.iloc), column labels are the
+            variable keys that will be passed forward as SAM parameters.
+        gid_index : dict
+            Dictionary mapping site gids to their position in cf_arr.
+        cf_arr : np.ndarray
+            Array of cf_mean values for the sites in gid_index for the
+            given year.
+        inputs : dict
+            Dictionary of SAM input parameters.
+        calc_aey : bool
+            Flag to add annual_energy to df.
+
+        Returns
+        -------
+        lcoe : np.ndarray | None
+            LCOE values ($/MWh) for every site. None if the inputs are not
+            supported by the closed-form calculation and SAM should be run.
+        """
+        costs = [cls._get_cost_input(var, sites, site_df, inputs)
+                 for var in cls.COST_INPUTS]
+        if any(arr is None for arr in costs):
+            return None
+
+        aey = cls._get_annual_energy_arr(sites, site_df, gid_index, cf_arr,
+                                         inputs, calc_aey)
+        if aey is None or not (aey > 0).all():
+            return None
+
+        fcr, cc, foc, voc = costs
+        lcoe = ((fcr * cc + foc) / aey + voc) * 1000
+        if not np.isfinite(lcoe).all():
+            return None
+
+        return lcoe
+
     @classmethod
     def reV_run(cls, points_control, site_df, cf_file, cf_year,
-                output_request=('lcoe_fcr',)):
+                output_request=('lcoe_fcr',), vectorize=True):
         """Execute SAM LCOE simulations based on a reV points control instance.
 
         Parameters
@@ -426,6 +649,11 @@ class LCOE(Economic):
             dataset (cf_mean, cf_profile).
         output_request : list | tuple | str
             Output(s) to retrieve from SAM.
+        vectorize : bool
+            Flag to calculate lcoe_fcr with numpy for all sites sharing a
+            SAM config instead of running SAM for every site. SAM is still
+            run for configs with unsupported (e.g. missing or non-numeric)
+            inputs or if outputs other than lcoe_fcr are requested.
 
         Returns
         -------
@@ -437,14 +665,34 @@ class LCOE(Economic):
 
         out = {}
 
-        site_gids, calc_aey, cf_arr = cls._parse_lcoe_inputs(site_df, cf_file,
-                                                             cf_year)
+        gid_index, calc_aey, cf_arr = cls._parse_lcoe_inputs(
+            points_control.sites, site_df, cf_file, cf_year)
+
+        if isinstance(output_request, str):
+            output_request = [output_request]
+
+        vectorized = {}
+        if vectorize and list(output_request) == ['lcoe_fcr']:
+            for config, sites in points_control.sites_by_config.items():
+                _, inputs = points_control.project_points[sites[0]]
+                lcoe = cls.lcoe_fcr_arr(sites, site_df, gid_index, cf_arr,
+                                        inputs, calc_aey)
+                if lcoe is not None:
+                    vectorized.update(zip(sites, lcoe))
+                else:
+                    logger.debug('Running SAM LCOE for sites with SAM config '
+                                 '"{}", inputs are not supported by the '
+                                 'vectorized calculation.'.format(config))
 
         for site in points_control.sites:
+            if site in vectorized:
+                out[site] = {'lcoe_fcr': vectorized[site]}
+                continue
+
             # get SAM inputs from project_points based on the current site
             _, inputs = points_control.project_points[site]
 
-            site_df = cls._get_annual_energy(site, site_df, site_gids, cf_arr,
+            site_df = cls._get_annual_energy(site, site_df, gid_index, cf_arr,
                                              inputs, calc_aey)
 
             out[site] = super().reV_run(site, site_df, inputs, output_request)
@@ -562,6 +810,10 @@ class SingleOwner(Economic):
 
         out = {}
 
+        # read the cf profiles for all sites at once
+        cf_profiles, gid_index = cls._get_cf_profiles(points_control.sites,
+                                                      cf_file, cf_year)
+
         for site in points_control.sites:
             # get SAM inputs from project_points based on the current site
             _, inputs = points_control.project_points[site]
@@ -570,8 +822,8 @@ class SingleOwner(Economic):
             site_inputs = deepcopy(inputs)
 
             # set the generation profile as an input.
-            site_inputs = cls._get_gen_profile(site, site_df, cf_file, cf_year,
-                                               site_inputs)
+            site_inputs = cls._get_gen_profile(
+                site, site_df, cf_profiles[:, gid_index[site]], site_inputs)
 
             out[site] = super().reV_run(site, site_df, site_inputs,
                                         output_request)
@@ -4,8 +4,11 @@
 Wraps the NREL-PySAM pvwattsv5, windpower, and tcsmolensalt modules with
 additional reV features.
 """
-from abc import ABC
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import copy
+import json
 import os
 import logging
 import numpy as np
@@ -31,19 +34,364 @@ from reV.SAM.econ import LCOE, SingleOwner
 logger = logging.getLogger(__name__)
 
 
+class SiteResource:
+    """Single-site view of SAM-ready resource arrays for a full split.
+
+    The resource arrays are pre-processed (truncated to a multiple of 8760,
+    rolled to local time, and checked) once for all sites in a split and are
+    stored as (sites, time) arrays so that each site's data is a contiguous
+    slice. The lists required by PySAM are only created on request.
+    """
+
+    def __init__(self, name, index, arrays, time_data, time_interval):
+        """
+        Parameters
+        ----------
+        name : int
+            Resource gid of the site.
+        index : int
+            Position of the site in the first axis of the arrays.
+        arrays : dict
+            Dictionary of SAM resource variable names and pre-processed
+            resource arrays with shape (sites, time, ...).
+        time_data : dict
+            Dictionary of SAM time variables (e.g. "hour", "day") and lists
+            of the (truncated) local time data that apply to all sites.
+        time_interval : int
+            Number of time steps in one hour.
+        """
+        self.name = name
+        self._i = index
+        self._arrays = arrays
+        self._time_data = time_data
+        self.time_interval = time_interval
+
+    def __repr__(self):
+        msg = ('{} for site {} with variables: {}'
+               .format(self.__class__.__name__, self.name,
+                       list(self._arrays.keys())))
+        return msg
+
+    def __contains__(self, var):
+        return var in self._arrays
+
+    @property
+    def data(self):
+        """Get the single-site SAM resource data.
+
+        Returns
+        -------
+        data : dict
+            Dictionary of SAM resource and time variable names and lists of
+            data for this site.
+        """
+        data = {var: arr[self._i].tolist()
+                for var, arr in self._arrays.items()}
+        data.update(self._time_data)
+
+        return data
+
+
 class Generation(RevPySam, ABC):
     """Base class for SAM generation simulations."""
 
+    # Flag for whether the resource can be handed to this model as
+    # vectorized SiteResource objects instead of single-site DataFrames
+    RESOURCE_ARRAYS = False
+
+    # SAM objects kept for re-use across all splits run in one process,
+    # keyed by (class, config id, config inputs), least recently used first
+    _SIM_POOL = OrderedDict()
+    SIM_POOL_SIZE = 8
+
+    def __init__(self, resource=None, meta=None, parameters=None,
+                 output_request=None, drop_leap=False):
+        """Initialize a SAM generation object.
+
+        Parameters
+        ----------
+        resource : pd.DataFrame
+            2D table with resource data.
+        meta : pd.DataFrame
+            1D table with resource meta data.
+        parameters : dict or ParametersManager()
+            SAM model input parameters.
+        output_request : list
+            Requested SAM outputs (e.g., 'cf_mean', 'annual_energy',
+            'cf_profile', 'gen_profile', 'energy_yield', 'ppa_price',
+            'lcoe_fcr').
+        drop_leap : bool
+            Drops February 29th from the resource data. If False, December
+            31st is dropped from leap years.
+        """
+
+        # don't pass resource to base class, set in set_site instead.
+        super().__init__(meta, parameters, output_request)
+        self.set_site(resource=resource, meta=meta, parameters=parameters,
+                      output_request=output_request, drop_leap=drop_leap)
+
+    def set_site(self, resource=None, meta=None, parameters=None,
+                 output_request=None, drop_leap=False):
+        """Set the site-specific resource data, meta data, and inputs.
+
+        This resets all of the site-specific state of this object so that
+        the object (and its underlying PySAM object) can be re-used to run
+        multiple sites that share the same SAM configuration. Only inputs
+        that differ from the previous site are re-assigned to PySAM.
+
+        Parameters
+        ----------
+        resource : pd.DataFrame | SiteResource
+            2D table with resource data or a SiteResource object with
+            pre-processed single-site data.
+        meta : pd.DataFrame
+            1D table with resource meta data.
+        parameters : dict or ParametersManager()
+            SAM model input parameters.
+        output_request : list
+            Requested SAM outputs (e.g., 'cf_mean', 'annual_energy',
+            'cf_profile', 'gen_profile', 'energy_yield', 'ppa_price',
+            'lcoe_fcr').
+        drop_leap : bool
+            Drops February 29th from the resource data. If False, December
+            31st is dropped from leap years.
+        """
+
+        # drop the leap day
+        if drop_leap:
+            resource = self.drop_leap(resource)
+
+        parameters, meta = self._parse_site_inputs(parameters, meta)
+
+        self._meta = meta
+        self.parameters = parameters
+        self.output_request = output_request
+        self.outputs = {}
+        self.time_interval = 1
+
+        # Set the site number using resource
+        if isinstance(resource, (pd.DataFrame, SiteResource)):
+            self._site = resource.name
+        else:
+            self._site = None
+
+        if resource is not None and meta is not None:
+            self.set_resource(resource)
+
+    @classmethod
+    @abstractmethod
+    def _get_sam_res_arrays(cls, arrays, shifts):
+        """Abstract method to get the SAM resource arrays for all sites in a
+        split.
+
+        Parameters
+        ----------
+        arrays : dict
+            Dictionary of resource dataset names and (time, sites) arrays
+            that have been truncated to a multiple of 8760 (UTC).
+        shifts : np.ndarray
+            Number of time steps to roll each site's data to local time.
+
+        Returns
+        -------
+        sam_arrays : dict
+            Dictionary of SAM resource variable names and (sites, time, ...)
+            arrays in local time.
+        """
+
     @staticmethod
-    def _get_res(res_df, output_request):
+    def _roll_res_arrays(arr, shifts):
+        """Roll a (time, sites, ...) array to local time for each site.
+
+        Parameters
+        ----------
+        arr : np.ndarray
+            Resource data array with time on the first axis and sites on the
+            second axis.
+        shifts : np.ndarray
+            Number of time steps to roll each site's data.
+
+        Returns
+        -------
+        out : np.ndarray
+            Rolled resource array with sites on the first axis and time on
+            the second axis so that each site's data is contiguous.
+        """
+        out = np.empty((arr.shape[1], arr.shape[0]) + arr.shape[2:],
+                       dtype=arr.dtype)
+        for shift in np.unique(shifts):
+            cols = np.where(shifts == shift)[0]
+            out[cols] = np.swapaxes(np.roll(arr[:, cols], shift, axis=0),
+                                    0, 1)
+
+        return out
+
+    @staticmethod
+    def _get_site_meta(resources, site, i):
+        """Get the meta data for a single site from a SAM resource object.
+
+        Parameters
+        ----------
+        resources : rex.sam_resource.SAMResource
+            SAM resource object for the points control split.
+        site : int
+            Resource gid of the site.
+        i : int
+            Position of the site in the SAM resource object.
+
+        Returns
+        -------
+        meta : pd.Series
+            1D table with resource meta data for the site.
+        """
+        meta = resources.meta.loc[site].copy()
+        if resources.h is not None:
+            try:
+                meta['height'] = resources.h[i]
+            except TypeError:
+                meta['height'] = resources.h
+
+        return meta
+
+    @classmethod
+    def get_site_resources(cls, resources, timezones, drop_leap=False):
+        """Get pre-processed single-site resource data for a full split.
+
+        The leap day dropping, 8760 truncation, timezone roll, and resource
+        checks are performed once for all sites in the resource object.
+
+        Parameters
+        ----------
+        resources : rex.sam_resource.SAMResource
+            SAM resource object for the points control split.
+        timezones : list | np.ndarray
+            Timezone of every site in the resource object.
+        drop_leap : bool
+            Drops February 29th from the resource data. If False, December
+            31st is dropped from leap years.
+
+        Returns
+        -------
+        site_resources : list
+            List of SiteResource objects, one for each site in resources.
+        res_arrays : dict
+            Dictionary of resource dataset names and (time, sites) arrays
+            truncated to a multiple of 8760 in the original (UTC) time.
+        """
+        time_index = resources.time_index
+        res_arrays = {var: resources[var].values
+                      for var in resources.var_list}
+
+        if drop_leap:
+            leap_day = (time_index.month == 2) & (time_index.day == 29)
+            if leap_day.any():
+                time_index = time_index[~leap_day]
+                res_arrays = {var: arr[~leap_day]
+                              for var, arr in res_arrays.items()}
+
+        time_interval = cls.get_time_interval(time_index.values)
+        time_index = cls.ensure_res_len(time_index)
+        res_arrays = {var: cls.ensure_res_len(arr)
+                      for var, arr in res_arrays.items()}
+
+        shifts = (np.asarray(timezones) * time_interval).astype(int)
+        sam_arrays = cls._get_sam_res_arrays(res_arrays, shifts)
+        time_data = {'minute': time_index.minute.tolist(),
+                     'hour': time_index.hour.tolist(),
+                     'year': time_index.year.tolist(),
+                     'month': time_index.month.tolist(),
+                     'day': time_index.day.tolist()}
+
+        site_resources = [SiteResource(site, i, sam_arrays, time_data,
+                                       time_interval)
+                          for i, site in enumerate(resources.sites)]
+
+        return site_resources, res_arrays
+
+    @classmethod
+    def _get_split_resources(cls, points_control, resources,
+                             drop_leap=False):
+        """Get the pre-processed resource data for all sites in a split.
+
+        Parameters
+        ----------
+        points_control : config.PointsControl
+            PointsControl instance containing project points site and SAM
+            config info.
+        resources : rex.sam_resource.SAMResource
+            SAM resource object for the points control split.
+        drop_leap : bool
+            Drops February 29th from the resource data. If False, December
+            31st is dropped from leap years.
+
+        Returns
+        -------
+        site_resources : list
+            List of SiteResource objects, one for each site in resources.
+        metas : list
+            List of single-site meta data series with timezone.
+        res_arrays : dict
+            Dictionary of resource dataset names and (time, sites) arrays
+            truncated to a multiple of 8760 in the original (UTC) time.
+        """
+        metas = []
+        for i, site in enumerate(resources.sites):
+            _, inputs = points_control.project_points[site]
+            meta = cls._get_site_meta(resources, site, i)
+            metas.append(cls.tz_check(inputs, meta))
+
+        timezones = [meta['timezone'] for meta in metas]
+        site_resources, res_arrays = cls.get_site_resources(
+            resources, timezones, drop_leap=drop_leap)
+
+        return site_resources, metas, res_arrays
+
+    def _parse_site_inputs(self, parameters, meta):
+        """Check the SAM inputs and meta data for a single site.
+
+        Parameters
+        ----------
+        parameters : dict
+            SAM model input parameters.
+        meta : pd.DataFrame
+            1D table with resource meta data.
+
+        Returns
+        -------
+        parameters : dict
+            SAM model input parameters.
+        meta : pd.DataFrame
+            1D table with resource meta data with timezone.
+        """
+        meta = self.tz_check(parameters, meta)
+
+        return parameters, meta
+
+    @abstractmethod
+    def set_resource(self, resource):
+        """Abstract method to set the resource data arrays for a single site.
+
+        Parameters
+        ----------
+        resource : pd.DataFrame | SiteResource
+            2D table with resource data or a SiteResource object with
+            pre-processed single-site data.
+        """
+
+    @staticmethod
+    def _get_res(res_df, output_request, index=None):
         """Get the resource arrays and pass through for output (single site).
 
         Parameters
         ----------
-        res_df : pd.DataFrame
-            2D table with resource data.
+        res_df : pd.DataFrame | dict
+            2D table with resource data. Can also be a dictionary of
+            truncated (time, sites) resource arrays if index is input.
         output_request : list
             Outputs to retrieve from SAM.
+        index : int | None
+            Position of the site in the second axis of the res_df arrays.
+            None if res_df is a single-site DataFrame.
 
         Returns
         -------
@@ -62,7 +410,11 @@ class Generation(RevPySam, ABC):
                 res_reqs.append(req)
                 if res_out is None:
                     res_out = {}
-                res_out[req] = Generation.ensure_res_len(res_df[req].values)
+                if index is None:
+                    res_out[req] = Generation.ensure_res_len(
+                        res_df[req].values)
+                else:
+                    res_out[req] = res_df[req][:, index].copy()
         for req in res_reqs:
             out_req_cleaned.remove(req)
 
@@ -271,10 +623,10 @@ class Generation(RevPySam, ABC):
             so.outputs_to_utc_arr()
             self.outputs.update(so.outputs)
 
-    @classmethod
-    def reV_run(cls, points_control, res_file, output_request=('cf_mean',),
-                downscale=None, drop_leap=False):
-        """Execute SAM generation based on a reV points control instance.
+    @staticmethod
+    def _get_resources(points_control, res_file, output_request=('cf_mean',),
+                       downscale=None):
+        """Read (and curtail if applicable) the SAM resource for a split.
 
         Parameters
         ----------
@@ -289,20 +641,12 @@ class Generation(RevPySam, ABC):
             Option for NSRDB resource downscaling to higher temporal
             resolution. Expects a string in the Pandas frequency format,
             e.g. '5min'.
-        drop_leap : bool
-            Drops February 29th from the resource data. If False, December
-            31st is dropped from leap years.
 
         Returns
         -------
-        out : dict
-            Nested dictionaries where the top level key is the site index,
-            the second level key is the variable name, second level value is
-            the output variable value.
+        resources : rex.sam_resource.SAMResource
+            SAM resource object for the points control split.
         """
-        # initialize output dictionary
-        out = {}
-
         # Get the RevPySam resource object
         resources = RevPySam.get_sam_res(res_file,
                                          points_control.project_points,
@@ -316,24 +660,171 @@ class Generation(RevPySam, ABC):
             resources = curtail(resources, curtailment,
                                 random_seed=curtailment.random_seed)
 
-        # Use resource object iterator
-        for res_df, meta in resources:
+        return resources
+
+    @staticmethod
+    def _chunk_points_control(points_control, chunk_size):
+        """Split a points control into sub-splits that are aligned with the
+        site chunking of the resource file.
+
+        Parameters
+        ----------
+        points_control : config.PointsControl
+            PointsControl instance containing project points site and SAM
+            config info.
+        chunk_size : int
+            Site (x-axis) chunk size of the resource file.
+
+        Returns
+        -------
+        sub_pcs : list
+            List of PointsControl instances, each containing the sites in one
+            resource chunk.
+        """
+        sites = np.asarray(points_control.project_points.sites)
+        breaks = np.where(np.diff(sites // chunk_size) != 0)[0] + 1
+        bounds = np.concatenate(([0], breaks, [len(sites)]))
+        sub_pcs = [points_control.split(i0, i1,
+                                        points_control.project_points,
+                                        sites_per_split=i1 - i0)
+                   for i0, i1 in zip(bounds[:-1], bounds[1:])]
+
+        return sub_pcs
+
+    @classmethod
+    def _get_sim_key(cls, config_id, inputs):
+        """Get the key of a SAM config in the SAM object pool.
+
+        Parameters
+        ----------
+        config_id : str
+            SAM config id from the project points.
+        inputs : dict
+            SAM config inputs from the project points.
+
+        Returns
+        -------
+        key : tuple
+            (class, config id, serialized config inputs)
+        """
+        def _default(obj):
+            return obj.tolist() if hasattr(obj, 'tolist') else str(obj)
+
+        return (cls, config_id,
+                json.dumps(dict(inputs), sort_keys=True, default=_default))
+
+    @classmethod
+    def _get_sim(cls, key):
+        """Get a SAM object for re-use from the SAM object pool.
+
+        Parameters
+        ----------
+        key : tuple
+            SAM object key from _get_sim_key().
+
+        Returns
+        -------
+        sim : Generation | None
+            SAM object that was last run with the same SAM config, None if
+            there is no such SAM object in the pool.
+        """
+        sim = Generation._SIM_POOL.get(key, None)
+        if sim is not None:
+            Generation._SIM_POOL.move_to_end(key)
+
+        return sim
+
+    @classmethod
+    def _add_sim(cls, key, sim):
+        """Add a SAM object to the SAM object pool and evict the least
+        recently used SAM objects beyond the pool size.
+
+        Parameters
+        ----------
+        key : tuple
+            SAM object key from _get_sim_key().
+        sim : Generation
+            SAM object to add to the pool.
+        """
+        Generation._SIM_POOL[key] = sim
+        while len(Generation._SIM_POOL) > cls.SIM_POOL_SIZE:
+            Generation._SIM_POOL.popitem(last=False)
+
+    @classmethod
+    def _run_resources(cls, points_control, resources,
+                       output_request=('cf_mean',), drop_leap=False):
+        """Execute SAM generation for all sites in a resource object.
+
+        Parameters
+        ----------
+        points_control : config.PointsControl
+            PointsControl instance containing project points site and SAM
+            config info.
+        resources : rex.sam_resource.SAMResource
+            SAM resource object for the points control split.
+        output_request : list | tuple
+            Outputs to retrieve from SAM.
+        drop_leap : bool
+            Drops February 29th from the resource data. If False, December
+            31st is dropped from leap years.
+
+        Returns
+        -------
+        out : dict
+            Nested dictionaries where the top level key is the site index,
+            the second level key is the variable name, second level value is
+            the output variable value.
+        """
+        # initialize output dictionary
+        out = {}
+
+        # SAM objects are re-used for all sites that share a SAM config so
+        # that the static inputs are only assigned once per config
+        sim_keys = {}
+
+        # pre-process the resource arrays for all sites at once if possible
+        res_arrays = None
+        if cls.RESOURCE_ARRAYS:
+            site_resources, metas, res_arrays = cls._get_split_resources(
+                points_control, resources, drop_leap=drop_leap)
+            res_iter = zip(site_resources, metas)
+        else:
+            res_iter = resources
+
+        for i, (res_df, meta) in enumerate(res_iter):
 
             # drop the leap day
-            if drop_leap:
+            if drop_leap and res_arrays is None:
                 res_df = cls.drop_leap(res_df)
 
             # get SAM inputs from project_points based on the current site
             site = res_df.name
-            _, inputs = points_control.project_points[site]
+            config_id, inputs = points_control.project_points[site]
+
+            if res_arrays is None:
+                res_outs, out_req_cleaned = cls._get_res(res_df,
+                                                         output_request)
+            else:
+                res_outs, out_req_cleaned = cls._get_res(res_arrays,
+                                                         output_request,
+                                                         index=i)
 
-            res_outs, out_req_cleaned = cls._get_res(res_df, output_request)
             res_mean, out_req_cleaned = cls._get_res_mean(resources, site,
                                                           out_req_cleaned)
 
             # iterate through requested sites.
-            sim = cls(resource=res_df, meta=meta, parameters=inputs,
-                      output_request=out_req_cleaned)
+            if config_id not in sim_keys:
+                sim_keys[config_id] = cls._get_sim_key(config_id, inputs)
+
+            sim = cls._get_sim(sim_keys[config_id])
+            if sim is None:
+                sim = cls(resource=res_df, meta=meta, parameters=inputs,
+                          output_request=out_req_cleaned)
+                cls._add_sim(sim_keys[config_id], sim)
+            else:
+                sim.set_site(resource=res_df, meta=meta, parameters=inputs,
+                             output_request=out_req_cleaned)
+
             sim._gen_exec()
 
             # collect outputs to dictout
@@ -347,11 +838,93 @@ class Generation(RevPySam, ABC):
 
         return out
 
+    @classmethod
+    def reV_run(cls, points_control, res_file, output_request=('cf_mean',),
+                downscale=None, drop_leap=False, prefetch_chunk=None):
+        """Execute SAM generation based on a reV points control instance.
+
+        Parameters
+        ----------
+        points_control : config.PointsControl
+            PointsControl instance containing project points site and SAM
+            config info.
+        res_file : str
+            Resource file with full path.
+        output_request : list | tuple
+            Outputs to retrieve from SAM.
+        downscale : NoneType | str
+            Option for NSRDB resource downscaling to higher temporal
+            resolution. Expects a string in the Pandas frequency format,
+            e.g. '5min'.
+        drop_leap : bool
+            Drops February 29th from the resource data. If False, December
+            31st is dropped from leap years.
+        prefetch_chunk : int | None
+            Site chunk size of the resource file. If not None, the split is
+            run in sub-splits aligned with the resource chunks and the
+            resource for the next sub-split is read in a background thread
+            while SAM runs on the current one. None reads the resource for
+            the full split before running SAM.
+
+        Returns
+        -------
+        out : dict
+            Nested dictionaries where the top level key is the site index,
+            the second level key is the variable name, second level value is
+            the output variable value.
+        """
+        res_kwargs = {'output_request': output_request,
+                      'downscale': downscale}
+        if prefetch_chunk is None:
+            resources = cls._get_resources(points_control, res_file,
+                                           **res_kwargs)
+            return cls._run_resources(points_control, resources,
+                                      output_request=output_request,
+                                      drop_leap=drop_leap)
+
+        sub_pcs = cls._chunk_points_control(points_control, prefetch_chunk)
+        logger.debug('Running {} in {} resource chunks with prefetching'
+                     .format(points_control, len(sub_pcs)))
+
+        out = {}
+        with ThreadPoolExecutor(max_workers=1) as exe:
+            future = exe.submit(cls._get_resources, sub_pcs[0], res_file,
+                                **res_kwargs)
+            for i, sub_pc in enumerate(sub_pcs):
+                resources = future.result()
+                if i + 1 < len(sub_pcs):
+                    future = exe.submit(cls._get_resources, sub_pcs[i + 1],
+                                        res_file, **res_kwargs)
+
+                out.update(cls._run_resources(sub_pc, resources,
+                                              output_request=output_request,
+                                              drop_leap=drop_leap))
+
+        return out
+
 
 class Solar(Generation, ABC):
     """Base Class for Solar generation from SAM
     """
 
+    RESOURCE_ARRAYS = True
+
+    # map resource data names to SAM required data names
+    SAM_VAR_MAP = {'dni': 'dn',
+                   'dhi': 'df',
+                   'ghi': 'gh',
+                   'clearsky_dni': 'dn',
+                   'clearsky_dhi': 'df',
+                   'clearsky_ghi': 'gh',
+                   'wind_speed': 'wspd',
+                   'air_temperature': 'tdry',
+                   'dew_point': 'tdew',
+                   'surface_pressure': 'pres',
+                   }
+
+    # SAM irradiance variables that are truncated to zero
+    IRRAD_VARS = ('dn', 'df', 'gh')
+
     def __init__(self, resource=None, meta=None, parameters=None,
                  output_request=None, drop_leap=False):
         """Initialize a SAM solar object.
@@ -373,25 +946,82 @@ class Solar(Generation, ABC):
             31st is dropped from leap years.
         """
 
-        # drop the leap day
-        if drop_leap:
-            resource = self.drop_leap(resource)
+        super().__init__(resource=resource, meta=meta, parameters=parameters,
+                         output_request=output_request, drop_leap=drop_leap)
 
+    def _parse_site_inputs(self, parameters, meta):
+        """Check the SAM inputs and meta data for a single solar site.
+
+        Parameters
+        ----------
+        parameters : dict
+            SAM model input parameters.
+        meta : pd.DataFrame
+            1D table with resource meta data.
+
+        Returns
+        -------
+        parameters : dict
+            SAM model input parameters with tilt set to latitude if
+            requested.
+        meta : pd.DataFrame
+            1D table with resource meta data with timezone.
+        """
         parameters = self.set_latitude_tilt_az(parameters, meta)
         meta = self.tz_check(parameters, meta)
 
-        # don't pass resource to base class, set in set_nsrdb instead.
-        super().__init__(meta, parameters, output_request)
+        return parameters, meta
 
-        # Set the site number using resource
-        if isinstance(resource, pd.DataFrame):
-            self._site = resource.name
-        else:
-            self._site = None
+    def set_resource(self, resource):
+        """Set the NSRDB resource data arrays for a single site.
 
-        if resource is not None and meta is not None:
+        Parameters
+        ----------
+        resource : pd.DataFrame | SiteResource
+            2D table with resource data. Available columns must have var_list.
+            Can also be a SiteResource object with pre-processed data.
+        """
+        if isinstance(resource, SiteResource):
+            self.time_interval = resource.time_interval
+            self._set_solar_resource_data(resource.data)
+        else:
             self.set_nsrdb(resource)
 
+    @classmethod
+    def _get_sam_res_arrays(cls, arrays, shifts):
+        """Get the SAM solar resource arrays for all sites in a split.
+
+        Parameters
+        ----------
+        arrays : dict
+            Dictionary of resource dataset names and (time, sites) arrays
+            that have been truncated to a multiple of 8760 (UTC).
+        shifts : np.ndarray
+            Number of time steps to roll each site's data to local time.
+
+        Returns
+        -------
+        sam_arrays : dict
+            Dictionary of SAM resource variable names and (sites, time)
+            arrays in local time.
+        """
+        sam_arrays = {}
+        for var, arr in arrays.items():
+            var = cls.SAM_VAR_MAP.get(var, var)
+            arr = cls._roll_res_arrays(arr, shifts)
+
+            if var in cls.IRRAD_VARS:
+                arr_min = np.min(arr)
+                if arr_min < 0:
+                    warn('Solar irradiance variable "{}" has a minimum '
+                         'value of {}. Truncating to zero.'
+                         .format(var, arr_min), SAMInputWarning)
+                    arr[arr < 0] = 0
+
+            sam_arrays[var] = arr
+
+        return sam_arrays
+
     def set_latitude_tilt_az(self, parameters, meta):
         """Check if tilt is specified as latitude and set tilt=lat, az=180 or 0
 
@@ -449,22 +1079,7 @@ class Solar(Generation, ABC):
         time_index = resource.index
         self.time_interval = self.get_time_interval(resource.index.values)
 
-        # map resource data names to SAM required data names
-        var_map = {'dni': 'dn',
-                   'dhi': 'df',
-                   'ghi': 'gh',
-                   'clearsky_dni': 'dn',
-                   'clearsky_dhi': 'df',
-                   'clearsky_ghi': 'gh',
-                   'wind_speed': 'wspd',
-                   'air_temperature': 'tdry',
-                   'dew_point': 'tdew',
-                   'surface_pressure': 'pres',
-                   }
-
-        irrad_vars = ['dn', 'df', 'gh']
-
-        resource = resource.rename(mapper=var_map, axis='columns')
+        resource = resource.rename(mapper=self.SAM_VAR_MAP, axis='columns')
         resource = {k: np.array(v) for (k, v) in
                     resource.to_dict(orient='list').items()}
 
@@ -477,7 +1092,7 @@ class Solar(Generation, ABC):
                     self.ensure_res_len(arr),
                     int(self._meta['timezone'] * self.time_interval))
 
-                if var in irrad_vars:
+                if var in self.IRRAD_VARS:
                     if np.min(arr) < 0:
                         warn('Solar irradiance variable "{}" has a minimum '
                              'value of {}. Truncating to zero.'
@@ -486,6 +1101,24 @@ class Solar(Generation, ABC):
 
                 resource[var] = arr.tolist()
 
+        ti_8760 = self.ensure_res_len(time_index)
+        resource['minute'] = ti_8760.minute
+        resource['hour'] = ti_8760.hour
+        resource['year'] = ti_8760.year
+        resource['month'] = ti_8760.month
+        resource['day'] = ti_8760.day
+
+        self._set_solar_resource_data(resource)
+
+    def _set_solar_resource_data(self, resource):
+        """Add the site meta data to the solar resource data and set in SAM.
+
+        Parameters
+        ----------
+        resource : dict
+            Dictionary of SAM solar resource and time variable names and
+            single-site data in local time.
+        """
         resource['lat'] = self.meta['latitude']
         resource['lon'] = self.meta['longitude']
         resource['tz'] = self.meta['timezone']
@@ -495,13 +1128,6 @@ class Solar(Generation, ABC):
         else:
             resource['elev'] = 0.0
 
-        ti_8760 = self.ensure_res_len(time_index)
-        resource['minute'] = ti_8760.minute
-        resource['hour'] = ti_8760.hour
-        resource['year'] = ti_8760.year
-        resource['month'] = ti_8760.month
-        resource['day'] = ti_8760.day
-
         self['solar_resource_data'] = resource
 
 
@@ -678,6 +1304,10 @@ class TcsMoltenSalt(Solar):
 
 class SolarThermal(Solar, ABC):
     """ Base class for solar thermal """
+
+    # Solar thermal models require a resource data file
+    RESOURCE_ARRAYS = False
+
     def __init__(self, resource=None, meta=None, parameters=None,
                  output_request=None, drop_leap=False):
         """Initialize a SAM solar thermal object
@@ -984,6 +1614,8 @@ class WindPower(Generation):
     MODULE = 'windpower'
     PYSAM = PySamWindPower
 
+    RESOURCE_ARRAYS = True
+
     def __init__(self, resource=None, meta=None, parameters=None,
                  output_request=None, drop_leap=False):
         """Initialize a SAM wind object.
@@ -1005,24 +1637,58 @@ class WindPower(Generation):
             31st is dropped from leap years.
         """
 
-        # drop the leap day
-        if drop_leap:
-            resource = self.drop_leap(resource)
-
-        meta = self.tz_check(parameters, meta)
+        super().__init__(resource=resource, meta=meta, parameters=parameters,
+                         output_request=output_request, drop_leap=drop_leap)
 
-        # don't pass resource to base class, set in set_wtk instead.
-        super().__init__(meta, parameters, output_request)
+    def set_resource(self, resource):
+        """Set the WTK resource data arrays for a single site.
 
-        # Set the site number using resource
-        if isinstance(resource, pd.DataFrame):
-            self._site = resource.name
+        Parameters
+        ----------
+        resource : pd.DataFrame | SiteResource
+            2D table with resource data. Available columns must have var_list.
+            Can also be a SiteResource object with pre-processed data.
+        """
+        if isinstance(resource, SiteResource):
+            self.time_interval = resource.time_interval
+            data_dict = resource.data
+            data_dict['fields'] = [1, 2, 3, 4]
+            data_dict['heights'] = \
+                4 * [self.parameters['wind_turbine_hub_ht']]
+            self['wind_resource_data'] = data_dict
         else:
-            self._site = None
-
-        if resource is not None and meta is not None:
             self.set_wtk(resource)
 
+    @classmethod
+    def _get_sam_res_arrays(cls, arrays, shifts):
+        """Get the SAM wind resource arrays for all sites in a split.
+
+        Parameters
+        ----------
+        arrays : dict
+            Dictionary of resource dataset names and (time, sites) arrays
+            that have been truncated to a multiple of 8760 (UTC).
+        shifts : np.ndarray
+            Number of time steps to roll each site's data to local time.
+
+        Returns
+        -------
+        sam_arrays : dict
+            Dictionary with the (sites, time, 4) "data" array in
+            [temperature, pres, speed, direction] order and the optional
+            (sites, time) "rh" array in local time.
+        """
+        var_list = ['temperature', 'pressure', 'windspeed', 'winddirection']
+        data = [arrays[var] if var in arrays
+                else np.zeros_like(arrays['windspeed']) for var in var_list]
+        data = np.stack(data, axis=2)
+
+        sam_arrays = {'data': cls._roll_res_arrays(data, shifts)}
+        if 'rh' in arrays:
+            sam_arrays['rh'] = cls._roll_res_arrays(arrays['rh'], shifts)
+
+        return sam_arrays
+
     def set_wtk(self, resource):
         """Set WTK resource data arrays.
 
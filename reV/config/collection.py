@@ -79,6 +79,20 @@ class CollectionConfig(AnalysisConfig):
         self._purge = self.get('purge_chunks', self._purge)
         return self._purge
 
+    @property
+    def max_workers(self):
+        """Get the number of reader processes for collection from the
+        execution_control block.
+
+        Returns
+        -------
+        max_workers : int | None
+            Number of reader processes. 1 collects one dataset at a time in
+            serial (default), None uses all available cores and collects all
+            datasets in one pass over the source files.
+        """
+        return self.execution_control.get('max_workers', 1)
+
     @property
     def dsets(self):
         """Get dset names to collect.
@@ -40,6 +40,30 @@ class MultiYearConfig(AnalysisConfig):
         my_file = os.path.join(self.dirout, self.name + ".h5")
         return my_file
 
+    @property
+    def max_workers(self):
+        """
+        Returns
+        -------
+        max_workers : int | None
+            Number of workers to compute the multi-year statistics with,
+            from the execution_control block. 1 runs in serial (default),
+            None uses all available cores.
+        """
+        return self.execution_control.get('max_workers', 1)
+
+    @property
+    def mem_util_lim(self):
+        """
+        Returns
+        -------
+        mem_util_lim : float
+            Memory utilization limit (fractional) for the multi-year
+            statistics, from "memory_utilization_limit" in the
+            execution_control block. Default is 0.7.
+        """
+        return self.execution_control.get('memory_utilization_limit', 0.7)
+
     @property
     def group_names(self):
         """
@@ -91,6 +91,25 @@ class PointsControl:
         self._i += 1
         return next_pc
 
+    def __getitem__(self, site):
+        """Get the SAM config ID and dictionary for the requested site.
+
+        Parameters
+        ----------
+        site : int | str
+            Site number of interest.
+
+        Returns
+        -------
+        config_id : str
+            Configuration ID (variable name) specified in the sam_generation
+            config section.
+        config : dict
+            Actual SAM input values in a single level dictionary with variable
+            names (keys) and values.
+        """
+        return self.project_points[site]
+
     def __repr__(self):
         msg = ("{} for sites {} through {}"
                .format(self.__class__.__name__, self.sites[0], self.sites[-1]))
@@ -146,6 +165,19 @@ class PointsControl:
         """
         return self._project_points.sites
 
+    @property
+    def sites_by_config(self):
+        """Get the project points sites for this instance grouped by SAM
+        configuration ID.
+
+        Returns
+        -------
+        sites_by_config : dict
+            Dictionary mapping SAM configuration IDs (keys) to sorted arrays
+            of the site gids that use each configuration (values).
+        """
+        return self._project_points.sites_by_config
+
     @property
     def split_range(self):
         """Get the current split range property.
@@ -242,6 +274,10 @@ class ProjectPoints:
 
         # set protected attributes
         self._df = self._parse_points(points, res_file=res_file)
+        self._gids = None
+        self._sites = None
+        self._config_lookup = None
+        self._sites_by_config = None
         self._sam_config_obj = self._parse_sam_config(sam_config)
         self._check_points_config_mapping()
         self._tech = str(tech)
@@ -266,9 +302,8 @@ class ProjectPoints:
             names (keys) and values.
         """
 
-        site_bool = (self.df['gid'] == site)
         try:
-            config_id = self.df.loc[site_bool, 'config'].values[0]
+            config_id = self.config_lookup[site]
         except KeyError:
             raise KeyError('Site {} not found in this instance of '
                            'ProjectPoints. Available sites include: {}'
@@ -282,7 +317,7 @@ class ProjectPoints:
 
     def __len__(self):
         """Length of this object is the number of sites."""
-        return len(self.sites)
+        return len(self.df)
 
     @staticmethod
     def _parse_points(points, res_file=None):
@@ -512,6 +547,7 @@ class ProjectPoints:
         if len(df_configs) == 1:
             if df_configs[0] is None:
                 self._df['config'] = list(sam_configs.values())[0]
+                self._reset_site_index()
 
                 df_configs = self.df['config'].unique()
 
@@ -539,6 +575,21 @@ class ProjectPoints:
             logger.error(msg)
             raise ConfigError(msg)
 
+    @property
+    def gids(self):
+        """Get the sites belonging to this instance of ProjectPoints as an
+        array. This is cached and only rebuilt when the points change.
+
+        Returns
+        -------
+        _gids : np.ndarray
+            1D array of site gids belonging to this instance of ProjectPoints.
+        """
+        if self._gids is None:
+            self._gids = self.df['gid'].values
+
+        return self._gids
+
     @property
     def sites(self):
         """Get the sites belonging to this instance of ProjectPoints.
@@ -549,7 +600,95 @@ class ProjectPoints:
             List of sites belonging to this instance of ProjectPoints. The type
             is list if possible. Will be a slice only if slice stop is None.
         """
-        return self.df['gid'].values.tolist()
+        if self._sites is None:
+            self._sites = self.gids.tolist()
+
+        return self._sites
+
+    @property
+    def config_lookup(self):
+        """Get the site gid to SAM config ID lookup. This is cached and only
+        rebuilt when the points change.
+
+        Returns
+        -------
+        _config_lookup : dict
+            Dictionary mapping site gids (keys) to SAM configuration IDs
+            (values).
+        """
+        if self._config_lookup is None:
+            self._config_lookup = dict(zip(self.sites,
+                                           self.df['config'].values))
+
+        return self._config_lookup
+
+    @property
+    def sites_by_config(self):
+        """Get the sites belonging to this instance of ProjectPoints grouped
+        by SAM configuration ID. This is cached and only rebuilt when the
+        points change.
+
+        Returns
+        -------
+        _sites_by_config : dict
+            Dictionary mapping SAM configuration IDs (keys) to sorted arrays
+            of the site gids that use each configuration (values).
+        """
+        if self._sites_by_config is None:
+            configs = self.df['config'].values
+            self._sites_by_config = {}
+            for config in pd.unique(configs):
+                mask = configs == config
+                self._sites_by_config[config] = self.gids[mask]
+
+        return self._sites_by_config
+
+    def _reset_site_index(self):
+        """Clear the cached site gids and config lookups after the points df
+        has changed."""
+        self._gids = None
+        self._sites = None
+        self._config_lookup = None
+        self._sites_by_config = None
+
+    def index(self, gid):
+        """Get the index location (iloc not loc) for site gid(s) in the
+        project points site list.
+
+        Parameters
+        ----------
+        gid : int | list | np.ndarray
+            Resource-native site gid(s) to find in the project points.
+
+        Returns
+        -------
+        ind : int | np.ndarray
+            Index location(s) of gid(s) in the project points sites list.
+            Output is an integer if gid is a scalar, otherwise an array of
+            indices corresponding to the input gids.
+        """
+        gids = self.gids
+        scalar = np.isscalar(gid)
+        gid = np.atleast_1d(gid)
+
+        # project points gids are always sorted (see _parse_points)
+        ind = np.searchsorted(gids, gid)
+        missing = ind >= len(gids)
+        ind[missing] = 0
+        if len(gids):
+            missing |= gids[ind] != gid
+
+        if missing.any():
+            msg = ('Site(s) {} not found in this instance of '
+                   'ProjectPoints. Available sites include: {}'
+                   .format(gid[missing].tolist(), self.sites))
+            logger.error(msg)
+            raise KeyError(msg)
+
+        if scalar:
+            ind = int(ind[0])
+
+        return ind
 
     @property
     def sites_as_slice(self):
@@ -684,6 +823,7 @@ class ProjectPoints:
         df2_cols = [c for c in df2.columns if c not in self._df or c == key]
         self._df = pd.merge(self._df, df2[df2_cols], how='left', left_on='gid',
                             right_on=key, copy=False, validate='1:1')
+        self._reset_site_index()
 
     def get_sites_from_config(self, config):
         """Get a site list that corresponds to a config key.
@@ -700,7 +840,7 @@ class ProjectPoints:
             the configuration ID is not recognized, an empty list is returned.
         """
 
-        sites = self.df.loc[(self.df['config'] == config), 'gid'].values
+        sites = self.sites_by_config.get(config, [])
         return list(sites)
 
     @classmethod
@@ -138,3 +138,10 @@ class RepProfilesConfig(AnalysisConfig):
                                       'n_profiles')
 
         return aggregate
+
+    @property
+    def sweep(self):
+        """Flag to compute the meanoid and errors of all regions in a single
+        chunked pass over the cf dataset instead of reading the profiles of
+        every region separately."""
+        return bool(self.get('sweep', False))
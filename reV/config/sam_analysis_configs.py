@@ -205,6 +205,31 @@ class GenConfig(SAMAnalysisConfig):
             self._downscale = self.get('downscale', self._downscale)
         return self._downscale
 
+    @property
+    def resume(self):
+        """Get the flag to resume a previous generation run.
+
+        Returns
+        -------
+        resume : bool
+            Flag to only run the sites that are missing from or failed in
+            existing outputs (as recorded in the output manifests).
+            Default is False.
+        """
+        return bool(self.get('resume', False))
+
+    @property
+    def async_flush(self):
+        """Get the flag to write output chunks in a background thread.
+
+        Returns
+        -------
+        async_flush : bool
+            Flag to hand full output chunks to a background writer thread
+            while the next chunk is computed. Default is False.
+        """
+        return bool(self.get('async_flush', False))
+
     @property
     def resource_file(self):
         """
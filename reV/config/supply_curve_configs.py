@@ -184,6 +184,11 @@ class SupplyCurveAggregationConfig(AnalysisConfig):
         """Get the friction dataset name in friction_fpath."""
         return self.get('friction_dset', None)
 
+    @property
+    def excl_cache_dir(self):
+        """Get the directory to cache the full-domain inclusion mask in."""
+        return self.get('excl_cache_dir', None)
+
     @property
     def check_excl_layers(self):
         """Get the check_excl_layers flag."""
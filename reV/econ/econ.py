@@ -124,6 +124,12 @@ class Econ(Gen):
         self._sam_module = None
         self._sam_obj_default = None
         self.mem_util_lim = mem_util_lim
+        self._async_flush = False
+        self._writer = None
+        self._manifest = None
+        self._failed_sites = set()
+        self._failures = []
+        self._todo = None
 
         self._output_request = self._parse_output_request(output_request)
         self._site_data = self._parse_site_data(site_data)
@@ -415,8 +421,8 @@ class Econ(Gen):
         sites_per_worker : int
             Number of sites to run in series on a worker.
         pool_size : int
-            Number of futures to submit to a single process pool for
-            parallel futures.
+            Maximum number of futures in flight on the persistent process
+            pool (submitted or waiting to be set to the output in order).
         timeout : int | float
             Number of seconds to wait for parallel run iteration to complete
             before returning zeros. Default is 1800 seconds.
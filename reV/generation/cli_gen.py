@@ -103,6 +103,8 @@ def from_config(ctx, config_file, verbose):
     ctx.obj['LOGDIR'] = config.logdir
     ctx.obj['OUTPUT_REQUEST'] = config.output_request
     ctx.obj['TIMEOUT'] = config.timeout
+    ctx.obj['RESUME'] = config.resume
+    ctx.obj['ASYNC_FLUSH'] = config.async_flush
     ctx.obj['SITES_PER_WORKER'] = config.execution_control.sites_per_worker
     ctx.obj['MAX_WORKERS'] = config.execution_control.max_workers
     ctx.obj['MEM_UTIL_LIM'] = \
@@ -174,6 +176,8 @@ def submit_from_config(ctx, name, year, config, i, verbose=False):
                        max_workers=config.execution_control.max_workers,
                        timeout=config.timeout,
                        points_range=None,
+                       resume=config.resume,
+                       async_flush=config.async_flush,
                        verbose=verbose)
 
     elif config.execution_control.option in ('eagle', 'slurm'):
@@ -374,10 +378,18 @@ def _parse_points(ctx):
               'Default is 1800 seconds.')
 @click.option('--points_range', '-pr', default=None, type=INTLIST,
               help='Optional range list to run a subset of sites.')
+@click.option('--resume', '-r', is_flag=True,
+              help='Flag to resume a previous run into the existing output '
+              'file. Only sites that are missing or failed (as recorded in '
+              'the output manifest) are run.')
+@click.option('--async_flush', '-af', is_flag=True,
+              help='Flag to write output chunks to disk in a background '
+              'thread while the next chunk is computed.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging.')
 @click.pass_context
-def local(ctx, max_workers, timeout, points_range, verbose):
+def local(ctx, max_workers, timeout, points_range, resume, async_flush,
+          verbose):
     """Run generation on local worker(s)."""
 
     name = ctx.obj['NAME']
@@ -426,7 +438,9 @@ def local(ctx, max_workers, timeout, points_range, verbose):
                 fout=fout,
                 dirout=dirout,
                 mem_util_lim=mem_util_lim,
-                timeout=timeout)
+                timeout=timeout,
+                resume=resume,
+                async_flush=async_flush)
 
     tmp_str = ' with points range {}'.format(points_range)
     runtime = (time.time() - t0) / 60
@@ -534,7 +548,8 @@ def get_node_cmd(name, tech, sam_files, res_file, points=slice(0, 100),
                  fout='reV.h5', dirout='./out/gen_out',
                  logdir='./out/log_gen', output_request=('cf_mean',),
                  mem_util_lim=0.4, timeout=1800, curtailment=None,
-                 downscale=None, verbose=False):
+                 downscale=None, resume=False, async_flush=False,
+                 verbose=False):
     """Make a reV geneneration direct-local CLI call string.
 
     Parameters
@@ -580,6 +595,12 @@ def get_node_cmd(name, tech, sam_files, res_file, points=slice(0, 100),
         Option for NSRDB resource downscaling to higher temporal
         resolution. Expects a string in the Pandas frequency format,
         e.g. '5min'.
+    resume : bool
+        Flag to resume a previous run into the existing output file.
+        Default is False.
+    async_flush : bool
+        Flag to write output chunks to disk in a background thread.
+        Default is False.
     verbose : bool
         Flag to turn on debug logging. Default is False.
 
@@ -629,9 +650,13 @@ def get_node_cmd(name, tech, sam_files, res_file, points=slice(0, 100),
     arg_loc = ('-mw {max_workers} '
                '-to {timeout} '
                '-pr {points_range} '
+               '{r}'
+               '{af}'
                '{v}'.format(max_workers=SLURM.s(max_workers),
                             timeout=SLURM.s(timeout),
                             points_range=SLURM.s(points_range),
+                            r='-r ' if resume else '',
+                            af='-af ' if async_flush else '',
                             v='-v' if verbose else ''))
 
     # Python command that will be executed on a node
@@ -683,6 +708,8 @@ def slurm(ctx, nodes, alloc, memory, walltime, feature, conda_env, module,
     max_workers = ctx.obj['MAX_WORKERS']
     mem_util_lim = ctx.obj['MEM_UTIL_LIM']
     timeout = ctx.obj['TIMEOUT']
+    resume = ctx.obj.get('RESUME', False)
+    async_flush = ctx.obj.get('ASYNC_FLUSH', False)
     curtailment = ctx.obj['CURTAILMENT']
     downscale = ctx.obj['DOWNSCALE']
     verbose = any([verbose, ctx.obj['VERBOSE']])
@@ -706,7 +733,8 @@ def slurm(ctx, nodes, alloc, memory, walltime, feature, conda_env, module,
                            output_request=output_request,
                            mem_util_lim=mem_util_lim, timeout=timeout,
                            curtailment=curtailment,
-                           downscale=downscale, verbose=verbose)
+                           downscale=downscale, resume=resume,
+                           async_flush=async_flush, verbose=verbose)
 
         status = Status.retrieve_job_status(dirout, 'generation', node_name)
         if status == 'successful':
@@ -2,13 +2,21 @@
 """
 reV generation module.
 """
-from concurrent.futures import TimeoutError
+from concurrent.futures import FIRST_COMPLETED, wait
+import hashlib
+import itertools
+import json
 import logging
+import multiprocessing
 import numpy as np
 import os
+import pandas as pd
 import pprint
 import psutil
 import sys
+import time
+from queue import Queue
+from threading import Semaphore, Thread
 from warnings import warn
 
 from reV.config.project_points import ProjectPoints, PointsControl
@@ -27,6 +35,328 @@ from rex.utilities.utilities import check_res_file
 logger = logging.getLogger(__name__)
 
 
+class FlushWriter:
+    """Background thread that writes flushed output buffers to disk so that
+    computation can continue while the previous output chunk is written.
+
+    At most max_pending buffers can be handed to the writer at a time. A new
+    submission blocks until a previous buffer has been written (back
+    pressure), so the number of output buffers held in memory is bounded by
+    max_pending + 1 (the buffer being filled).
+    """
+
+    def __init__(self, fun, max_pending=1):
+        """
+        Parameters
+        ----------
+        fun : callable
+            Function that writes one output buffer to disk. Called with the
+            args passed to FlushWriter.submit().
+        max_pending : int
+            Maximum number of buffers that are submitted but not yet written.
+        """
+        self._fun = fun
+        self._slots = Semaphore(max_pending)
+        self._queue = Queue()
+        self._error = None
+        self._thread = Thread(target=self._run, name='reV-flush-writer',
+                              daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Write submitted buffers until the stop signal (None) is received.
+        """
+        while True:
+            args = self._queue.get()
+            if args is None:
+                break
+
+            try:
+                if self._error is None:
+                    self._fun(*args)
+            except Exception as e:
+                logger.exception('Background flush failed!')
+                self._error = e
+            finally:
+                self._slots.release()
+
+    def _check_error(self):
+        """Raise an error in the calling thread if a write failed."""
+        if self._error is not None:
+            msg = ('Background flush failed with: {}'.format(self._error))
+            logger.error(msg)
+            raise ExecutionError(msg) from self._error
+
+    def submit(self, *args):
+        """Hand an output buffer to the writer thread. Blocks while
+        max_pending buffers are already waiting to be written.
+
+        Parameters
+        ----------
+        args : list
+            Positional arguments to the write function. The output buffer in
+            args must not be modified after submission.
+        """
+        self._slots.acquire()
+        self._check_error()
+        self._queue.put(args)
+
+    def close(self):
+        """Wait for all submitted buffers to be written and stop the writer
+        thread."""
+        self._queue.put(None)
+        self._thread.join()
+        self._check_error()
+
+
+class RunManifest:
+    """Sidecar manifest that records the progress of a generation run so
+    that an interrupted or partially failed run can be resumed.
+
+    The manifest is a small json file next to the output h5 file. It holds
+    the completed ranges of global site indices (ranges that were written to
+    the output file), the gids of sites that were written as zeros
+    because they failed, and a hash of the site gids of the run.
+    """
+
+    def __init__(self, fpath, n_sites, sites_hash=None, completed=None,
+                 failed=None):
+        """
+        Parameters
+        ----------
+        fpath : str
+            Manifest .json file path.
+        n_sites : int
+            Total number of sites in the run (length of the project points).
+        sites_hash : str | None
+            Hash of the site gids in the run (see RunManifest.hash_sites).
+            None will skip the site gid check when resuming.
+        completed : list | None
+            List of [start, stop) global site index ranges that have been
+            written to the output file.
+        failed : list | set | None
+            Site gids that failed and were written as zeros.
+        """
+        self._fpath = fpath
+        self._n_sites = int(n_sites)
+        self._sites_hash = sites_hash
+        self._completed = []
+        self._failed = set()
+
+        if completed:
+            self.add_completed(completed)
+
+        if failed:
+            self._failed = {int(gid) for gid in failed}
+
+    def __repr__(self):
+        msg = ('{} for {} sites ({} completed, {} failed)'
+               .format(self.__class__.__name__, self.n_sites,
+                       self.n_completed, len(self.failed)))
+        return msg
+
+    @staticmethod
+    def get_fpath(h5_fpath):
+        """Get the manifest file path for an output h5 file.
+
+        Parameters
+        ----------
+        h5_fpath : str
+            Output .h5 file path.
+
+        Returns
+        -------
+        fpath : str
+            Manifest .json file path next to the output file.
+        """
+        return os.path.splitext(h5_fpath)[0] + '_manifest.json'
+
+    @staticmethod
+    def hash_sites(sites):
+        """Get a hash of the ordered site gids of a run.
+
+        Parameters
+        ----------
+        sites : list | np.ndarray
+            Gids of all sites in the run (project points site list).
+
+        Returns
+        -------
+        sites_hash : str
+            md5 hex digest of the site gids.
+        """
+        sites = np.asarray(sites, dtype=np.int64)
+        return hashlib.md5(sites.tobytes()).hexdigest()
+
+    @classmethod
+    def load(cls, fpath):
+        """Load a manifest from disk.
+
+        Parameters
+        ----------
+        fpath : str
+            Manifest .json file path.
+
+        Returns
+        -------
+        manifest : RunManifest
+            Manifest with the progress recorded on disk.
+        """
+        with open(fpath, 'r') as f:
+            data = json.load(f)
+
+        return cls(fpath, data['n_sites'],
+                   sites_hash=data.get('sites_hash', None),
+                   completed=data['completed'], failed=data['failed'])
+
+    def save(self):
+        """Write the manifest to disk. The file is replaced atomically so
+        an interrupted save never leaves a corrupt manifest behind."""
+        data = {'n_sites': self.n_sites,
+                'sites_hash': self.sites_hash,
+                'completed': self.completed,
+                'failed': sorted(self.failed)}
+
+        fp_tmp = self._fpath + '.tmp'
+        with open(fp_tmp, 'w') as f:
+            json.dump(data, f)
+
+        os.replace(fp_tmp, self._fpath)
+
+    @property
+    def fpath(self):
+        """Get the manifest file path.
+
+        Returns
+        -------
+        fpath : str
+        """
+        return self._fpath
+
+    @property
+    def n_sites(self):
+        """Get the total number of sites in the run.
+
+        Returns
+        -------
+        n_sites : int
+        """
+        return self._n_sites
+
+    @property
+    def sites_hash(self):
+        """Get the hash of the site gids in the run.
+
+        Returns
+        -------
+        sites_hash : str | None
+        """
+        return self._sites_hash
+
+    @property
+    def completed(self):
+        """Get the sorted, merged [start, stop) global site index ranges that
+        have been written to the output file.
+
+        Returns
+        -------
+        completed : list
+        """
+        return [list(run) for run in self._completed]
+
+    @property
+    def n_completed(self):
+        """Get the number of sites that have been written to the output file.
+
+        Returns
+        -------
+        n_completed : int
+        """
+        return int(sum(stop - start for start, stop in self._completed))
+
+    @property
+    def failed(self):
+        """Get the gids of sites that failed and were written as zeros.
+
+        Returns
+        -------
+        failed : set
+        """
+        return self._failed
+
+    def add_completed(self, runs):
+        """Add [start, stop) global site index ranges to the completed ranges.
+
+        Parameters
+        ----------
+        runs : list
+            List of [start, stop) global site index ranges.
+        """
+        runs = sorted(self._completed + [tuple(int(i) for i in run)
+                                         for run in runs])
+        merged = []
+        for start, stop in runs:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+            else:
+                merged.append((start, stop))
+
+        self._completed = merged
+
+    def update(self, runs, written, failed):
+        """Record an output write and save the manifest to disk.
+
+        Parameters
+        ----------
+        runs : list
+            List of [start, stop) global site index ranges that were written.
+        written : list
+            Gids of all sites that were written.
+        failed : list
+            Gids of written sites that failed and were written as zeros.
+        """
+        self.add_completed(runs)
+        self._failed -= {int(gid) for gid in written}
+        self._failed |= {int(gid) for gid in failed}
+        self.save()
+
+    def get_todo(self, sites):
+        """Get a mask of sites that still need to be run.
+
+        Parameters
+        ----------
+        sites : list | np.ndarray
+            Gids of all sites in the run (project points site list).
+
+        Returns
+        -------
+        todo : np.ndarray
+            Boolean mask of sites that were not yet written or that failed.
+        """
+        if len(sites) != self.n_sites:
+            msg = ('Cannot resume from manifest "{}" which was made for {} '
+                   'sites with {} project points sites.'
+                   .format(self.fpath, self.n_sites, len(sites)))
+            logger.error(msg)
+            raise ExecutionError(msg)
+
+        if (self.sites_hash is not None
+                and self.hash_sites(sites) != self.sites_hash):
+            msg = ('Cannot resume from manifest "{}" which was made for '
+                   'different project points site gids.'.format(self.fpath))
+            logger.error(msg)
+            raise ExecutionError(msg)
+
+        todo = np.ones(self.n_sites, dtype=bool)
+        for start, stop in self._completed:
+            todo[start:stop] = False
+
+        if self.failed:
+            todo |= np.isin(sites, list(self.failed))
+
+        return todo
+
+
 class Gen:
     """Base class for reV generation."""
 
@@ -204,7 +534,8 @@ class Gen:
 
     def __init__(self, points_control, res_file, output_request=('cf_mean',),
                  fout=None, dirout='./gen_out', drop_leap=False,
-                 mem_util_lim=0.4, downscale=None):
+                 mem_util_lim=0.4, downscale=None, async_flush=False,
+                 resume=False):
         """
         Parameters
         ----------
@@ -230,6 +561,15 @@ class Gen:
             Option for NSRDB resource downscaling to higher temporal
             resolution. Expects a string in the Pandas frequency format,
             e.g. '5min'.
+        async_flush : bool
+            Flag to flush outputs to disk in a background writer thread while
+            the next output chunk is being computed. The in-memory outputs
+            are double buffered, so each buffer gets half of mem_util_lim.
+        resume : bool
+            Flag to resume a previous run into the existing output file
+            fout. Sites that were already written (as recorded in the
+            output's sidecar RunManifest) are not re-run, only missing and
+            failed sites are (see Gen.resume_points_control).
         """
 
         self._points_control = points_control
@@ -245,6 +585,12 @@ class Gen:
         self._sam_module = self.OPTIONS[self.tech]
         self._drop_leap = drop_leap
         self.mem_util_lim = mem_util_lim
+        self._async_flush = async_flush
+        self._writer = None
+        self._manifest = None
+        self._failed_sites = set()
+        self._failures = []
+        self._todo = None
 
         self._run_attrs = {'points_control': str(points_control),
                            'res_file': res_file,
@@ -283,7 +629,9 @@ class Gen:
 
         # initialize output file
         self._init_fpath()
-        self._init_h5()
+        if not (resume and self._load_manifest()):
+            self._init_h5()
+            self._init_manifest()
 
     def _parse_output_request(self, req):
         """Set the output variables requested from generation.
@@ -509,6 +857,48 @@ class Gen:
                             configs=self.sam_metas, run_attrs=self.run_attrs,
                             mode=mode)
 
+    def _init_manifest(self):
+        """Initialize an empty run manifest next to the output file."""
+        if self._fpath is not None:
+            fp_manifest = RunManifest.get_fpath(self._fpath)
+            sites_hash = RunManifest.hash_sites(self.project_points.sites)
+            self._manifest = RunManifest(fp_manifest,
+                                         len(self.project_points),
+                                         sites_hash=sites_hash)
+            self._manifest.save()
+
+    def _load_manifest(self):
+        """Load the run manifest of an existing output file to resume from.
+
+        Returns
+        -------
+        loaded : bool
+            True if the output file and its manifest exist and were loaded.
+            False if there is nothing to resume from.
+        """
+        if self._fpath is None:
+            w = ('Cannot resume generation without an output file. '
+                 'Running all sites.')
+            logger.warning(w)
+            warn(w, OutputWarning)
+            return False
+
+        fp_manifest = RunManifest.get_fpath(self._fpath)
+        if not os.path.exists(self._fpath) or not os.path.exists(fp_manifest):
+            logger.info('Output file "{}" or its manifest "{}" does not '
+                        'exist. Nothing to resume, running all sites.'
+                        .format(self._fpath, fp_manifest))
+            return False
+
+        self._manifest = RunManifest.load(fp_manifest)
+        self._todo = self._manifest.get_todo(self.project_points.sites)
+        logger.info('Resuming generation into existing output file "{}" from '
+                    '{}. {} sites left to run.'
+                    .format(self._fpath, self._manifest,
+                            int(self._todo.sum())))
+
+        return True
+
     def _init_out_arrays(self, index_0=0):
         """Initialize output arrays based on the number of sites that can be
         stored in memory safely.
@@ -536,15 +926,33 @@ class Gen:
                             self.project_points.sites[self.out_chunk[1]],
                             self.out_chunk[0], self.out_chunk[1]))
 
+        self._out = self._get_out_arrays(self._out_n_sites)
+
+    def _get_out_arrays(self, n_sites):
+        """Get arrays of zeros for all output requests.
+
+        Parameters
+        ----------
+        n_sites : int
+            Number of sites (columns) in the output arrays.
+
+        Returns
+        -------
+        out : dict
+            Dictionary of output arrays keyed by output request.
+        """
+        out = {}
         for request in self.output_request:
             dtype = 'float32'
             if request in self.OUT_ATTRS:
                 dtype = self.OUT_ATTRS[request].get('dtype', 'float32')
 
-            shape = self._get_data_shape(request, self._out_n_sites)
+            shape = self._get_data_shape(request, n_sites)
 
             # initialize the output request as an array of zeros
-            self._out[request] = np.zeros(shape, dtype=dtype)
+            out[request] = np.zeros(shape, dtype=dtype)
+
+        return out
 
     def _check_sam_version_inputs(self):
         """Check the PySAM version and input keys. Fix where necessary."""
@@ -590,7 +998,9 @@ class Gen:
         if self._site_limit is None:
             tot_mem = psutil.virtual_memory().total / 1e6
             avail_mem = self.mem_util_lim * tot_mem
-            self._site_limit = int(np.floor(avail_mem / self.site_mem))
+            n_buffers = 2 if self._async_flush else 1
+            self._site_limit = int(np.floor(avail_mem / self.site_mem
+                                            / n_buffers))
             logger.info('Generation limited to storing {0} sites in memory '
                         '({1:.1f} GB total hardware, {2:.1f} GB available '
                         'with {3:.1f}% utilization).'
@@ -652,6 +1062,44 @@ class Gen:
         """
         return self._points_control.project_points
 
+    @property
+    def manifest(self):
+        """Get the sidecar run manifest of the output file.
+
+        Returns
+        -------
+        manifest : RunManifest | None
+            Run manifest recording the written and failed sites. None if
+            there is no output file.
+        """
+        return self._manifest
+
+    @property
+    def resume_points_control(self):
+        """Get the points control for the sites that are left to run when
+        resuming a previous run.
+
+        Returns
+        -------
+        pc : reV.config.project_points.PointsControl | None
+            Points control with only the missing and failed sites, split like
+            the full points control. Full points control if this is not a
+            resumed run. None if there are no sites left to run.
+        """
+        if self._todo is None:
+            return self.points_control
+
+        if not self._todo.any():
+            return None
+
+        pp = self.project_points
+        pp_todo = ProjectPoints(pp.df[self._todo], pp.sam_config_obj,
+                                pp.tech, curtailment=pp.curtailment)
+        pc = PointsControl(pp_todo,
+                           sites_per_split=self.points_control.sites_per_split)
+
+        return pc
+
     @property
     def sam_configs(self):
         """Get the sam config dictionary.
@@ -1092,22 +1540,11 @@ class Gen:
             result = self.unpack_futures(result)
 
         if isinstance(result, dict):
-
-            # iterate through dict where sites are keys and values are
-            # corresponding results
-            for site_gid, site_output in result.items():
-
-                # check that the sites are stored sequentially then add to
-                # the finished site list
-                if self._finished_sites:
-                    if int(site_gid) < np.max(self._finished_sites):
-                        raise Exception('Site results are non sequential!')
-
-                # unpack site output object
-                self.unpack_output(site_gid, site_output)
-
-                # add site gid to the finished list after outputs are unpacked
-                self._finished_sites.append(site_gid)
+            if result:
+                # unpack all site results at once, sites are dict keys
+                # and values are corresponding results
+                self.unpack_output(list(result.keys()),
+                                   list(result.values()))
 
         elif isinstance(result, type(None)):
             self._out.clear()
@@ -1138,49 +1575,104 @@ class Gen:
 
         return out
 
-    def unpack_output(self, site_gid, site_output):
-        """Unpack a SAM SiteOutput object to the output attribute.
+    def unpack_output(self, site_gids, site_outputs):
+        """Unpack SAM site output objects to the output attribute.
+
+        Results for all sites are placed into the output arrays with one
+        scatter write per output variable. Data is flushed to disk and the
+        output arrays are re-initialized if the sites extend beyond the
+        current output chunk.
 
         Parameters
         ----------
-        site_gid : int
-            Resource-native site gid (index).
-        site_output : dict
-            SAM site output object.
+        site_gids : int | list
+            Resource-native site gid(s) (index). Must be in sequential order.
+        site_outputs : dict | list
+            SAM site output object(s) corresponding to site_gids.
         """
 
-        # iterate through the site results
-        for var, value in site_output.items():
-            if var not in self._out:
-                raise KeyError('Tried to collect output variable "{}", but it '
-                               'was not yet initialized in the output '
-                               'dictionary.')
+        if np.isscalar(site_gids):
+            site_gids = [site_gids]
+            site_outputs = [site_outputs]
 
-            # get the index in the output array for the current site
-            i = self.site_index(site_gid, out_index=True)
+        gids = np.array(site_gids)
+
+        # check that the sites are stored sequentially
+        last = self._finished_sites[-1] if self._finished_sites else None
+        if (np.any(np.diff(gids) < 0)
+                or (last is not None and gids[0] < last)):
+            raise Exception('Site results are non sequential!')
+
+        global_index = self.site_index(gids)
+
+        i = 0
+        while i < len(gids):
+            out_index = global_index[i:] - self.out_chunk[0]
+            if out_index[0] < 0:
+                raise ValueError('Attempting to set output data for site with '
+                                 'gid {} to global site index {}, which was '
+                                 'already set based on the current output '
+                                 'index chunk of {}'
+                                 .format(gids[i], global_index[i],
+                                         self.out_chunk))
 
             # check to see if we have exceeded the current output chunk.
             # If so, flush data to disk and reset the output initialization
-            if i + 1 > self._out_n_sites:
+            if out_index[0] + 1 > self._out_n_sites:
                 self.flush()
-                global_site_index = self.site_index(site_gid)
-                self._init_out_arrays(index_0=global_site_index)
-                i = self.site_index(site_gid, out_index=True)
+                self._init_out_arrays(index_0=global_index[i])
+                continue
+
+            n = int(np.sum(out_index < self._out_n_sites))
+            self._scatter_outputs(out_index[:n], site_outputs[i:i + n])
+            self._finished_sites += gids[i:i + n].tolist()
+            i += n
+
+    def _scatter_outputs(self, out_index, site_outputs, out=None):
+        """Write site output objects into the in-memory output arrays.
 
-            if isinstance(value, (list, tuple, np.ndarray)):
-                if not isinstance(value, np.ndarray):
-                    value = np.array(value)
+        Parameters
+        ----------
+        out_index : np.ndarray
+            Column indices in the current in-memory output arrays for each
+            entry in site_outputs.
+        site_outputs : list
+            List of SAM site output objects (dicts).
+        out : dict | None
+            Output arrays to write into. None defaults to the current
+            in-memory output arrays (self._out).
+        """
+        out = self._out if out is None else out
+
+        variables = dict.fromkeys(var for site_output in site_outputs
+                                  for var in site_output)
+        for var in variables:
+            if var not in out:
+                raise KeyError('Tried to collect output variable "{}", but it '
+                               'was not yet initialized in the output '
+                               'dictionary.'.format(var))
 
-                self._out[var][:, i] = value.T
-            elif value != 0:
-                self._out[var][i] = value
+            values = [site_output.get(var, 0) for site_output in site_outputs]
+            if len(out[var].shape) == 1:
+                out[var][out_index] = values
+            else:
+                # scalar entries (e.g. zeros from failed futures) are left as
+                # the initialized zeros for profile outputs
+                arr = [isinstance(v, (list, tuple, np.ndarray))
+                       for v in values]
+                if all(arr):
+                    out[var][:, out_index] = np.stack(values, axis=1)
+                elif any(arr):
+                    arr = np.array(arr)
+                    values = [v for v, a in zip(values, arr) if a]
+                    out[var][:, out_index[arr]] = np.stack(values, axis=1)
 
     def site_index(self, site_gid, out_index=False):
         """Get the index corresponding to the site gid.
 
         Parameters
         ----------
-        site_gid : int
+        site_gid : int | list | np.ndarray
             Resource-native site index (gid).
         out_index : bool
             Option to get output index (if true) which is the column index in
@@ -1189,19 +1681,20 @@ class Gen:
 
         Returns
         -------
-        index : int
+        index : int | np.ndarray
             Global site index if out_index=False, otherwise column index in
-            the current in-memory output array.
+            the current in-memory output array. Array if site_gid is
+            array-like.
         """
 
         # get the index for site_gid in the (global) project points site list.
-        global_site_index = self.project_points.sites.index(site_gid)
+        global_site_index = self.project_points.index(site_gid)
 
         if not out_index:
             output_index = global_site_index
         else:
             output_index = global_site_index - self.out_chunk[0]
-            if output_index < 0:
+            if np.any(output_index < 0):
                 raise ValueError('Attempting to set output data for site with '
                                  'gid {} to global site index {}, which was '
                                  'already set based on the current output '
@@ -1211,41 +1704,153 @@ class Gen:
 
         return output_index
 
+    @staticmethod
+    def _write_out(fpath, islice, out, output_request):
+        """Write a set of in-memory outputs to disk.
+
+        Parameters
+        ----------
+        fpath : str
+            Output .h5 file path
+        islice : slice
+            Slice of site indices to write the outputs to.
+        out : dict
+            Dictionary of output arrays keyed by dataset name.
+        output_request : list
+            Datasets to write.
+        """
+
+        # open output file in append mode to add output results to
+        with Outputs(fpath, mode='a') as f:
+
+            # iterate through all output requests writing each as a dataset
+            for dset in output_request:
+
+                if len(out[dset].shape) == 1:
+                    # write array of scalars
+                    f[dset, islice] = out[dset]
+                else:
+                    # write 2D array of profiles
+                    f[dset, :, islice] = out[dset]
+
+        logger.debug('Flushed output sites {} successfully to disk.'
+                     .format(islice))
+
+    def _get_finished_runs(self):
+        """Get the contiguous ranges of finished sites in the current output
+        chunk.
+
+        Returns
+        -------
+        runs : list
+            List of [start, stop) global site index ranges of the finished
+            sites. This is the full output chunk unless sites were skipped
+            (e.g. when resuming a run).
+        """
+        index = self.site_index(np.array(self._finished_sites, dtype=int))
+        breaks = np.where(np.diff(index) != 1)[0] + 1
+        runs = [[int(run[0]), int(run[-1]) + 1]
+                for run in np.split(index, breaks)]
+
+        return runs
+
+    def _write_runs(self, fpath, runs, index_0, out, output_request,
+                    written=None, failed=None):
+        """Write the finished site ranges of a set of in-memory outputs to
+        disk and record them in the run manifest.
+
+        Parameters
+        ----------
+        fpath : str
+            Output .h5 file path
+        runs : list
+            List of [start, stop) global site index ranges to write.
+        index_0 : int
+            Global site index of the first column in the output arrays
+            (start of the output chunk).
+        out : dict
+            Dictionary of output arrays for the output chunk keyed by
+            dataset name.
+        output_request : list
+            Datasets to write.
+        written : list | None
+            Gids of all sites that are written.
+        failed : list | None
+            Gids of written sites that failed and are written as zeros.
+        """
+        for start, stop in runs:
+            out_slice = slice(start - index_0, stop - index_0)
+            out_run = {dset: out[dset][..., out_slice]
+                       for dset in output_request}
+            self._write_out(fpath, slice(start, stop), out_run,
+                            output_request)
+
+        if self._manifest is not None:
+            self._manifest.update(runs, written or [], failed or [])
+
     def flush(self):
         """Flush generation data in self.out attribute to disk in .h5 format.
 
         The data to be flushed is accessed from the instance attribute
         "self.out". The disk target is based on the instance attributes
         "self._fpath". Data is not flushed if _fpath is None or if .out is
-        empty.
+        empty. Only the finished sites are written, so sites that are not
+        part of a resumed run keep their previous outputs on disk. With
+        async_flush, the output arrays are handed to a background writer
+        thread (see Gen.wait_flush). The written and failed sites are
+        recorded in the run manifest after the data is written.
         """
 
         # handle output file request if file is specified and .out is not empty
-        if isinstance(self._fpath, str) and self._out:
+        if (isinstance(self._fpath, str) and self._out
+                and self._finished_sites):
             logger.info('Flushing outputs to disk, target file: "{}"'
                         .format(self._fpath))
 
-            # get the slice of indices to write outputs to
-            islice = slice(self.out_chunk[0], self.out_chunk[1] + 1)
+            written = list(self._finished_sites)
+            failed = sorted(self._failed_sites.intersection(written))
+            self._failed_sites.difference_update(failed)
+            self._submit_write(self._get_finished_runs(), self.out_chunk[0],
+                               self._out, written, failed)
 
-            # open output file in append mode to add output results to
-            with Outputs(self._fpath, mode='a') as f:
+    def _submit_write(self, runs, index_0, out, written, failed):
+        """Write finished site ranges to disk, either directly or with the
+        background writer thread if async_flush is enabled.
 
-                # iterate through all output requests writing each as a dataset
-                for dset in self.output_request:
+        Parameters
+        ----------
+        runs : list
+            List of [start, stop) global site index ranges to write.
+        index_0 : int
+            Global site index of the first column in the output arrays.
+        out : dict
+            Dictionary of output arrays keyed by dataset name.
+        written : list
+            Gids of all sites that are written.
+        failed : list
+            Gids of written sites that failed and are written as zeros.
+        """
+        args = (self._fpath, runs, index_0, out, self.output_request,
+                written, failed)
 
-                    if len(self._out[dset].shape) == 1:
-                        # write array of scalars
-                        f[dset, islice] = self._out[dset]
-                    else:
-                        # write 2D array of profiles
-                        f[dset, :, islice] = self._out[dset]
+        if self._async_flush:
+            if self._writer is None:
+                self._writer = FlushWriter(self._write_runs)
 
-            logger.debug('Flushed generation output successfully to disk.')
+            self._writer.submit(*args)
+        else:
+            self._write_runs(*args)
+
+    def wait_flush(self):
+        """Wait for background flushes to finish writing to disk and stop the
+        background writer thread."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
 
     @staticmethod
     def run(points_control, tech=None, res_file=None, output_request=None,
-            scale_outputs=True, downscale=None):
+            scale_outputs=True, downscale=None, prefetch_chunk=None):
         """Run a SAM generation analysis based on the points_control iterator.
 
         Parameters
@@ -1267,6 +1872,10 @@ class Gen:
             Option for NSRDB resource downscaling to higher temporal
             resolution. Expects a string in the Pandas frequency format,
             e.g. '5min'.
+        prefetch_chunk : int | None
+            Resource site chunk size. If not None, the resource for the next
+            chunk of sites is read in a background thread while SAM runs on
+            the current chunk.
 
         Returns
         -------
@@ -1278,7 +1887,8 @@ class Gen:
         try:
             out = Gen.OPTIONS[tech].reV_run(points_control, res_file,
                                             output_request=output_request,
-                                            downscale=downscale)
+                                            downscale=downscale,
+                                            prefetch_chunk=prefetch_chunk)
         except Exception as e:
             out = {}
             logger.exception('Worker failed for PC: {}'.format(points_control))
@@ -1310,110 +1920,573 @@ class Gen:
 
         return out
 
-    def _pre_split_pc(self, pool_size=(os.cpu_count() * 2)):
-        """Pre-split project control iterator into sub chunks to further
-        split the parallelization.
+    def _collect_results(self, results, i_next):
+        """Set buffered results to the output in the original split order.
 
         Parameters
         ----------
+        results : dict
+            Reorder buffer of {split index: result} for completed splits.
+        i_next : int
+            Index of the next split to be set to the output.
+
+        Returns
+        -------
+        i_next : int
+            Index of the next split that has not been set to the output.
+        """
+        while i_next in results:
+            self.out = results.pop(i_next)
+            i_next += 1
+
+        return i_next
+
+    @staticmethod
+    def _timed_run(start_times, token, fun, *args, **kwargs):
+        """Record the time that a worker starts a split and run it.
+
+        Parameters
+        ----------
+        start_times : multiprocessing.managers.DictProxy
+            Shared dictionary of {token: start time} for the splits that
+            have been started by a worker.
+        token : int
+            Unique token of the split.
+        fun : callable
+            Function to run the split (e.g. Gen.run).
+        args : list
+            Positional arguments to fun.
+        kwargs : dict
+            Keyword arguments to fun.
+
+        Returns
+        -------
+        out : object
+            Output of fun.
+        """
+        start_times[token] = time.time()
+
+        return fun(*args, **kwargs)
+
+    @staticmethod
+    def _wait_futures(pending, start_times, timeout):
+        """Wait for the first pending future to complete or for the oldest
+        started future to time out.
+
+        Futures that are queued in the process pool (including the call
+        queue of the pool) do not time out. The timeout clock of a future
+        starts when a worker starts running its split (see Gen._timed_run).
+
+        Parameters
+        ----------
+        pending : dict
+            Pending futures (keys) with (key, points_control, token) values.
+        start_times : dict | multiprocessing.managers.DictProxy
+            Time that a worker started the split of each token. Tokens of
+            completed or timed out futures are removed in-place.
+        timeout : int | float
+            Number of seconds that a future can run before it times out.
+
+        Returns
+        -------
+        done : list
+            Futures that completed.
+        timed_out : list
+            Futures that have been running for longer than timeout.
+        """
+        start_copy = dict(start_times)
+        started = {f: start_copy[v[-1]] for f, v in pending.items()
+                   if v[-1] in start_copy}
+
+        wait_time = timeout
+        if started:
+            t0 = min(started.values())
+            wait_time = max(t0 + timeout - time.time(), 0)
+
+        done, _ = wait(pending, timeout=wait_time,
+                       return_when=FIRST_COMPLETED)
+
+        now = time.time()
+        timed_out = [f for f in pending if f not in done
+                     and f in started
+                     and now - started[f] >= timeout]
+
+        done = list(done)
+        for future in done + timed_out:
+            start_times.pop(pending[future][-1], None)
+
+        return done, timed_out
+
+    @staticmethod
+    def _kill_workers(exe, futures):
+        """Terminate all worker processes of a process pool, e.g. workers
+        that are stuck on a timed out future.
+
+        Parameters
+        ----------
+        exe : concurrent.futures.ProcessPoolExecutor
+            Process pool to kill.
+        futures : list
+            Futures of the pool to cancel if they have not started.
+        """
+        for future in futures:
+            future.cancel()
+
+        processes = getattr(exe, '_processes', None) or {}
+        logger.info('Killing {} pool workers.'.format(len(processes)))
+        for process in list(processes.values()):
+            process.terminate()
+
+        exe.shutdown(wait=False)
+
+    def _run_pool(self, splits, start_times, tokens, max_workers=None,
+                  pool_size=(os.cpu_count() * 2), timeout=1800, buffer=None,
+                  fault_isolation=False, **kwargs):
+        """Run points control splits on a process pool and yield the futures
+        as they complete or time out.
+
+        Parameters
+        ----------
+        splits : iterator
+            Iterator of (key, points_control) tuples to run.
+        start_times : multiprocessing.managers.DictProxy
+            Shared dictionary that the workers record the start time of each
+            split in (see Gen._timed_run).
+        tokens : iterator
+            Iterator of unique tokens for the submitted splits.
+        max_workers : None | int
+            Number of workers. None will default to cpu count.
         pool_size : int
-            Number of futures to submit to a single process pool for
-            parallel futures.
+            Maximum number of futures that are in flight at any time
+            (submitted or completed but waiting in the buffer).
+        timeout : int | float
+            Number of seconds that a worker can run a split before it times
+            out.
+        buffer : dict | None
+            Optional buffer of completed results that count towards the
+            in-flight window (e.g. the reorder buffer).
+        fault_isolation : bool
+            Flag to stop submitting splits after a future times out and to
+            kill the stuck workers.
+        kwargs : dict
+            Keyword arguments to self.run().
+
+        Yields
+        ------
+        key : object
+            Key of the split from splits.
+        pc : reV.config.project_points.PointsControl
+            Points control split that was run.
+        future : concurrent.futures.Future
+            Completed or timed out future.
+        timed_out : bool
+            Flag for whether the future timed out.
+
+        Returns
+        -------
+        stuck : bool
+            Flag for whether the pool workers were killed after a timeout
+            with fault_isolation.
+        """
+        buffer = {} if buffer is None else buffer
+        loggers = [__name__, 'reV.econ.econ']
+        pending = {}
+        stuck_futures = []
+        failed_futures = False
+        with SpawnProcessPool(max_workers=max_workers,
+                              loggers=loggers) as exe:
+            while True:
+                # keep the in-flight window full
+                while (not stuck_futures
+                       and len(pending) + len(buffer) < pool_size):
+                    key, pc = next(splits, (None, None))
+                    if pc is None:
+                        break
+
+                    token = next(tokens)
+                    future = exe.submit(self._timed_run, start_times, token,
+                                        self.run, pc, **kwargs)
+                    pending[future] = (key, pc, token)
+
+                if not pending:
+                    break
+
+                done, timed_out = self._wait_futures(pending, start_times,
+                                                     timeout)
+                for future in done + timed_out:
+                    key, pc, _ = pending.pop(future)
+                    is_timed_out = future in timed_out
+                    failed_futures |= is_timed_out
+                    if is_timed_out and fault_isolation:
+                        stuck_futures.append(future)
+
+                    yield key, pc, future, is_timed_out
+
+            if stuck_futures:
+                self._kill_workers(exe, stuck_futures)
+            elif failed_futures:
+                logger.info('Forcing pool shutdown after failed futures.')
+                exe.shutdown(wait=False)
+                logger.info('Forced pool shutdown complete.')
+
+        return bool(stuck_futures)
+
+    def _run_splits(self, splits, max_workers=None,
+                    pool_size=(os.cpu_count() * 2), timeout=1800,
+                    buffer=None, fault_isolation=False, **kwargs):
+        """Run points control splits on one persistent process pool and yield
+        the futures as they complete or time out.
+
+        With fault_isolation, no new splits are submitted after a future
+        times out. Once the healthy futures in flight are done, the stuck
+        workers are killed and a fresh pool is started for the remaining
+        splits.
+
+        Parameters
+        ----------
+        splits : iterator
+            Iterator of (key, points_control) tuples to run.
+        max_workers : None | int
+            Number of workers. None will default to cpu count.
+        pool_size : int
+            Maximum number of futures that are in flight at any time
+            (submitted or completed but waiting in the buffer).
+        timeout : int | float
+            Number of seconds that a worker can run a split before it times
+            out. The clock starts when the worker starts the split, not when
+            the split is submitted.
+        buffer : dict | None
+            Optional buffer of completed results that count towards the
+            in-flight window (e.g. the reorder buffer).
+        fault_isolation : bool
+            Flag to kill stuck workers after a future times out.
+        kwargs : dict
+            Keyword arguments to self.run().
+
+        Yields
+        ------
+        key : object
+            Key of the split from splits.
+        pc : reV.config.project_points.PointsControl
+            Points control split that was run.
+        future : concurrent.futures.Future
+            Completed or timed out future.
+        timed_out : bool
+            Flag for whether the future timed out.
+        """
+        tokens = itertools.count()
+        with multiprocessing.get_context('spawn').Manager() as manager:
+            start_times = manager.dict()
+            while True:
+                stuck = yield from self._run_pool(
+                    splits, start_times, tokens, max_workers=max_workers,
+                    pool_size=pool_size, timeout=timeout, buffer=buffer,
+                    fault_isolation=fault_isolation, **kwargs)
+
+                if not stuck:
+                    break
+
+                logger.info('Starting a fresh process pool after killing '
+                            'stuck workers.')
+
+    @staticmethod
+    def _get_error(future, timed_out, timeout):
+        """Get the error message of a failed future.
+
+        Parameters
+        ----------
+        future : concurrent.futures.Future
+            Completed or timed out future.
+        timed_out : bool
+            Flag for whether the future timed out.
+        timeout : int | float
+            Number of seconds the future was allowed to run.
 
         Returns
         -------
-        N : int
-            Total number of points control split instances.
-        pc_chunks : list
-            List of lists of points control split instances.
-        """
-        N = 0
-        pc_chunks = []
-        i_chunk = []
-
-        for i, split in enumerate(self.points_control):
-            N += 1
-            i_chunk.append(split)
-            if (i + 1) % pool_size == 0:
-                pc_chunks.append(i_chunk)
-                i_chunk = []
-
-        if i_chunk:
-            pc_chunks.append(i_chunk)
-
-        logger.debug('Pre-splitting points control into {} chunks with the '
-                     'following chunk sizes: {}'
-                     .format(len(pc_chunks), [len(x) for x in pc_chunks]))
-        return N, pc_chunks
+        error : str | None
+            Error message or None if the future completed successfully.
+        """
+        if timed_out:
+            return 'Timed out after {} seconds'.format(timeout)
+
+        e = future.exception()
+        if e is not None:
+            return '{}: {}'.format(type(e).__name__, e)
+
+        return None
 
     def _parallel_run(self, max_workers=None, pool_size=(os.cpu_count() * 2),
-                      timeout=1800, **kwargs):
-        """Execute parallel compute.
+                      timeout=1800, points_control=None, fault_isolation=False,
+                      **kwargs):
+        """Execute parallel compute on one persistent process pool.
+
+        Futures are consumed as they complete. A reorder buffer keeps the
+        results in the original split order so that the outputs are set (and
+        flushed) sequentially.
 
         Parameters
         ----------
         max_workers : None | int
             Number of workers. None will default to cpu count.
         pool_size : int
-            Number of futures to submit to a single process pool for
-            parallel futures.
+            Maximum number of futures that are in flight at any time
+            (submitted or completed but waiting in the reorder buffer).
         timeout : int | float
-            Number of seconds to wait for parallel run iteration to complete
+            Number of seconds to wait for a running future to complete
             before returning zeros.
+        points_control : reV.config.project_points.PointsControl | None
+            Optional points control to run instead of the full
+            self.points_control (e.g. the sites left to run on resume).
+        fault_isolation : bool
+            Flag to narrow failed (timed out or raising) futures down to the
+            offending sites instead of returning zeros for all sites of the
+            future (see Gen._isolate_failures).
         kwargs : dict
             Keyword arguments to self.run().
         """
 
-        logger.debug('Running parallel execution with max_workers={}'
-                     .format(max_workers))
-        i = 0
-        N, pc_chunks = self._pre_split_pc(pool_size=pool_size)
-        for j, pc_chunk in enumerate(pc_chunks):
-            logger.debug('Starting process pool for points control '
-                         'iteration {} out of {}'
-                         .format(j + 1, len(pc_chunks)))
+        logger.debug('Running parallel execution with max_workers={} and up '
+                     'to {} futures in flight'.format(max_workers, pool_size))
+        if points_control is None:
+            points_control = self.points_control
+
+        N = len(points_control)
+        n_done = 0
+        i_next = 0
+        retry = []
+        results = {}
+        splits = self._run_splits(enumerate(points_control),
+                                  max_workers=max_workers,
+                                  pool_size=pool_size, timeout=timeout,
+                                  buffer=results,
+                                  fault_isolation=fault_isolation, **kwargs)
+
+        for i, pc, future, timed_out in splits:
+            n_done += 1
+            error = None
+            if fault_isolation:
+                error = self._get_error(future, timed_out, timeout)
+
+            if error is not None:
+                logger.warning('Iteration {} failed with "{}". Isolating the '
+                               'failed sites.'.format(i + 1, error))
+                results[i] = {}
+                retry.append((pc, error))
+            elif timed_out:
+                sites = pc.project_points.sites
+                results[i] = self._handle_failed_future(future, i + 1, sites,
+                                                        timeout)
+            else:
+                results[i] = future.result()
 
-            failed_futures = False
-            chunks = {}
-            futures = []
-            loggers = [__name__, 'reV.econ.econ']
-            with SpawnProcessPool(max_workers=max_workers,
-                                  loggers=loggers) as exe:
-                for pc in pc_chunk:
-                    future = exe.submit(self.run, pc, **kwargs)
-                    futures.append(future)
-                    chunks[future] = pc
-
-                for future in futures:
-                    i += 1
-                    try:
-                        result = future.result(timeout=timeout)
-                    except TimeoutError:
-                        failed_futures = True
-                        sites = chunks[future].project_points.sites
-                        result = self._handle_failed_future(future, i, sites,
-                                                            timeout)
-
-                    self.out = result
-
-                    mem = psutil.virtual_memory()
-                    m = ('Parallel run at iteration {0} out of {1}. '
-                         'Memory utilization is {2:.3f} GB out of {3:.3f} GB '
-                         'total ({4:.1f}% used, intended limit of {5:.1f}%)'
-                         .format(i, N, mem.used / 1e9, mem.total / 1e9,
-                                 100 * mem.used / mem.total,
-                                 100 * self.mem_util_lim))
-                    logger.info(m)
-
-                if failed_futures:
-                    logger.info('Forcing pool shutdown after failed futures.')
-                    exe.shutdown(wait=False)
-                    logger.info('Forced pool shutdown complete.')
+            i_next = self._collect_results(results, i_next)
+
+            mem = psutil.virtual_memory()
+            m = ('Parallel run at iteration {0} out of {1} ({2} '
+                 'buffered for ordered output). Memory utilization is '
+                 '{3:.3f} GB out of {4:.3f} GB total ({5:.1f}% used, '
+                 'intended limit of {6:.1f}%)'
+                 .format(n_done, N, len(results), mem.used / 1e9,
+                         mem.total / 1e9, 100 * mem.used / mem.total,
+                         100 * self.mem_util_lim))
+            logger.info(m)
+
+        if retry:
+            self._isolate_failures(retry, max_workers=max_workers,
+                                   pool_size=pool_size, timeout=timeout,
+                                   **kwargs)
 
         self.flush()
+        self.wait_flush()
+        self._save_failure_report()
+
+    def _isolate_failures(self, retry, max_workers=None,
+                          pool_size=(os.cpu_count() * 2), timeout=1800,
+                          delay=1, **kwargs):
+        """Narrow failed splits down to the offending sites.
+
+        Failed splits are split in halves and re-run on a fresh process
+        pool. Halves that fail again are split again in the next round, with
+        an exponential back-off delay between rounds, until single sites are
+        left. Only the single sites that keep failing are set to zeros and
+        added to the failure report. Healthy halves complete in the first
+        round, so a stuck site costs about log2(sites_per_worker) timeouts.
+
+        Parameters
+        ----------
+        retry : list
+            List of (points_control, error) for the failed splits.
+        max_workers : None | int
+            Number of workers. None will default to cpu count.
+        pool_size : int
+            Maximum number of futures that are in flight at any time.
+        timeout : int | float
+            Number of seconds to wait for a running sub-split to complete.
+        delay : int | float
+            Back-off delay in seconds before the first round of retries.
+            The delay doubles with every round (up to one minute).
+        kwargs : dict
+            Keyword arguments to self.run().
+        """
+        out = {}
+        attempt = 1
+        while retry:
+            subs = []
+            for pc, error in retry:
+                pp = pc.project_points
+                n = len(pp)
+                if n == 1:
+                    gid = pp.sites[0]
+                    logger.warning('Site {} failed {} times with "{}". '
+                                   'Passing zeros.'
+                                   .format(gid, attempt, error))
+                    out[gid] = {k: 0 for k in self.output_request}
+                    self._add_failure(gid, error, attempt)
+                    continue
+
+                for i0, i1 in ((0, n // 2), (n // 2, n)):
+                    sub = PointsControl.split(
+                        i0, i1, pp, sites_per_split=pc.sites_per_split)
+                    subs.append((len(subs), sub))
+
+            retry = []
+            if not subs:
+                break
+
+            wait_time = min(delay * 2 ** (attempt - 1), 60)
+            attempt += 1
+            logger.info('Fault isolation round {}: re-running {} sub-splits '
+                        'with a timeout of {:.1f} seconds after a back-off '
+                        'of {} seconds.'
+                        .format(attempt - 1, len(subs), timeout, wait_time))
+            time.sleep(wait_time)
+
+            splits = self._run_splits(iter(subs), max_workers=max_workers,
+                                      pool_size=pool_size, timeout=timeout,
+                                      fault_isolation=True, **kwargs)
+            for _, pc, future, timed_out in splits:
+                error = self._get_error(future, timed_out, timeout)
+                if error is None:
+                    out.update(future.result())
+                else:
+                    retry.append((pc, error))
+
+        if out:
+            self._set_isolated(out)
+
+    def _set_isolated(self, out):
+        """Set the results of isolated sites to their own output slots.
+
+        Sites in the current output chunk are set to the in-memory outputs.
+        Sites outside of the current output chunk are written directly to
+        their slots in the output file (and recorded in the run manifest)
+        without flushing the current output chunk.
+
+        Parameters
+        ----------
+        out : dict
+            Results of the isolated sites keyed by site gid.
+        """
+        gids = np.array(list(out.keys()))
+        index = self.site_index(gids)
+        order = np.argsort(index)
+        gids = gids[order]
+        index = index[order]
+
+        in_chunk = ((index >= self.out_chunk[0])
+                    & (index <= self.out_chunk[1]))
+        if in_chunk.any():
+            self._scatter_outputs(index[in_chunk] - self.out_chunk[0],
+                                  [out[gid] for gid in gids[in_chunk]])
+            finished = np.append(self._finished_sites, gids[in_chunk])
+            finished = finished.astype(int)
+            finished = finished[np.argsort(self.site_index(finished))]
+            self._finished_sites = finished.tolist()
+
+        if not in_chunk.all():
+            gids = gids[~in_chunk]
+            index = index[~in_chunk]
+            if isinstance(self._fpath, str):
+                self._write_isolated(gids, index, out)
+            else:
+                logger.warning('Isolated sites {} are outside of the '
+                               'in-memory output chunk and are not kept.'
+                               .format(gids.tolist()))
+
+    def _write_isolated(self, gids, index, out):
+        """Write the results of isolated sites directly to their slots in
+        the output file.
+
+        Parameters
+        ----------
+        gids : np.ndarray
+            Gids of the isolated sites sorted by site index.
+        index : np.ndarray
+            Global site indices of the isolated sites (sorted).
+        out : dict
+            Results of the isolated sites keyed by site gid.
+        """
+        arrays = self._get_out_arrays(len(gids))
+        self._scatter_outputs(np.arange(len(gids)),
+                              [out[gid] for gid in gids], out=arrays)
+
+        # write each contiguous run of site indices separately
+        breaks = np.where(np.diff(index) != 1)[0] + 1
+        bounds = np.concatenate(([0], breaks, [len(index)]))
+        for i0, i1 in zip(bounds[:-1], bounds[1:]):
+            written = gids[i0:i1].tolist()
+            failed = sorted(self._failed_sites.intersection(written))
+            self._failed_sites.difference_update(failed)
+            run_out = {k: v[..., i0:i1] for k, v in arrays.items()}
+            runs = [[int(index[i0]), int(index[i1 - 1]) + 1]]
+            self._submit_write(runs, runs[0][0], run_out, written, failed)
+
+    def _add_failure(self, gid, error, attempts):
+        """Add a failed site to the failure report and mark it as failed in
+        the run manifest.
+
+        Parameters
+        ----------
+        gid : int
+            Resource gid of the failed site.
+        error : str
+            Error message of the failure.
+        attempts : int
+            Number of times the site was run.
+        """
+        self._failed_sites.add(gid)
+        self._failures.append({'gid': int(gid), 'error': str(error),
+                               'attempts': int(attempts)})
+
+    @property
+    def failure_report(self):
+        """Get the report of sites that failed and were set to zeros.
+
+        Returns
+        -------
+        failure_report : pd.DataFrame
+            Table of failed sites with columns "gid", "error" and "attempts".
+        """
+        report = pd.DataFrame(self._failures,
+                              columns=['gid', 'error', 'attempts'])
+
+        return report.sort_values('gid').reset_index(drop=True)
+
+    def _save_failure_report(self):
+        """Save the failure report to a csv next to the output file if any
+        sites failed."""
+        if isinstance(self._fpath, str) and self._failures:
+            fpath = os.path.splitext(self._fpath)[0] + '_failures.csv'
+            logger.warning('{} sites failed and were set to zeros. Saving '
+                           'failure report to: {}'
+                           .format(len(self._failures), fpath))
+            self.failure_report.to_csv(fpath, index=False)
 
     def _handle_failed_future(self, future, i, sites, timeout):
-        """Handle a failed future and return zeros.
+        """Handle a failed future and return zeros. The sites are recorded
+        as failed in the run manifest when they are flushed and are added
+        to the failure report.
 
         Parameters
         ----------
@@ -1435,6 +2508,9 @@ class Gen:
 
         site_out = {k: 0 for k in self.output_request}
         result = {site: site_out for site in sites}
+        for site in sites:
+            self._add_failure(site, 'Timed out after {} seconds'
+                              .format(timeout), 1)
 
         try:
             cancelled = future.cancel()
@@ -1456,7 +2532,9 @@ class Gen:
                 downscale=None, max_workers=1, sites_per_worker=None,
                 pool_size=(os.cpu_count() * 2), timeout=1800,
                 points_range=None, fout=None,
-                dirout='./gen_out', mem_util_lim=0.4, scale_outputs=True):
+                dirout='./gen_out', mem_util_lim=0.4, scale_outputs=True,
+                async_flush=False, prefetch=False, resume=False,
+                fault_isolation=False):
         """Execute a parallel reV generation run with smart data flushing.
 
         Parameters
@@ -1496,11 +2574,13 @@ class Gen:
             Number of sites to run in series on a worker. None defaults to the
             resource file chunk size.
         pool_size : int
-            Number of futures to submit to a single process pool for
-            parallel futures.
+            Maximum number of futures in flight on the persistent process
+            pool (submitted or waiting to be set to the output in order).
         timeout : int | float
-            Number of seconds to wait for parallel run iteration to complete
-            before returning zeros. Default is 1800 seconds.
+            Number of seconds that a worker can run a parallel run iteration
+            before returning zeros. The clock starts when a worker starts the
+            iteration, so iterations that are queued in the process pool do
+            not time out. Default is 1800 seconds.
         points_range : list | None
             Optional two-entry list specifying the index range of the sites to
             analyze. To be taken from the reV.config.PointsControl.split_range
@@ -1516,6 +2596,28 @@ class Gen:
             site results are stored in memory at any given time.
         scale_outputs : bool
             Flag to scale outputs in-place immediately upon Gen returning data.
+        async_flush : bool
+            Flag to flush outputs to disk in a background writer thread while
+            the next output chunk is being computed.
+        prefetch : bool
+            Flag to split each worker's sites by the resource file site
+            chunking (see Gen.get_sites_per_worker) and read the resource for
+            the next chunk in a background thread while SAM runs on the
+            current chunk. Most useful with sites_per_worker spanning several
+            resource chunks.
+        resume : bool
+            Flag to resume a previous run with the same fout and points.
+            Only the sites that are missing from or failed in the existing
+            output file (as recorded in its sidecar manifest) are run and
+            written into the existing file.
+        fault_isolation : bool
+            Flag to narrow failed (timed out or raising) parallel futures
+            down to the offending sites. Stuck workers are killed and the
+            failed splits are re-run in smaller sub-splits until only the
+            offending sites are left. Only those sites are set to zeros and
+            added to the failure report (see Gen.failure_report). Without
+            fault isolation, all sites of a timed out future are set to
+            zeros and a raising future fails the run.
 
         Returns
         -------
@@ -1531,7 +2633,14 @@ class Gen:
         # make a Gen class instance to operate with
         gen = cls(pc, res_file, output_request=output_request, fout=fout,
                   dirout=dirout, mem_util_lim=mem_util_lim,
-                  downscale=downscale)
+                  downscale=downscale, async_flush=async_flush,
+                  resume=resume)
+
+        pc_run = gen.resume_points_control
+        if pc_run is None:
+            logger.info('All sites in "{}" are complete, nothing to resume.'
+                        .format(gen._fpath))
+            return gen
 
         kwargs = {'tech': gen.tech,
                   'res_file': gen.res_file,
@@ -1539,6 +2648,9 @@ class Gen:
                   'scale_outputs': scale_outputs,
                   'downscale': downscale}
 
+        if prefetch:
+            kwargs['prefetch_chunk'] = cls.get_sites_per_worker(res_file)
+
         logger.info('Running reV generation for: {}'.format(pc))
         logger.debug('The following project points were specified: "{}"'
                      .format(points))
@@ -1550,15 +2662,19 @@ class Gen:
         # use serial or parallel execution control based on max_workers
         try:
             if max_workers == 1:
-                logger.debug('Running serial generation for: {}'.format(pc))
-                for pc_sub in pc:
+                logger.debug('Running serial generation for: {}'
+                             .format(pc_run))
+                for pc_sub in pc_run:
                     gen.out = gen.run(pc_sub, **kwargs)
 
                 gen.flush()
+                gen.wait_flush()
             else:
-                logger.debug('Running parallel generation for: {}'.format(pc))
+                logger.debug('Running parallel generation for: {}'
+                             .format(pc_run))
                 gen._parallel_run(max_workers=max_workers, pool_size=pool_size,
-                                  timeout=timeout, **kwargs)
+                                  timeout=timeout, points_control=pc_run,
+                                  fault_isolation=fault_isolation, **kwargs)
 
         except Exception as e:
             logger.exception('reV generation failed!')
@@ -90,6 +90,7 @@ def from_config(ctx, config_file, verbose):
     ctx.obj['DSETS'] = config.dsets
     ctx.obj['PROJECT_POINTS'] = config.project_points
     ctx.obj['PURGE_CHUNKS'] = config.purge_chunks
+    ctx.obj['MAX_WORKERS'] = config.max_workers
     ctx.obj['VERBOSE'] = verbose
 
     for file_prefix in config.file_prefixes:
@@ -136,11 +137,15 @@ def from_config(ctx, config_file, verbose):
               help='Directory to put log files.')
 @click.option('-p', '--purge_chunks', is_flag=True,
               help='Flag to delete chunked files after collection.')
+@click.option('--max_workers', '-mw', type=INT, default=1,
+              help='Number of reader processes. 1 collects one dataset at a '
+              'time in serial, None uses all available cores and collects '
+              'all datasets in one pass over the source files. Default is 1.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging.')
 @click.pass_context
 def direct(ctx, h5_file, h5_dir, project_points, dsets, file_prefix,
-           log_dir, purge_chunks, verbose):
+           log_dir, purge_chunks, max_workers, verbose):
     """Main entry point for collection with context passing."""
     ctx.obj['H5_FILE'] = h5_file
     ctx.obj['H5_DIR'] = h5_dir
@@ -149,6 +154,7 @@ def direct(ctx, h5_file, h5_dir, project_points, dsets, file_prefix,
     ctx.obj['FILE_PREFIX'] = file_prefix
     ctx.obj['LOG_DIR'] = log_dir
     ctx.obj['PURGE_CHUNKS'] = purge_chunks
+    ctx.obj['MAX_WORKERS'] = max_workers
     ctx.obj['VERBOSE'] = verbose
 
 
@@ -167,6 +173,7 @@ def collect(ctx, verbose):
     file_prefix = ctx.obj['FILE_PREFIX']
     log_dir = ctx.obj['LOG_DIR']
     purge_chunks = ctx.obj['PURGE_CHUNKS']
+    max_workers = ctx.obj.get('MAX_WORKERS', 1)
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     # initialize loggers for multiple modules
@@ -182,13 +189,8 @@ def collect(ctx, verbose):
                 .format(dsets, name, h5_dir, h5_file))
     t0 = time.time()
 
-    Collector.collect(h5_file, h5_dir, project_points, dsets[0],
-                      file_prefix=file_prefix)
-
-    if len(dsets) > 1:
-        for dset_name in dsets[1:]:
-            Collector.add_dataset(h5_file, h5_dir, dset_name,
-                                  file_prefix=file_prefix)
+    Collector.collect(h5_file, h5_dir, project_points, list(dsets),
+                      file_prefix=file_prefix, max_workers=max_workers)
 
     if purge_chunks:
         Collector.purge_chunks(h5_file, h5_dir, project_points,
@@ -210,7 +212,7 @@ def collect(ctx, verbose):
 
 def get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
                  file_prefix=None, log_dir='./logs/',
-                 purge_chunks=False, verbose=False):
+                 purge_chunks=False, max_workers=1, verbose=False):
     """Make a reV collection local CLI call string.
 
     Parameters
@@ -232,6 +234,9 @@ def get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
         Log directory.
     purge_chunks : bool
         Flag to delete the chunked files after collection.
+    max_workers : int | None
+        Number of reader processes. 1 collects one dataset at a time in
+        serial, None uses all available cores.
     verbose : bool
         Flag to turn on DEBUG logging
 
@@ -249,6 +254,7 @@ def get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
             '-ds {dsets} '
             '-fp {file_prefix} '
             '-ld {log_dir} '
+            '-mw {max_workers} '
             '{purge}'
             '{v}'
             .format(h5_file=SLURM.s(h5_file),
@@ -257,6 +263,7 @@ def get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
                     dsets=SLURM.s(dsets),
                     file_prefix=SLURM.s(file_prefix),
                     log_dir=SLURM.s(log_dir),
+                    max_workers=SLURM.s(max_workers),
                     purge='-p ' if purge_chunks else '',
                     v='-v ' if verbose else '',
                     ))
@@ -301,11 +308,13 @@ def collect_slurm(ctx, alloc, memory, walltime, feature, conda_env, module,
     dsets = ctx.obj['DSETS']
     file_prefix = ctx.obj['FILE_PREFIX']
     purge_chunks = ctx.obj['PURGE_CHUNKS']
+    max_workers = ctx.obj.get('MAX_WORKERS', 1)
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     cmd = get_node_cmd(name, h5_file, h5_dir, project_points, dsets,
                        file_prefix=file_prefix, log_dir=log_dir,
-                       purge_chunks=purge_chunks, verbose=verbose)
+                       purge_chunks=purge_chunks, max_workers=max_workers,
+                       verbose=verbose)
 
     status = Status.retrieve_job_status(os.path.dirname(h5_file), 'collect',
                                         name)
@@ -80,6 +80,8 @@ def from_config(ctx, config_file, verbose):
     logger.info('Target logging directory: "{}"'.format(config.logdir))
 
     ctx.obj['MY_FILE'] = config.my_file
+    ctx.obj['MAX_WORKERS'] = config.max_workers
+    ctx.obj['MEM_UTIL_LIM'] = config.mem_util_lim
     if config.execution_control.option == 'local':
 
         ctx.obj['NAME'] = name
@@ -110,12 +112,22 @@ def from_config(ctx, config_file, verbose):
 @main.group()
 @click.option('--my_file', '-f', required=True, type=click.Path(),
               help='h5 file to use for multi-year collection.')
+@click.option('--max_workers', '-mw', type=INT, default=1,
+              help=('Number of workers to compute the multi-year statistics '
+                    'with. 1 runs in serial, None uses all available cores. '
+                    'Default is 1.'))
+@click.option('--mem_util_lim', '-mem', type=float, default=0.7,
+              help=('Fractional node memory utilization limit. Sets how '
+                    'many sites are processed at a time when computing the '
+                    'multi-year statistics. Default is 0.7.'))
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging.')
 @click.pass_context
-def direct(ctx, my_file, verbose):
+def direct(ctx, my_file, max_workers, mem_util_lim, verbose):
     """Main entry point for collection with context passing."""
     ctx.obj['MY_FILE'] = my_file
+    ctx.obj['MAX_WORKERS'] = max_workers
+    ctx.obj['MEM_UTIL_LIM'] = mem_util_lim
     ctx.obj['VERBOSE'] = verbose
 
 
@@ -158,7 +170,9 @@ def multi_year(ctx, group, source_files, dsets, verbose):
                                        group=group)
         else:
             MultiYear.collect_means(my_file, source_files, dset,
-                                    group=group)
+                                    group=group,
+                                    mem_util_lim=ctx.obj['MEM_UTIL_LIM'],
+                                    max_workers=ctx.obj['MAX_WORKERS'])
 
     runtime = (time.time() - t0) / 60
     logger.info('Multi-year collection completed in: {:.2f} min.'
@@ -185,6 +199,8 @@ def multi_year_groups(ctx, group_params, verbose):
     """Run multi year collection and means for multiple groups."""
     name = ctx.obj['NAME']
     my_file = ctx.obj['MY_FILE']
+    max_workers = ctx.obj['MAX_WORKERS']
+    mem_util_lim = ctx.obj['MEM_UTIL_LIM']
     verbose = any([verbose, ctx.obj['VERBOSE']])
 
     # initialize loggers for multiple modules
@@ -211,7 +227,9 @@ def multi_year_groups(ctx, group_params, verbose):
                                            dset, group=group['group'])
             else:
                 MultiYear.collect_means(my_file, group['source_files'],
-                                        dset, group=group['group'])
+                                        dset, group=group['group'],
+                                        mem_util_lim=mem_util_lim,
+                                        max_workers=max_workers)
 
         runtime = (time.time() - t0) / 60
         logger.info('- {} collection completed in: {:.2f} min.'
@@ -230,7 +248,8 @@ def multi_year_groups(ctx, group_params, verbose):
                          status)
 
 
-def get_slurm_cmd(name, my_file, group_params, verbose=False):
+def get_slurm_cmd(name, my_file, group_params, max_workers=1,
+                  mem_util_lim=0.7, verbose=False):
     """Make a reV multi-year collection local CLI call string.
 
     Parameters
@@ -241,6 +260,11 @@ def get_slurm_cmd(name, my_file, group_params, verbose=False):
         Path to .h5 file to use for multi-year collection.
     group_params : list
         List of groups and their parameters to collect
+    max_workers : int | None
+        Number of workers to compute the multi-year statistics with.
+        1 runs in serial, None uses all available cores.
+    mem_util_lim : float
+        Memory utilization limit (fractional) for the multi-year statistics.
     verbose : bool
         Flag to turn on DEBUG logging
 
@@ -257,14 +281,21 @@ def get_slurm_cmd(name, my_file, group_params, verbose=False):
                          v='-v ' if verbose else '',
                          ))
 
+    direct_args = ('-f {my_file} '
+                   '-mw {max_workers} '
+                   '-mem {mem} '
+                   .format(my_file=SLURM.s(my_file),
+                           max_workers=SLURM.s(max_workers),
+                           mem=SLURM.s(mem_util_lim)))
+
     collect_args = '-gp {} '.format(SLURM.s(group_params))
 
     # Python command that will be executed on a node
     # command strings after cli v7.0 use dashes instead of underscores
 
-    cmd = ('python -m reV.handlers.cli_multi_year {} direct -f {} '
+    cmd = ('python -m reV.handlers.cli_multi_year {} direct {} '
            'multi-year-groups {}'
-           .format(main_args, SLURM.s(my_file), collect_args))
+           .format(main_args, direct_args, collect_args))
     logger.debug('Creating the following command line call:\n\t{}'
                  .format(cmd))
     return cmd
@@ -313,7 +344,10 @@ def multi_year_slurm(ctx, alloc, walltime, feature, memory, conda_env,
                     ' name "{}", collecting into "{}".'
                     .format(name, my_file))
         # create and submit the SLURM job
-        slurm_cmd = get_slurm_cmd(name, my_file, group_params, verbose=verbose)
+        slurm_cmd = get_slurm_cmd(name, my_file, group_params,
+                                  max_workers=ctx.obj['MAX_WORKERS'],
+                                  mem_util_lim=ctx.obj['MEM_UTIL_LIM'],
+                                  verbose=verbose)
         slurm = SLURM(slurm_cmd, alloc=alloc, memory=memory, walltime=walltime,
                       feature=feature, name=name, stdout_path=stdout_path,
                       conda_env=conda_env, module=module)
@@ -2,6 +2,8 @@
 """
 Base class to handle collection of profiles and means across multiple .h5 files
 """
+from concurrent.futures import FIRST_COMPLETED, wait
+import h5py
 import logging
 import numpy as np
 import os
@@ -17,6 +19,7 @@ from reV.utilities.exceptions import (CollectionRuntimeError,
                                       CollectionValueError,
                                       CollectionWarning)
 
+from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.loggers import log_mem
 
 logger = logging.getLogger(__name__)
@@ -323,11 +326,434 @@ class DatasetCollector:
                  mem_util_lim=mem_util_lim)
         dc._collect()
 
+    @staticmethod
+    def get_source_slots(source_files, gids):
+        """Map the sites in every source file to their output slots once.
+
+        Sites that are not in gids are given a slot of -1. If a gid is
+        present in multiple source files, only the last source file keeps
+        the slot (consistent with the meta data de-duplication in
+        Collector).
+
+        Parameters
+        ----------
+        source_files : list
+            List of source filepaths.
+        gids : list
+            Sorted list of gids to be collected (output meta gid order).
+
+        Returns
+        -------
+        slots : list
+            List of integer arrays (one per source file) with the output
+            site index for each site in the source file.
+        """
+        gids = np.asarray(gids)
+        owner = np.full(len(gids), -1, dtype=np.int64)
+        slots = []
+        for i, fp in enumerate(source_files):
+            with Outputs(fp, mode='r') as f:
+                source_gids = f.get_meta_arr('gid')
+
+            locs = np.searchsorted(gids, source_gids)
+            locs = np.minimum(locs, len(gids) - 1)
+            found = gids[locs] == source_gids
+            locs[~found] = -1
+            owner[locs[found]] = i
+            slots.append(locs)
+
+        for i, locs in enumerate(slots):
+            mask = locs >= 0
+            mask[mask] = owner[locs[mask]] == i
+            locs[~mask] = -1
+
+        return slots
+
+    @staticmethod
+    def _get_source_blocks(source_slots, block_size):
+        """Split the source sites of one file into output-aligned blocks.
+
+        Each block maps to a contiguous hyperslab in the output that does
+        not cross a multiple of block_size so that writes are aligned with
+        the output chunks.
+
+        Parameters
+        ----------
+        source_slots : np.ndarray
+            Output site index for each site in the source file (-1 for sites
+            that are not collected).
+        block_size : int
+            Maximum number of sites per block.
+
+        Returns
+        -------
+        blocks : list
+            List of (rows, out_slice) tuples where rows are the source site
+            indices and out_slice is the output site slice.
+        """
+        rows = np.where(source_slots >= 0)[0]
+        if not len(rows):
+            return []
+
+        rows = rows[np.argsort(source_slots[rows], kind='stable')]
+        locs = source_slots[rows]
+        breaks = (np.diff(locs) != 1) | (locs[1:] % block_size == 0)
+        breaks = np.where(breaks)[0] + 1
+
+        blocks = []
+        for idx in np.split(np.arange(len(rows)), breaks):
+            out_slice = slice(locs[idx[0]], locs[idx[-1]] + 1)
+            blocks.append((rows[idx], out_slice))
+
+        return blocks
+
+    @staticmethod
+    def _read_block(fp_source, dsets, rows):
+        """Read one block of sites for several datasets from a source file.
+
+        Parameters
+        ----------
+        fp_source : str
+            Source filepath
+        dsets : list
+            Datasets to read from the source file.
+        rows : np.ndarray
+            Source site indices to read.
+
+        Returns
+        -------
+        data : dict
+            Dictionary of {dset: array} with the sites in the order of rows.
+        """
+        i0 = rows.min()
+        source_slice = slice(i0, rows.max() + 1)
+        cols = rows - i0
+        data = {}
+        with Outputs(fp_source, mode='r') as f:
+            for dset in dsets:
+                shape, _, _ = f.get_dset_properties(dset)
+                if len(shape) == 1:
+                    data[dset] = f[dset, source_slice][cols]
+                else:
+                    data[dset] = f[dset, :, source_slice][:, cols]
+
+        return data
+
+    def _write_block(self, f_out, data, out_slice):
+        """Write one block of source data to the output hyperslab.
+
+        Parameters
+        ----------
+        f_out : reV.handlers.outputs.Output
+            Output file handler
+        data : np.ndarray
+            Block of source data for this dataset.
+        out_slice : slice
+            Output site slice to write to.
+        """
+        if self._axis == 1:
+            f_out[self._dset_out, out_slice] = data
+        else:
+            f_out[self._dset_out, :, out_slice] = data
+
+    @classmethod
+    def collect_dsets(cls, h5_file, source_files, gids, dsets_in,
+                      dsets_out=None, mem_util_lim=0.7, max_workers=None):
+        """Collect several datasets from a list of source files into a final
+        output file in a single (parallel) pass over the source files.
+
+        Reader processes load blocks of sites from the source files while
+        the main process is the only writer to the output file.
+
+        Parameters
+        ----------
+        h5_file : str
+            Path to h5_file into which datasets are to be collected
+        source_files : list
+            List of source filepaths.
+        gids : list
+            Sorted list of gids to be collected
+        dsets_in : list
+            Datasets to collect
+        dsets_out : list | None
+            Datasets into which collected data is to be written. None will
+            use dsets_in.
+        mem_util_lim : float
+            Memory utilization limit (fractional). This sets how many sites
+            will be held in memory at a time (across all readers).
+        max_workers : int | None
+            Number of reader processes. None uses all available cores, 1
+            reads the source files in serial.
+        """
+        if dsets_out is None:
+            dsets_out = dsets_in
+
+        if len(dsets_in) != len(dsets_out):
+            m = ('Number of input datasets {} does not match number of '
+                 'output datasets {}'.format(dsets_in, dsets_out))
+            logger.error(m)
+            raise CollectionValueError(m)
+
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        collectors = [cls(h5_file, source_files, gids, dset_in,
+                          dset_out=dset_out, mem_util_lim=mem_util_lim)
+                      for dset_in, dset_out in zip(dsets_in, dsets_out)]
+
+        n_buffers = 2 * max_workers + 1
+        site_mem_req = sum(dc._site_mem_req for dc in collectors)
+        mem_avail = collectors[0]._mem_avail
+        block_size = max(1, int(mem_avail / (site_mem_req * n_buffers)))
+
+        with Outputs(h5_file, mode='r') as f_out:
+            site_chunks = [f_out.h5[dc._dset_out].chunks for dc in collectors]
+        site_chunk = max([c[-1] for c in site_chunks if c is not None],
+                         default=None)
+        if site_chunk is not None:
+            block_size = max(site_chunk, block_size // site_chunk * site_chunk)
+
+        slots = cls.get_source_slots(source_files, gids)
+        jobs = [(fp, rows, out_slice)
+                for fp, source_slots in zip(source_files, slots)
+                for rows, out_slice in cls._get_source_blocks(source_slots,
+                                                              block_size)]
+
+        logger.info('Collecting datasets {} from {} source files in {} '
+                    'blocks of up to {} sites using {} readers.'
+                    .format(dsets_in, len(source_files), len(jobs),
+                            block_size, max_workers))
+
+        with Outputs(h5_file, mode='a') as f_out:
+            if max_workers == 1:
+                for fp, rows, out_slice in jobs:
+                    data = cls._read_block(fp, dsets_in, rows)
+                    for dc in collectors:
+                        dc._write_block(f_out, data[dc._dset_in], out_slice)
+            else:
+                cls._collect_parallel(collectors, f_out, jobs, max_workers,
+                                      n_buffers - 1)
+
+        log_mem(logger, log_level='DEBUG')
+
+    @staticmethod
+    def _get_virtual_runs(source_slots):
+        """Get the contiguous runs of source sites that map to contiguous
+        runs of output sites.
+
+        Parameters
+        ----------
+        source_slots : np.ndarray
+            Output site index for each site in the source file (-1 for sites
+            that are not collected).
+
+        Returns
+        -------
+        runs : list
+            List of (source_slice, out_slice) tuples.
+        """
+        rows = np.where(source_slots >= 0)[0]
+        if not len(rows):
+            return []
+
+        rows = rows[np.argsort(source_slots[rows], kind='stable')]
+        locs = source_slots[rows]
+        breaks = (np.diff(locs) != 1) | (np.diff(rows) != 1)
+        breaks = np.where(breaks)[0] + 1
+
+        runs = []
+        for idx in np.split(np.arange(len(rows)), breaks):
+            source_slice = slice(rows[idx[0]], rows[idx[-1]] + 1)
+            out_slice = slice(locs[idx[0]], locs[idx[-1]] + 1)
+            runs.append((source_slice, out_slice))
+
+        return runs
+
+    @staticmethod
+    def check_source_files(source_files):
+        """Check that all source files of a virtual collection exist. HDF5
+        silently reads the fill value for missing virtual sources, so
+        virtual datasets must never be built or materialized without them.
+
+        Parameters
+        ----------
+        source_files : list
+            List of source filepaths.
+        """
+        missing = sorted({fp for fp in source_files
+                          if not os.path.isfile(fp)})
+        if missing:
+            msg = ('Cannot build or materialize virtual datasets, the '
+                   'following source files do not exist: {}'.format(missing))
+            logger.error(msg)
+            raise CollectionRuntimeError(msg)
+
+    @staticmethod
+    def get_creation_kwargs(ds, shape):
+        """Get the creation properties (chunks, compression, filters, and
+        fill value) of a dataset to re-create it with a new shape.
+
+        Parameters
+        ----------
+        ds : h5py.Dataset
+            Dataset to copy the creation properties from.
+        shape : tuple
+            Shape of the dataset to be created. Chunks are clipped to it.
+
+        Returns
+        -------
+        kwargs : dict
+            Keyword arguments for h5py.Group.create_dataset.
+        """
+        kwargs = {'fillvalue': ds.fillvalue}
+        if ds.chunks is not None:
+            kwargs['chunks'] = tuple(int(min(c, max(s, 1)))
+                                     for c, s in zip(ds.chunks, shape))
+
+        if ds.compression is not None:
+            kwargs['compression'] = ds.compression
+            kwargs['compression_opts'] = ds.compression_opts
+
+        for key in ('shuffle', 'fletcher32', 'scaleoffset'):
+            value = getattr(ds, key)
+            if value:
+                kwargs[key] = value
+
+        return kwargs
+
+    @classmethod
+    def collect_virtual(cls, h5_file, source_files, gids, dsets_in,
+                        dsets_out=None):
+        """Collect datasets as HDF5 virtual datasets that map the source file
+        hyperslabs into the output site order without copying any data.
+
+        Source files are referenced relative to the directory of h5_file, so
+        they must not be moved or purged until the virtual datasets have been
+        materialized (see Collector.materialize).
+
+        Parameters
+        ----------
+        h5_file : str
+            Path to h5_file into which datasets are to be collected
+        source_files : list
+            List of source filepaths.
+        gids : list
+            Sorted list of gids to be collected
+        dsets_in : list
+            Datasets to collect
+        dsets_out : list | None
+            Virtual datasets to create in h5_file. None will use dsets_in.
+        """
+        if dsets_out is None:
+            dsets_out = dsets_in
+
+        cls.check_source_files(source_files)
+        slots = cls.get_source_slots(source_files, gids)
+        out_dir = os.path.dirname(os.path.abspath(h5_file))
+        for dset_in, dset_out in zip(dsets_in, dsets_out):
+            with Outputs(source_files[0], mode='r') as f:
+                shape, dtype, _ = f.get_dset_properties(dset_in)
+                attrs = f.get_attrs(dset_in)
+
+            if len(shape) > 2:
+                m = ('Cannot collect dset "{}" with '
+                     'axis {}'.format(dset_in, len(shape)))
+                logger.error(m)
+                raise CollectionRuntimeError(m)
+
+            layout = h5py.VirtualLayout(shape=shape[:-1] + (len(gids),),
+                                        dtype=dtype)
+            for fp, source_slots in zip(source_files, slots):
+                with Outputs(fp, mode='r') as f:
+                    source_shape, _, _ = f.get_dset_properties(dset_in)
+
+                vsource = h5py.VirtualSource(os.path.relpath(fp, out_dir),
+                                             dset_in, shape=source_shape)
+                for source_slice, out_slice in cls._get_virtual_runs(
+                        source_slots):
+                    layout[..., out_slice] = vsource[..., source_slice]
+
+            with Outputs(h5_file, mode='a') as f_out:
+                if dset_out in f_out.datasets:
+                    w = ('Replacing existing dataset "{}" in {} with a '
+                         'virtual dataset'.format(dset_out, h5_file))
+                    logger.warning(w)
+                    warn(w, CollectionWarning)
+                    del f_out.h5[dset_out]
+
+                ds = f_out.h5.create_virtual_dataset(dset_out, layout,
+                                                     fillvalue=0)
+                for k, v in attrs.items():
+                    ds.attrs[k] = v
+
+            logger.debug('\t- Created virtual dataset "{}" from "{}" in {} '
+                         'source files'.format(dset_out, dset_in,
+                                               len(source_files)))
+
+    @staticmethod
+    def _collect_parallel(collectors, f_out, jobs, max_workers, max_pending):
+        """Read source blocks in parallel and write them in the main process.
+
+        Parameters
+        ----------
+        collectors : list
+            List of DatasetCollector objects (one per dataset).
+        f_out : reV.handlers.outputs.Output
+            Output file handler
+        jobs : list
+            List of (source filepath, source rows, output slice) tuples.
+        max_workers : int
+            Number of reader processes.
+        max_pending : int
+            Maximum number of blocks read but not yet written. This bounds
+            the collection memory footprint.
+        """
+        dsets_in = [dc._dset_in for dc in collectors]
+        jobs = iter(jobs)
+        pending = {}
+        n_done = 0
+        loggers = [__name__, 'reV']
+        with SpawnProcessPool(max_workers=max_workers,
+                              loggers=loggers) as exe:
+            while True:
+                for fp, rows, out_slice in jobs:
+                    future = exe.submit(DatasetCollector._read_block, fp,
+                                        dsets_in, rows)
+                    pending[future] = (fp, out_slice)
+                    if len(pending) >= max_pending:
+                        break
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    fp, out_slice = pending.pop(future)
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        logger.exception('Failed to collect source file {}. '
+                                         'Raised the following exception:'
+                                         '\n{}'.format(os.path.basename(fp),
+                                                       e))
+                        raise e
+
+                    for dc in collectors:
+                        dc._write_block(f_out, data[dc._dset_in], out_slice)
+
+                    n_done += 1
+                    logger.debug('\t- Wrote block {} for output sites {}'
+                                 .format(n_done, out_slice))
+
 
 class Collector:
     """
     Class to handle the collection and combination of .h5 files
     """
+    # sidecar files written next to the chunked generation outputs (run
+    # manifest and failure report) that are purged and moved with the chunks
+    SIDECAR_SUFFIXES = ('_manifest.json', '_failures.csv')
+
     def __init__(self, h5_file, h5_dir, project_points, file_prefix=None,
                  clobber=False):
         """
@@ -495,6 +921,25 @@ class Collector:
         """
         return self._h5_files
 
+    @property
+    def chunk_files(self):
+        """
+        .h5 files to be combined and their existing sidecar files
+
+        Returns
+        -------
+        list
+        """
+        chunk_files = []
+        for fpath in self.h5_files:
+            chunk_files.append(fpath)
+            for suffix in self.SIDECAR_SUFFIXES:
+                sidecar = os.path.splitext(fpath)[0] + suffix
+                if os.path.exists(sidecar):
+                    chunk_files.append(sidecar)
+
+        return chunk_files
+
     @property
     def gids(self):
         """
@@ -572,14 +1017,20 @@ class Collector:
             dsets_source = out.datasets
 
         missing = [d for d in dsets_source if d not in dsets_collected]
+        virtual = self.get_virtual_dsets(self._h5_out)
 
-        if any(missing):
+        if any(virtual):
+            w = ('Not purging chunked output files. These dsets are virtual '
+                 'and have not been materialized: {}'.format(virtual))
+            warn(w, CollectionWarning)
+            logger.warning(w)
+        elif any(missing):
             w = ('Not purging chunked output files. These dsets '
                  'have not been collected: {}'.format(missing))
             warn(w, CollectionWarning)
             logger.warning(w)
         else:
-            for fpath in self.h5_files:
+            for fpath in self.chunk_files:
                 os.remove(fpath)
 
     def _move_chunks(self, sub_dir):
@@ -591,8 +1042,14 @@ class Collector:
             Sub directory name to move chunks to. None to not move files.
         """
 
-        if sub_dir is not None:
-            for fpath in self.h5_files:
+        virtual = self.get_virtual_dsets(self._h5_out)
+        if sub_dir is not None and any(virtual):
+            w = ('Not moving chunked output files. These dsets are virtual '
+                 'and have not been materialized: {}'.format(virtual))
+            warn(w, CollectionWarning)
+            logger.warning(w)
+        elif sub_dir is not None:
+            for fpath in self.chunk_files:
                 base_dir, fn = os.path.split(fpath)
                 new_dir = os.path.join(base_dir, sub_dir)
                 if not os.path.exists(new_dir):
@@ -625,9 +1082,63 @@ class Collector:
 
                 f._set_meta('meta', meta, attrs=meta_attrs)
 
+    def _collect_dsets(self, dset_names, dset_out=None, mem_util_lim=0.7,
+                       max_workers=1, virtual=False):
+        """Collect one or more datasets (and time index if needed) into the
+        output file.
+
+        Parameters
+        ----------
+        dset_names : str | list
+            Dataset(s) to be collected.
+        dset_out : str | list | None
+            Dataset(s) to collect data into. None will use dset_names.
+        mem_util_lim : float
+            Memory utilization limit (fractional).
+        max_workers : int | None
+            Number of reader processes. 1 runs the serial collection one
+            dataset at a time.
+        virtual : bool
+            Flag to collect the datasets as HDF5 virtual datasets.
+        """
+        if isinstance(dset_names, str):
+            dset_names = [dset_names]
+        if dset_out is None:
+            dset_out = dset_names
+        elif isinstance(dset_out, str):
+            dset_out = [dset_out]
+
+        shapes = [self.get_dset_shape(dset) for dset in dset_names]
+        if any(len(shape) > 1 for shape in shapes):
+            self.combine_time_index()
+            logger.debug("\t- 'time_index' collected")
+
+        if virtual:
+            DatasetCollector.collect_virtual(self._h5_out, self.h5_files,
+                                             self.gids, dset_names,
+                                             dsets_out=dset_out)
+            logger.debug("\t- Virtual collection of {} complete"
+                         .format(dset_names))
+        elif max_workers == 1:
+            for dset_in, d_out in zip(dset_names, dset_out):
+                DatasetCollector.collect_dset(self._h5_out, self.h5_files,
+                                              self.gids, dset_in,
+                                              dset_out=d_out,
+                                              mem_util_lim=mem_util_lim)
+                logger.debug("\t- Collection of '{}' complete"
+                             .format(dset_in))
+        else:
+            DatasetCollector.collect_dsets(self._h5_out, self.h5_files,
+                                           self.gids, dset_names,
+                                           dsets_out=dset_out,
+                                           mem_util_lim=mem_util_lim,
+                                           max_workers=max_workers)
+            logger.debug("\t- Collection of {} complete".format(dset_names))
+
     @classmethod
     def collect(cls, h5_file, h5_dir, project_points, dset_name, dset_out=None,
-                file_prefix=None, mem_util_lim=0.7):
+                file_prefix=None, mem_util_lim=0.7, max_workers=1,
+                virtual=False):
         """
         Collect dataset from h5_dir to h5_file
 
@@ -641,16 +1152,26 @@ class Collector:
             Project points that correspond to the full collection of points
             contained in the .h5 files to be collected. None if points list is
             to be ignored (collect all data in h5_files)
-        dset_name : str
-            Dataset to be collected. If source shape is 2D, time index will be
-            collected.
-        dset_out : str
-            Dataset to collect means into
+        dset_name : str | list
+            Dataset(s) to be collected. If source shape is 2D, time index will
+            be collected.
+        dset_out : str | list
+            Dataset(s) to collect means into
         file_prefix : str
             .h5 file prefix, if None collect all files on h5_dir
         mem_util_lim : float
             Memory utilization limit (fractional). This sets how many sites
             will be collected at a time.
+        max_workers : int | None
+            Number of reader processes for parallel collection. 1 runs the
+            low memory serial collection one dataset at a time, None uses all
+            available cores and collects all datasets in one pass over the
+            source files.
+        virtual : bool
+            Flag to collect the datasets as HDF5 virtual datasets that
+            reference the source files instead of copying the data. The
+            source files must be kept in place until the output is
+            materialized (see Collector.materialize).
         """
         if file_prefix is None:
             h5_files = "*.h5"
@@ -664,16 +1185,9 @@ class Collector:
                   clobber=True)
         logger.debug("\t- 'meta' collected")
 
-        dset_shape = clt.get_dset_shape(dset_name)
-        if len(dset_shape) > 1:
-            clt.combine_time_index()
-            logger.debug("\t- 'time_index' collected")
-
-        DatasetCollector.collect_dset(clt._h5_out, clt.h5_files, clt.gids,
-                                      dset_name, dset_out=dset_out,
-                                      mem_util_lim=mem_util_lim)
-
-        logger.debug("\t- Collection of '{}' complete".format(dset_name))
+        clt._collect_dsets(dset_name, dset_out=dset_out,
+                           mem_util_lim=mem_util_lim,
+                           max_workers=max_workers, virtual=virtual)
 
         tt = (time.time() - ts) / 60
         logger.info('Collection complete')
@@ -682,7 +1196,8 @@ class Collector:
 
     @classmethod
     def add_dataset(cls, h5_file, h5_dir, dset_name, dset_out=None,
-                    file_prefix=None, mem_util_lim=0.7):
+                    file_prefix=None, mem_util_lim=0.7, max_workers=1,
+                    virtual=False):
         """
         Collect and add dataset to h5_file from h5_dir
 
@@ -692,16 +1207,26 @@ class Collector:
             Path to .h5 file into which data will be collected
         h5_dir : str
             Root directory containing .h5 files to combine
-        dset_name : str
-            Dataset to be collected. If source shape is 2D, time index will be
-            collected.
-        dset_out : str
-            Dataset to collect means into
+        dset_name : str | list
+            Dataset(s) to be collected. If source shape is 2D, time index will
+            be collected.
+        dset_out : str | list
+            Dataset(s) to collect means into
         file_prefix : str
             .h5 file prefix, if None collect all files on h5_dir
         mem_util_lim : float
             Memory utilization limit (fractional). This sets how many sites
             will be collected at a time.
+        max_workers : int | None
+            Number of reader processes for parallel collection. 1 runs the
+            low memory serial collection one dataset at a time, None uses all
+            available cores and collects all datasets in one pass over the
+            source files.
+        virtual : bool
+            Flag to collect the datasets as HDF5 virtual datasets that
+            reference the source files instead of copying the data. The
+            source files must be kept in place until the output is
+            materialized (see Collector.materialize).
         """
         if file_prefix is None:
             h5_files = "*.h5"
@@ -716,22 +1241,105 @@ class Collector:
 
         clt = cls(h5_file, h5_dir, points, file_prefix=file_prefix)
 
-        dset_shape = clt.get_dset_shape(dset_name)
-        if len(dset_shape) > 1:
-            clt.combine_time_index()
-            logger.debug("\t- 'time_index' collected")
-
-        DatasetCollector.collect_dset(clt._h5_out, clt.h5_files, clt.gids,
-                                      dset_name, dset_out=dset_out,
-                                      mem_util_lim=mem_util_lim)
-
-        logger.debug("\t- Collection of '{}' complete".format(dset_name))
+        clt._collect_dsets(dset_name, dset_out=dset_out,
+                           mem_util_lim=mem_util_lim,
+                           max_workers=max_workers, virtual=virtual)
 
         tt = (time.time() - ts) / 60
         logger.info('{} collected'.format(dset_name))
         logger.debug('\t- Collection took {:.4f} minutes'
                      .format(tt))
 
+    @staticmethod
+    def get_virtual_dsets(h5_file):
+        """
+        Get the names of the virtual datasets in an h5 file.
+
+        Parameters
+        ----------
+        h5_file : str
+            Path to .h5 file
+
+        Returns
+        -------
+        virtual : list
+            List of virtual dataset names in h5_file
+        """
+        with h5py.File(h5_file, mode='r') as f:
+            virtual = [dset for dset in f
+                       if isinstance(f[dset], h5py.Dataset)
+                       and f[dset].is_virtual]
+
+        return virtual
+
+    @classmethod
+    def materialize(cls, h5_file, dsets=None, mem_util_lim=0.7):
+        """
+        Replace virtual datasets in h5_file with real (copied) datasets so
+        that the source chunk files can be moved or purged. The new datasets
+        get the chunking, compression, and filters of the source datasets.
+
+        Parameters
+        ----------
+        h5_file : str
+            Path to .h5 file with virtual datasets (from a virtual collection)
+        dsets : str | list | None
+            Virtual dataset(s) to materialize. None will materialize all
+            virtual datasets in h5_file.
+        mem_util_lim : float
+            Memory utilization limit (fractional). This sets how many sites
+            will be copied at a time.
+        """
+        if dsets is None:
+            dsets = cls.get_virtual_dsets(h5_file)
+        elif isinstance(dsets, str):
+            dsets = [dsets]
+
+        mem_avail = mem_util_lim * psutil.virtual_memory().total
+        h5_dir = os.path.dirname(os.path.abspath(h5_file))
+        ts = time.time()
+        with h5py.File(h5_file, mode='a') as f:
+            sources = {dset: [os.path.join(h5_dir, vs.file_name)
+                              for vs in f[dset].virtual_sources()]
+                       for dset in dsets if f[dset].is_virtual}
+            DatasetCollector.check_source_files(
+                [fp for fps in sources.values() for fp in fps])
+
+            for dset in dsets:
+                ds = f[dset]
+                if not ds.is_virtual:
+                    logger.debug('Dataset "{}" is not virtual, skipping'
+                                 .format(dset))
+                    continue
+
+                source = ds.virtual_sources()[0]
+                with h5py.File(sources[dset][0], mode='r') as f_source:
+                    kwargs = DatasetCollector.get_creation_kwargs(
+                        f_source[source.dset_name], ds.shape)
+
+                site_mem = DatasetCollector._get_site_mem_req(ds.shape,
+                                                              ds.dtype)
+                n_sites = ds.shape[-1]
+                step = int(np.clip(mem_avail / site_mem, 1, n_sites))
+
+                logger.info('Materializing virtual dataset "{}" with shape {} '
+                            'in blocks of {} sites'
+                            .format(dset, ds.shape, step))
+                tmp = '{}_materialized'.format(dset)
+                new = f.create_dataset(tmp, shape=ds.shape, dtype=ds.dtype,
+                                       **kwargs)
+                for i in range(0, n_sites, step):
+                    new[..., i:i + step] = ds[..., i:i + step]
+
+                for k, v in ds.attrs.items():
+                    new.attrs[k] = v
+
+                del f[dset]
+                f.move(tmp, dset)
+
+        tt = (time.time() - ts) / 60
+        logger.info('Materialized {} in {:.4f} minutes'.format(dsets, tt))
+
     @classmethod
     def purge_chunks(cls, h5_file, h5_dir, project_points, file_prefix=None):
         """
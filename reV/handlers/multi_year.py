@@ -2,14 +2,17 @@
 """
 Classes to collect reV outputs from multiple annual files.
 """
+from concurrent.futures import as_completed
 import logging
 import numpy as np
 import os
 import pandas as pd
+import psutil
 
 from reV.handlers.outputs import Outputs
 from reV.utilities.exceptions import HandlerRuntimeError
 
+from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.utilities import parse_year
 
 logger = logging.getLogger(__name__)
@@ -110,12 +113,9 @@ class MultiYear(Outputs):
                     if not meta[cols].equals(source_meta[cols]):
                         raise HandlerRuntimeError('Coordinates do not match')
 
-                _, ds_dtype, ds_chunks = f_in.get_dset_properties(dset)
-                ds_attrs = f_in.get_attrs(dset=dset)
-                ds_data = f_in[dset]
-
-            self._create_dset(dset_out, ds_data.shape, ds_dtype,
-                              chunks=ds_chunks, attrs=ds_attrs, data=ds_data)
+                # native HDF5 object copy: data, chunks and attrs are copied
+                # chunk by chunk without loading the dataset into memory
+                f_in.h5.copy(f_in.h5[dset], self.h5, name=dset_out)
 
     def collect(self, source_files, dset, profiles=False):
         """
@@ -171,114 +171,357 @@ class MultiYear(Outputs):
 
         return source_dsets
 
-    def _update_dset(self, dset_out, dset_data):
+    @staticmethod
+    def _welford(arrays):
         """
-        Update dataset, create if needed
+        Single-pass (Welford) accumulation of the mean and standard
+        deviation of a sequence of equally shaped arrays.
 
         Parameters
         ----------
-        dset_out : str
-            Dataset name
-        dset_data : ndarray
-            Dataset data to write to disc
+        arrays : iterable
+            Iterable of arrays (e.g. one site block per year)
+
+        Returns
+        -------
+        means : ndarray
+            Element-wise mean of arrays (float32)
+        stdev : ndarray
+            Element-wise population standard deviation of arrays (float32)
         """
-        if dset_out in self.datasets:
-            logger.debug("- Updating {}".format(dset_out))
-            self[dset_out] = dset_data
+        n = 0
+        means = None
+        m2 = None
+        for arr in arrays:
+            arr = np.asarray(arr, dtype=np.float64)
+            n += 1
+            if means is None:
+                means = arr.copy()
+                m2 = np.zeros_like(arr)
+            else:
+                delta = arr - means
+                means += delta / n
+                m2 += delta * (arr - means)
+
+        if n == 0:
+            raise HandlerRuntimeError('No arrays to compute statistics from!')
+
+        stdev = np.sqrt(m2 / n)
+
+        return means.astype(np.float32), stdev.astype(np.float32)
+
+    @classmethod
+    def _block_stats(cls, sources, site_slice):
+        """
+        Compute the multi-year means and stdev for a block of sites by
+        streaming through the annual datasets one at a time.
+
+        Parameters
+        ----------
+        sources : list
+            List of (h5_file, dset, group) for every annual dataset.
+        site_slice : slice
+            Block of sites to compute statistics for.
+
+        Returns
+        -------
+        means : ndarray
+            Multi-year means for the site block
+        stdev : ndarray
+            Multi-year standard deviations for the site block
+        """
+        def _read():
+            for h5_file, dset, group in sources:
+                with Outputs(h5_file, mode='r', group=group) as f:
+                    yield cls._read_block(f, dset, site_slice)
+
+        return cls._welford(_read())
+
+    @staticmethod
+    def _read_block(f, dset, site_slice):
+        """
+        Read a block of sites from a scalar or profile dataset.
+
+        Parameters
+        ----------
+        f : reV.handlers.outputs.Outputs
+            Open handler to read from
+        dset : str
+            Dataset to read
+        site_slice : slice
+            Block of sites to read
+
+        Returns
+        -------
+        arr : ndarray
+            Unscaled site block (sites are the last axis)
+        """
+        if len(f.h5[dset].shape) == 1:
+            return f[dset, site_slice]
         else:
-            logger.debug("- Creating {}".format(dset_out))
-            source_dset = self._get_source_dsets(dset_out)[0]
-            _, ds_dtype, ds_chunks = self.get_dset_properties(source_dset)
-            ds_attrs = self.get_attrs(dset=source_dset)
-            self._add_dset(dset_out, dset_data, ds_dtype,
-                           chunks=ds_chunks, attrs=ds_attrs)
+            return f[dset, :, site_slice]
 
-    def _compute_means(self, dset_out):
+    def _write_block(self, dset_out, arr, site_slice):
         """
-        Compute multi-year means for given dataset
+        Write a block of sites to a scalar or profile dataset.
 
         Parameters
         ----------
         dset_out : str
-            Multi-year means dataset name
+            Dataset to write to
+        arr : ndarray
+            Site block data (sites are the last axis)
+        site_slice : slice
+            Block of sites to write to
+        """
+        if arr.ndim == 1:
+            self[dset_out, site_slice] = arr
+        else:
+            self[dset_out, :, site_slice] = arr
+
+    def _init_stats_dsets(self, dset, source_dset):
+        """
+        Initialize the multi-year means and stdev datasets (if needed) with
+        the shape, dtype, chunks and attributes of an annual dataset.
+
+        Parameters
+        ----------
+        dset : str
+            Dataset of interest
+        source_dset : str
+            Annual dataset to copy the dataset properties from
+        """
+        ds = self.h5[source_dset]
+        for stat in ('means', 'stdev'):
+            dset_out = "{}-{}".format(dset, stat)
+            if dset_out not in self.datasets:
+                logger.debug("- Creating {}".format(dset_out))
+                ds_out = self.h5.create_dataset(dset_out, shape=ds.shape,
+                                                dtype=ds.dtype,
+                                                chunks=ds.chunks)
+                for key, value in ds.attrs.items():
+                    ds_out.attrs[key] = value
+
+    def _get_sources(self, dset, source_dsets, source_files=None):
+        """
+        Get the files to stream the annual datasets from. Annual source files
+        are used when they cover every annual dataset so that reader
+        processes never open the multi-year file while it is being written.
+
+        Parameters
+        ----------
+        dset : str
+            Dataset of interest
+        source_dsets : list
+            Annual datasets in the multi-year file
+        source_files : list | None
+            Annual .h5 files that the annual datasets were collected from
 
         Returns
         -------
-        my_means : ndarray
-            Array of multi-year means
+        sources : list | None
+            List of (h5_file, dset, group) for every annual dataset, None if
+            the annual source files do not cover all annual datasets.
         """
-        source_dsets = self._get_source_dsets(dset_out)
-        logger.debug('\t- Computing {} from {}'.format(dset_out, source_dsets))
+        if source_files is None:
+            return None
+
+        file_map = {self._create_dset_name(fp, dset): fp
+                    for fp in source_files}
+        if not all(ds in file_map for ds in source_dsets):
+            return None
+
+        return [(file_map[ds], dset, None) for ds in source_dsets]
 
-        my_means = np.zeros(len(self), dtype='float32')
+    def _check_shapes(self, source_dsets):
+        """
+        Check that all annual datasets have the same shape and cover all
+        sites in the multi-year file.
+
+        Parameters
+        ----------
+        source_dsets : list
+            Annual datasets in the multi-year file
+
+        Returns
+        -------
+        shape : tuple
+            Shape of the annual datasets
+        """
+        shape = self.h5[source_dsets[0]].shape
         for ds in source_dsets:
-            if self.h5[ds].shape == my_means.shape:
-                my_means += self[ds]
-            else:
+            if self.h5[ds].shape != shape or shape[-1] != len(self):
                 raise HandlerRuntimeError("{} shape {} should be {}"
                                           .format(ds, self.h5[ds].shape,
-                                                  my_means.shape))
-        my_means /= len(source_dsets)
-        self._update_dset(dset_out, my_means)
+                                                  shape))
 
-        return my_means
+        return shape
 
-    def means(self, dset):
+    @staticmethod
+    def _get_site_blocks(shape, mem_util_lim=0.7, max_workers=1):
         """
-        Extract or compute multi-year means for given source dset
+        Split the sites into blocks that fit in memory across all workers.
 
         Parameters
         ----------
-        dset : str
-            Dataset of interest
+        shape : tuple
+            Shape of the annual datasets (sites are the last axis)
+        mem_util_lim : float
+            Memory utilization limit (fractional).
+        max_workers : int
+            Number of workers that hold a site block in memory at once.
 
         Returns
         -------
-        my_means : ndarray
-            Array of multi-year means for dataset of interest
+        blocks : list
+            List of site slices.
         """
-        my_dset = "{}-means".format(dset)
-        if my_dset in self.datasets:
-            my_means = self[my_dset]
-        else:
-            my_means = self._compute_means(my_dset)
+        # welford accumulators, a read block and a delta block per site
+        site_mem = 4 * np.prod(shape[:-1]) * np.dtype(np.float64).itemsize
+        mem_avail = mem_util_lim * psutil.virtual_memory().total
+        n_sites = shape[-1]
+        step = int(np.clip(mem_avail / (site_mem * max_workers), 1, n_sites))
+        blocks = [slice(i, min(i + step, n_sites))
+                  for i in range(0, n_sites, step)]
 
-        return my_means
+        logger.debug('\t- Streaming {} site blocks of up to {} sites on {} '
+                     'workers'.format(len(blocks), step, max_workers))
+
+        return blocks
 
-    def _compute_stdev(self, dset_out, means=None):
+    def _stream_block_stats(self, blocks, source_dsets, sources=None,
+                            max_workers=1):
         """
-        Compute multi-year standard deviation for given dataset
+        Compute the multi-year means and stdev for blocks of sites in serial
+        from the multi-year file or in parallel from the annual source files.
 
         Parameters
         ----------
-        dset_out : str
-            Multi-year stdev dataset name
+        blocks : list
+            List of site slices.
+        source_dsets : list
+            Annual datasets in the multi-year file
+        sources : list | None
+            List of (h5_file, dset, group) for every annual dataset, required
+            for parallel execution.
+        max_workers : int
+            Number of processes to compute site blocks in parallel.
+
+        Yields
+        ------
+        site_slice : slice
+            Block of sites
         means : ndarray
-            Array of pre-computed means
+            Multi-year means for the site block
+        stdev : ndarray
+            Multi-year standard deviations for the site block
+        """
+        if max_workers == 1:
+            for site_slice in blocks:
+                arrays = (self._read_block(self, ds, site_slice)
+                          for ds in source_dsets)
+                yield (site_slice, *self._welford(arrays))
+        else:
+            loggers = [__name__, 'reV']
+            with SpawnProcessPool(max_workers=max_workers,
+                                  loggers=loggers) as exe:
+                futures = {exe.submit(self._block_stats, sources,
+                                      site_slice): site_slice
+                           for site_slice in blocks}
+                for future in as_completed(futures):
+                    yield (futures[future], *future.result())
+
+    def _compute_stats(self, dset, mem_util_lim=0.7, max_workers=1,
+                       source_files=None):
+        """
+        Compute multi-year means and standard deviations for given dataset in
+        a single streaming pass over blocks of sites. If the multi-year file
+        is writable the "-means" and "-stdev" datasets are written block by
+        block, so memory use is bounded by the site block size.
+
+        Parameters
+        ----------
+        dset : str
+            Dataset of interest (scalar or profile)
+        mem_util_lim : float
+            Memory utilization limit (fractional). This sets how many sites
+            are processed at a time.
+        max_workers : int | None
+            Number of processes to compute site blocks in parallel. 1 runs
+            in serial, None uses all available cores. Parallel execution
+            requires the annual source_files.
+        source_files : list | None
+            Annual .h5 files that the annual datasets were collected from.
 
         Returns
         -------
-        my_stdev : ndarray
-            Array of multi-year standard deviations
+        my_means : ndarray | None
+            Array of multi-year means, None if it was written to disk.
+        my_stdev : ndarray | None
+            Array of multi-year standard deviations, None if it was written
+            to disk.
         """
-        if means is None:
-            means = self._compute_means("{}-means".format(dset_out))
+        source_dsets = self._get_source_dsets("{}-means".format(dset))
+        logger.debug('\t- Computing {} means and stdev from {}'
+                     .format(dset, source_dsets))
+        shape = self._check_shapes(source_dsets)
+
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        sources = self._get_sources(dset, source_dsets,
+                                    source_files=source_files)
+        if max_workers != 1 and sources is None:
+            logger.debug('Annual source files do not cover {}, computing '
+                         'multi-year statistics in serial'
+                         .format(source_dsets))
+            max_workers = 1
+
+        blocks = self._get_site_blocks(shape, mem_util_lim=mem_util_lim,
+                                       max_workers=max_workers)
+
+        my_means = my_stdev = None
+        if self.writable:
+            self._init_stats_dsets(dset, source_dsets[0])
+        else:
+            my_means = np.zeros(shape, dtype=np.float32)
+            my_stdev = np.zeros(shape, dtype=np.float32)
+
+        for site_slice, means, stdev in self._stream_block_stats(
+                blocks, source_dsets, sources=sources,
+                max_workers=max_workers):
+            if my_means is None:
+                self._write_block("{}-means".format(dset), means, site_slice)
+                self._write_block("{}-stdev".format(dset), stdev, site_slice)
+            else:
+                my_means[..., site_slice] = means
+                my_stdev[..., site_slice] = stdev
 
-        source_dsets = self._get_source_dsets(dset_out)
+        return my_means, my_stdev
 
-        my_stdev = np.zeros(means.shape, dtype='float32')
-        for ds in source_dsets:
-            if self.h5[ds].shape == my_stdev.shape:
-                my_stdev += (self[ds] - means)**2
-            else:
-                raise HandlerRuntimeError("{} shape {} should be {}"
-                                          .format(ds, self.h5[ds].shape,
-                                                  my_stdev.shape))
+    def means(self, dset):
+        """
+        Extract or compute multi-year means for given source dset
+
+        Parameters
+        ----------
+        dset : str
+            Dataset of interest
 
-        my_stdev = np.sqrt(my_stdev / len(source_dsets))
-        self._update_dset(dset_out, my_stdev)
+        Returns
+        -------
+        my_means : ndarray
+            Array of multi-year means for dataset of interest
+        """
+        my_dset = "{}-means".format(dset)
+        if my_dset in self.datasets:
+            my_means = self[my_dset]
+        else:
+            my_means, _ = self._compute_stats(dset)
+            if my_means is None:
+                my_means = self[my_dset]
 
-        return my_stdev
+        return my_means
 
     def stdev(self, dset):
         """
@@ -298,8 +541,9 @@ class MultiYear(Outputs):
         if my_dset in self.datasets:
             my_stdev = self[my_dset]
         else:
-            my_means = self.means(dset)
-            my_stdev = self._compute_stdev(my_dset, means=my_means)
+            _, my_stdev = self._compute_stats(dset)
+            if my_stdev is None:
+                my_stdev = self[my_dset]
 
         return my_stdev
 
@@ -349,7 +593,8 @@ class MultiYear(Outputs):
         return len(shape) == 2
 
     @classmethod
-    def collect_means(cls, my_file, source_files, dset, group=None):
+    def collect_means(cls, my_file, source_files, dset, group=None,
+                      mem_util_lim=0.7, max_workers=1):
         """
         Collect and compute multi-year means for given dataset
 
@@ -363,14 +608,21 @@ class MultiYear(Outputs):
             Dataset to collect
         group : str
             Group to collect datasets into
+        mem_util_lim : float
+            Memory utilization limit (fractional). This sets how many sites
+            are processed at a time when computing the multi-year statistics.
+        max_workers : int | None
+            Number of processes to compute the multi-year statistics with.
+            1 runs in serial, None uses all available cores.
         """
         logger.info('Collecting {} into {} '
                     'and computing multi-year means and standard deviations.'
                     .format(dset, my_file))
         with cls(my_file, mode='a', group=group) as my:
             my.collect(source_files, dset)
-            means = my._compute_means("{}-means".format(dset))
-            my._compute_stdev("{}-stdev".format(dset), means=means)
+            my._compute_stats(dset, mem_util_lim=mem_util_lim,
+                              max_workers=max_workers,
+                              source_files=source_files)
 
     @classmethod
     def collect_profiles(cls, my_file, source_files, dset, group=None):
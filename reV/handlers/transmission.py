@@ -670,9 +670,10 @@ class TransmissionCosts(TransmissionFeatures):
         ----------
         trans_table : str | pandas.DataFrame
             Path to .csv or .json containing supply curve transmission mapping
-        capacity : float
+        capacity : float | ndarray
             Capacity needed in MW, if None DO NOT check if connection is
-            possible
+            possible. Can be an array of capacities for every connection in
+            trans_table.
         line_tie_in_cost : float
             Cost of connecting to a transmission line in $/MW
         line_cost : float
@@ -693,28 +694,364 @@ class TransmissionCosts(TransmissionFeatures):
         Returns
         -------
         cost : ndarray
-            Cost of transmission in $/MW, if None indicates connection is
+            Cost of transmission in $/MW, NaN indicates connection is
             NOT possible
         """
         try:
-            feature = cls(trans_table,
-                          line_tie_in_cost=line_tie_in_cost,
-                          line_cost=line_cost,
-                          station_tie_in_cost=station_tie_in_cost,
-                          center_tie_in_cost=center_tie_in_cost,
-                          sink_tie_in_cost=sink_tie_in_cost,
-                          available_capacity=available_capacity,
-                          line_limited=line_limited)
-
-            costs = []
-            for _, row in trans_table.iterrows():
-                tm = row.get('transmission_multiplier', 1)
-                costs.append(feature.cost(row['trans_line_gid'],
-                                          row['dist_mi'], capacity=capacity,
-                                          transmission_multiplier=tm))
+            trans_table = cls._parse_table(trans_table)
+            if capacity is not None:
+                if 'avail_cap' in trans_table:
+                    avail_cap = trans_table['avail_cap']
+                else:
+                    kwargs = {'available_capacity': available_capacity}
+                    fc = TransmissionFeatures.feature_capacity(trans_table,
+                                                               **kwargs)
+                    fc = fc.set_index('trans_line_gid')['avail_cap']
+                    avail_cap = trans_table['trans_line_gid'].map(fc)
+
+            tie_in_costs = {'transline': line_tie_in_cost,
+                            'substation': station_tie_in_cost,
+                            'loadcen': center_tie_in_cost,
+                            'pcaloadcen': sink_tie_in_cost}
+            category = trans_table['category'].str.lower().values
+            tie_in_cost = np.zeros(len(trans_table), dtype=np.float64)
+            known = np.zeros(len(trans_table), dtype=bool)
+            for name, name_cost in tie_in_costs.items():
+                mask = category == name
+                tie_in_cost[mask] = name_cost
+                known |= mask
+
+            if not known.all():
+                msg = ("Do not recognize feature type(s) {}, tie_in_cost set "
+                       "to 0".format(np.unique(category[~known])))
+                logger.warning(msg)
+                warn(msg, HandlerWarning)
+
+            tm = 1
+            if 'transmission_multiplier' in trans_table:
+                tm = trans_table['transmission_multiplier'].values
+
+            distance = trans_table['dist_mi'].values.astype(np.float64)
+            costs = cls._calc_cost(distance, line_cost=line_cost,
+                                   tie_in_cost=tie_in_cost,
+                                   transmission_multiplier=tm)
+
+            if capacity is not None:
+                # features without available capacity (e.g. synthetic load
+                # centers) can always be connected to
+                avail_cap = pd.to_numeric(avail_cap, errors='coerce').values
+                costs[capacity > avail_cap] = np.nan
         except Exception:
             logger.exception("Error computing costs for all connections in {}"
                              .format(cls))
             raise
 
-        return np.array(costs, dtype='float32')
+        return costs.astype('float32')
+
+
+class TransmissionFeatureArrays:
+    """
+    Array backed copy of the TransmissionFeatures connection state used to
+    run the greedy supply curve connection loop. Substation capacities are
+    cached and only re-computed when one of their lines is drawn down.
+    Connection results are identical to TransmissionFeatures.connect.
+    """
+    FEATURE_TYPES = ('transline', 'substation', 'loadcen', 'pcaloadcen')
+
+    def __init__(self, trans_features):
+        """
+        Parameters
+        ----------
+        trans_features : TransmissionFeatures
+            TransmissionFeatures instance to copy the current feature
+            capacities and availability from
+        """
+        self._line_limited = trans_features._line_limited
+        features = trans_features._features
+        n_gids = len(trans_features._available_mask)
+
+        types = np.full((n_gids, ), -1, dtype=np.int8)
+        avail_cap = np.full((n_gids, ), np.nan, dtype=np.float64)
+        sub_lines = {}
+        for gid, feature in features.items():
+            gid = int(gid)
+            types[gid] = self.FEATURE_TYPES.index(feature['type'])
+            if feature.get('avail_cap') is not None:
+                avail_cap[gid] = feature['avail_cap']
+
+            if 'lines' in feature:
+                sub_lines[gid] = [int(line) for line in feature['lines']]
+
+        line_indptr, line_indices = self._make_csr(sub_lines, n_gids)
+        line_subs = {}
+        for gid, lines in sub_lines.items():
+            for line in lines:
+                line_subs.setdefault(line, []).append(gid)
+
+        sub_indptr, sub_indices = self._make_csr(line_subs, n_gids)
+
+        # the greedy loop indexes one scalar at a time, which is much faster
+        # on flat lists than on numpy arrays
+        self._types = types.tolist()
+        self._avail_cap = avail_cap.tolist()
+        self._available = trans_features._available_mask.tolist()
+        self._line_indptr = line_indptr.tolist()
+        self._line_indices = line_indices.tolist()
+        self._sub_indptr = sub_indptr.tolist()
+        self._sub_indices = sub_indices.tolist()
+        self._sub_cap = [None] * n_gids
+
+    def __repr__(self):
+        msg = "{} with {} features".format(self.__class__.__name__, len(self))
+        return msg
+
+    def __len__(self):
+        return sum(1 for t in self._types if t >= 0)
+
+    @staticmethod
+    def _make_csr(adjacency, n_gids):
+        """
+        Convert an adjacency dictionary to compressed sparse row arrays
+
+        Parameters
+        ----------
+        adjacency : dict
+            Dictionary mapping feature gids to a list of neighboring gids
+        n_gids : int
+            Number of rows (max feature gid + 1)
+
+        Returns
+        -------
+        indptr : ndarray
+            Row pointers, neighbors of gid i are indices[indptr[i]:
+            indptr[i + 1]]
+        indices : ndarray
+            Neighboring gids
+        """
+        counts = np.zeros((n_gids, ), dtype=np.int64)
+        for gid, neighbors in adjacency.items():
+            counts[gid] = len(neighbors)
+
+        indptr = np.zeros((n_gids + 1, ), dtype=np.int64)
+        indptr[1:] = np.cumsum(counts)
+        indices = np.zeros((indptr[-1], ), dtype=np.int64)
+        for gid, neighbors in adjacency.items():
+            indices[indptr[gid]:indptr[gid + 1]] = neighbors
+
+        return indptr, indices
+
+    @property
+    def avail_cap(self):
+        """
+        Available capacity of all features, NaN for substations and
+        synthetic load centers
+
+        Returns
+        -------
+        ndarray
+        """
+        return np.array(self._avail_cap, dtype=np.float64)
+
+    @property
+    def available_mask(self):
+        """
+        Boolean availability mask indexed by feature gid
+
+        Returns
+        -------
+        ndarray
+        """
+        return np.array(self._available, dtype=bool)
+
+    def _get_lines(self, gid):
+        """
+        Get the transmission lines connected to a substation
+
+        Parameters
+        ----------
+        gid : int
+            Substation gid
+
+        Returns
+        -------
+        list
+            Line gids in the order of the substation definition
+        """
+        return self._line_indices[self._line_indptr[gid]:
+                                  self._line_indptr[gid + 1]]
+
+    def _substation_capacity(self, gid):
+        """
+        Get the (cached) available capacity of a substation, see
+        TransmissionFeatures._substation_capacity
+
+        Parameters
+        ----------
+        gid : int
+            Substation gid
+
+        Returns
+        -------
+        avail_cap : float
+            Substation available capacity
+        """
+        avail_cap = self._sub_cap[gid]
+        if avail_cap is None:
+            line_caps = [self._avail_cap[line]
+                         for line in self._get_lines(gid)]
+            avail_cap = sum(line_caps) / 2
+
+            if self._line_limited:
+                max_cap = max(line_caps) / 2
+                if max_cap < avail_cap:
+                    avail_cap = max_cap
+
+            self._sub_cap[gid] = avail_cap
+
+        return avail_cap
+
+    def available_capacity(self, gid):
+        """
+        Get available capacity for given feature
+
+        Parameters
+        ----------
+        gid : int
+            Unique id of feature of interest
+
+        Returns
+        -------
+        avail_cap : float | None
+            Available capacity, None for synthetic load centers
+        """
+        feature_type = self._types[gid]
+        if feature_type == 1:
+            avail_cap = self._substation_capacity(gid)
+        elif feature_type == 3:
+            avail_cap = None
+        elif feature_type >= 0:
+            avail_cap = self._avail_cap[gid]
+        else:
+            msg = "Invalid feature gid {}".format(gid)
+            logger.error(msg)
+            raise HandlerKeyError(msg)
+
+        return avail_cap
+
+    def _connect(self, gid, capacity):
+        """
+        Decrement a standalone feature's available capacity and invalidate
+        the cached capacity of the substations it feeds
+
+        Parameters
+        ----------
+        gid : int
+            Feature gid to connect to
+        capacity : float
+            Capacity needed in MW
+        """
+        avail_cap = self._avail_cap[gid]
+        if avail_cap < capacity:
+            msg = ("Cannot connect to {}: "
+                   "needed capacity({} MW) > "
+                   "available capacity({} MW)"
+                   .format(gid, capacity, avail_cap))
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+        self._avail_cap[gid] = avail_cap - capacity
+        for i in range(self._sub_indptr[gid], self._sub_indptr[gid + 1]):
+            self._sub_cap[self._sub_indices[i]] = None
+
+    def _connect_to_substation(self, gid, capacity):
+        """
+        Spread capacity over the lines of a substation, see
+        TransmissionFeatures._connect_to_substation
+
+        Parameters
+        ----------
+        gid : int
+            Substation gid
+        capacity : float
+            Capacity needed in MW
+        """
+        line_gids = self._get_lines(gid)
+        line_caps = [self._avail_cap[line] for line in line_gids]
+        if self._line_limited:
+            self._connect(line_gids[np.argmax(line_caps)], capacity)
+            return
+
+        line_gids = [line for line, cap in zip(line_gids, line_caps)
+                     if cap != 0]
+        line_caps = [cap for cap in line_caps if cap != 0]
+        while line_gids:
+            apply_cap = capacity / len(line_gids)
+            full = [cap < apply_cap for cap in line_caps]
+            if not any(full):
+                break
+
+            for line, cap, filled in zip(line_gids, line_caps, full):
+                if filled:
+                    self._connect(line, cap)
+                    capacity -= cap
+
+            line_gids = [line for line, filled in zip(line_gids, full)
+                         if not filled]
+            line_caps = [cap for cap, filled in zip(line_caps, full)
+                         if not filled]
+
+        if line_gids:
+            apply_cap = capacity / len(line_gids)
+            for line in line_gids:
+                self._connect(line, apply_cap)
+
+    def connect(self, gid, capacity):
+        """
+        Connect capacity to the given feature if possible and update the
+        feature state
+
+        Parameters
+        ----------
+        gid : int
+            Unique id of feature of intereset
+        capacity : float
+            Capacity needed in MW
+
+        Returns
+        -------
+        connected : bool
+            Flag as to whether the connection was made
+        """
+        if not self._available[gid]:
+            return False
+
+        avail_cap = self.available_capacity(gid)
+        if avail_cap is not None and capacity > avail_cap:
+            return False
+
+        feature_type = self._types[gid]
+        if feature_type == 1:
+            self._connect_to_substation(gid, capacity)
+        elif feature_type != 3:
+            self._connect(gid, capacity)
+
+        if self.available_capacity(gid) == 0:
+            self._available[gid] = False
+
+        return True
+
+    def update_features(self, trans_features):
+        """
+        Write the connection state back to a TransmissionFeatures instance
+
+        Parameters
+        ----------
+        trans_features : TransmissionFeatures
+            TransmissionFeatures instance this object was created from
+        """
+        avail_cap = self.avail_cap
+        for gid, feature in trans_features._features.items():
+            if feature.get('avail_cap') is not None:
+                feature['avail_cap'] = avail_cap[int(gid)]
+
+        trans_features._available_mask[:] = self._available
@@ -116,6 +116,7 @@ def from_config(ctx, config_file, verbose):
                            n_profiles=config.n_profiles,
                            max_workers=config.execution_control.max_workers,
                            aggregate_profiles=config.aggregate_profiles,
+                           sweep=config.sweep,
                            verbose=verbose)
 
         elif config.execution_control.option in ('eagle', 'slurm'):
@@ -132,6 +133,7 @@ def from_config(ctx, config_file, verbose):
             ctx.obj['LOG_DIR'] = config.logdir
             ctx.obj['MAX_WORKERS'] = config.execution_control.max_workers
             ctx.obj['AGGREGATE_PROFILES'] = config.aggregate_profiles
+            ctx.obj['SWEEP'] = config.sweep
             ctx.obj['VERBOSE'] = verbose
 
             ctx.invoke(slurm,
@@ -177,12 +179,16 @@ def from_config(ctx, config_file, verbose):
               'profile for each supply curve point. This behavior is instead '
               'of finding the single profile per region closest to the '
               'meanoid.')
+@click.option('-sw', '--sweep', is_flag=True,
+              help='Flag to compute the rep profiles of all regions in a '
+              'single chunked pass over cf_dset. Only available for the '
+              'meanoid rep_method.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
 @click.pass_context
 def direct(ctx, gen_fpath, rev_summary, reg_cols, cf_dset, rep_method,
            err_method, weight, n_profiles, out_dir, log_dir, max_workers,
-           aggregate_profiles, verbose):
+           aggregate_profiles, sweep, verbose):
     """reV representative profiles CLI."""
     name = ctx.obj['NAME']
     ctx.obj['GEN_FPATH'] = gen_fpath
@@ -197,6 +203,7 @@ def direct(ctx, gen_fpath, rev_summary, reg_cols, cf_dset, rep_method,
     ctx.obj['LOG_DIR'] = log_dir
     ctx.obj['MAX_WORKERS'] = max_workers
     ctx.obj['AGGREGATE_PROFILES'] = aggregate_profiles
+    ctx.obj['SWEEP'] = sweep
     ctx.obj['VERBOSE'] = verbose
 
     if ctx.invoked_subcommand is None:
@@ -215,7 +222,7 @@ def direct(ctx, gen_fpath, rev_summary, reg_cols, cf_dset, rep_method,
             RepProfiles.run(gen_fpath, rev_summary, reg_cols, cf_dset=cf_dset,
                             rep_method=rep_method, err_method=err_method,
                             weight=weight, fout=fout, n_profiles=n_profiles,
-                            max_workers=max_workers)
+                            max_workers=max_workers, sweep=sweep)
 
         runtime = (time.time() - t0) / 60
         logger.info('reV representative profiles complete. '
@@ -231,7 +238,7 @@ def direct(ctx, gen_fpath, rev_summary, reg_cols, cf_dset, rep_method,
 
 def get_node_cmd(name, gen_fpath, rev_summary, reg_cols, cf_dset, rep_method,
                  err_method, weight, n_profiles, out_dir, log_dir, max_workers,
-                 aggregate_profiles, verbose):
+                 aggregate_profiles, sweep, verbose):
     """Get a CLI call command for the rep profiles cli."""
 
     args = ('-g {gen_fpath} '
@@ -263,6 +270,9 @@ def get_node_cmd(name, gen_fpath, rev_summary, reg_cols, cf_dset, rep_method,
     if aggregate_profiles:
         args += '-agg '
 
+    if sweep:
+        args += '-sw '
+
     if verbose:
         args += '-v '
 
@@ -307,6 +317,7 @@ def slurm(ctx, alloc, memory, walltime, feature, conda_env, module,
     log_dir = ctx.obj['LOG_DIR']
     max_workers = ctx.obj['MAX_WORKERS']
     aggregate_profiles = ctx.obj['AGGREGATE_PROFILES']
+    sweep = ctx.obj.get('SWEEP', False)
     verbose = ctx.obj['VERBOSE']
 
     if stdout_path is None:
@@ -315,7 +326,7 @@ def slurm(ctx, alloc, memory, walltime, feature, conda_env, module,
     cmd = get_node_cmd(name, gen_fpath, rev_summary, reg_cols, cf_dset,
                        rep_method, err_method, weight, n_profiles,
                        out_dir, log_dir, max_workers, aggregate_profiles,
-                       verbose)
+                       sweep, verbose)
 
     status = Status.retrieve_job_status(out_dir, 'rep-profiles', name)
     if status == 'successful':
@@ -13,7 +13,7 @@ import logging
 import numpy as np
 import os
 import pandas as pd
-from scipy import stats
+from scipy import sparse, stats
 from warnings import warn
 
 
@@ -976,6 +976,224 @@ class RepProfiles(RepProfilesBase):
                         self._meta.at[i, 'rep_gen_gid'] = str(ggids)
                         self._meta.at[i, 'rep_res_gid'] = str(rgids)
 
+    @staticmethod
+    def _flatten_col(rev_summary, col):
+        """Flatten a (possibly jsonified list) column of the rev summary
+        keeping track of the number of entries in each row.
+
+        Parameters
+        ----------
+        rev_summary : pd.DataFrame
+            Aggregated rev supply curve summary table.
+        col : str
+            Column label to extract flattened data from (gen_gids,
+            gid_counts, etc...)
+
+        Returns
+        -------
+        data : list
+            Flat list of data from the column with label "col".
+        counts : np.ndarray
+            Number of entries contributed by each row of rev_summary.
+        """
+        data = rev_summary[col].values.tolist()
+        if any(data) and isinstance(data[0], str):
+            if (']' in data[0]) or (')' in data[0]):
+                data = [json.loads(s) for s in data]
+
+        data = [d if isinstance(d, (list, tuple)) else [d] for d in data]
+        counts = np.array([len(d) for d in data], dtype=np.int64)
+        data = [a for b in data for a in b]
+
+        return data, counts
+
+    def _get_region_weights(self):
+        """Get the sparse region x gen_gid weighting matrix that maps cf
+        profiles to the weighted meanoid of every region.
+
+        Returns
+        -------
+        regions : np.ndarray
+            Region (meta index) of every flattened rev summary entry.
+        gen_gids : list
+            Generation gid of every flattened rev summary entry.
+        res_gids : list | None
+            Resource gid of every flattened rev summary entry, None if
+            gid_col is not "gen_gids".
+        gids : np.ndarray
+            Sorted unique generation gids, columns of the weight matrix.
+        cols : np.ndarray
+            Column in the weight matrix of every flattened entry.
+        weights : scipy.sparse.csr_matrix
+            (regions, gids) matrix of normalized weights.
+        """
+        regions = self._rev_summary.groupby(self._reg_cols).ngroup()
+        regions = regions.fillna(-1).values.astype(np.int64)
+
+        gen_gids, counts = self._flatten_col(self._rev_summary, self._gid_col)
+        regions = np.repeat(regions, counts)
+
+        if self._weight is None:
+            weights = np.ones(len(gen_gids), dtype=np.float64)
+        else:
+            weights, w_counts = self._flatten_col(self._rev_summary,
+                                                  self._weight)
+            if not np.array_equal(counts, w_counts):
+                e = ('Weights column "{}" does not have the same number of '
+                     'entries as gid column "{}" in every row of the '
+                     'rev summary.'.format(self._weight, self._gid_col))
+                logger.error(e)
+                raise DataShapeError(e)
+
+            weights = np.array(weights, dtype=np.float64)
+
+        res_gids = None
+        if self._gid_col == 'gen_gids':
+            res_gids = self._flatten_col(self._rev_summary, 'res_gids')[0]
+
+        valid = regions >= 0
+        gids, cols = np.unique(np.array(gen_gids, dtype=np.int64)[valid],
+                               return_inverse=True)
+        reg_sum = np.bincount(regions[valid], weights=weights[valid],
+                              minlength=len(self.meta))
+        weights = weights[valid] / reg_sum[regions[valid]]
+        weights = sparse.csr_matrix((weights, (regions[valid], cols)),
+                                    shape=(len(self.meta), len(gids)))
+
+        if not valid.all():
+            gen_gids = [g for g, v in zip(gen_gids, valid) if v]
+            if res_gids is not None:
+                res_gids = [g for g, v in zip(res_gids, valid) if v]
+
+        return regions[valid], gen_gids, res_gids, gids, cols, weights
+
+    def _sweep_errors(self, regions, gids, cols, weights, max_mem=1e9):
+        """Stream the cf profiles once in chunk-aligned time blocks and
+        compute every region's meanoid and the error of every entry vs. the
+        meanoid of its region.
+
+        Parameters
+        ----------
+        regions : np.ndarray
+            Region (meta index) of every flattened rev summary entry.
+        gids : np.ndarray
+            Sorted unique generation gids to read.
+        cols : np.ndarray
+            Index in gids of every flattened entry.
+        weights : scipy.sparse.csr_matrix
+            (regions, gids) matrix of normalized weights.
+        max_mem : float
+            Approximate memory limit in bytes for one time block.
+
+        Returns
+        -------
+        errors : np.ndarray | None
+            Error of every entry vs. its region meanoid. None if err_method
+            is None, in which case the meanoids are written directly to the
+            rep profiles.
+        """
+        errors = None
+        if self._err_method is not None:
+            errors = np.zeros(len(cols), dtype=np.float64)
+
+        gid_slice = slice(int(gids[0]), int(gids[-1]) + 1)
+        i_gids = gids - gids[0]
+        with Resource(self._gen_fpath) as res:
+            shape, _, chunks = res.get_dset_properties(self._cf_dset)
+            n_time = shape[0]
+            width = (gid_slice.stop - gid_slice.start) + len(cols)
+            step = int(max_mem / (8 * (width + len(self.meta))))
+            if chunks is not None and step > chunks[0]:
+                step -= step % chunks[0]
+
+            step = int(np.clip(step, 1, n_time))
+            for t0 in range(0, n_time, step):
+                t1 = min(t0 + step, n_time)
+                logger.debug('Sweeping "{}" time steps {} through {} of {}'
+                             .format(self._cf_dset, t0, t1, n_time))
+                block = res[self._cf_dset, t0:t1, gid_slice]
+                block = block[:, i_gids].astype(np.float64)
+                means = weights.dot(block.T)
+
+                if errors is None:
+                    self._profiles[0][t0:t1] = means.T
+                else:
+                    diff = block[:, cols] - means[regions].T
+                    if self._err_method == 'mbe':
+                        errors += diff.sum(axis=0)
+                    elif self._err_method == 'mae':
+                        errors += np.abs(diff).sum(axis=0)
+                    else:
+                        errors += (diff ** 2).sum(axis=0)
+
+        if errors is not None:
+            errors /= n_time
+            if self._err_method == 'rmse':
+                errors = np.sqrt(errors)
+
+        return errors
+
+    def _run_sweep(self, max_mem=1e9):
+        """Compute all representative profiles in a single sweep over the
+        cf profiles of the generation file. The meanoid of every region is
+        computed with a sparse region x gen_gid weight matrix and the error
+        of every profile vs. its region meanoid is accumulated in the same
+        pass.
+
+        Parameters
+        ----------
+        max_mem : float
+            Approximate memory limit in bytes for one time block.
+        """
+        logger.info('Running {} rep profile calculations in a single sweep '
+                    'of "{}".'.format(len(self.meta), self._cf_dset))
+
+        out = self._get_region_weights()
+        regions, gen_gids, res_gids, gids, cols, weights = out
+        errors = self._sweep_errors(regions, gids, cols, weights,
+                                    max_mem=max_mem)
+        if errors is None:
+            return
+
+        order = np.argsort(regions, kind='stable')
+        indptr = np.zeros(len(self.meta) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(regions,
+                                           minlength=len(self.meta)))
+
+        rep_entries = {}
+        for i in range(len(self.meta)):
+            entries = order[indptr[i]:indptr[i + 1]]
+            if not len(entries):
+                logger.warning('Skipping profile {} out of {} with no valid '
+                               'gids.'.format(i + 1, len(self.meta)))
+                continue
+
+            i_reps = [RepresentativeMethods.nargmin(errors[entries], n)
+                      for n in range(self._n_profiles)]
+            rep_entries[i] = entries[i_reps]
+
+        rep_gids = np.concatenate(list(rep_entries.values()))
+        rep_gids = np.unique(np.array(gen_gids)[rep_gids])
+        with Resource(self._gen_fpath) as res:
+            rep_profiles = res[self._cf_dset, :, rep_gids.tolist()]
+
+        for i, entries in rep_entries.items():
+            ggids = [gen_gids[e] for e in entries]
+            rgids = [None]
+            if res_gids is not None:
+                rgids = [res_gids[e] for e in entries]
+
+            for n, gid in enumerate(ggids):
+                j = np.searchsorted(rep_gids, gid)
+                self._profiles[n][:, i] = rep_profiles[:, j]
+
+            if len(ggids) == 1:
+                self._meta.at[i, 'rep_gen_gid'] = ggids[0]
+                self._meta.at[i, 'rep_res_gid'] = rgids[0]
+            else:
+                self._meta.at[i, 'rep_gen_gid'] = str(ggids)
+                self._meta.at[i, 'rep_res_gid'] = str(rgids)
+
     def _run_parallel(self, max_workers=None, pool_size=72):
         """Compute all representative profiles in parallel.
 
@@ -1047,7 +1265,7 @@ class RepProfiles(RepProfilesBase):
                         self._meta.at[i, 'rep_res_gid'] = str(rgids)
 
     def _run(self, fout=None, save_rev_summary=True, scaled_precision=False,
-             max_workers=None):
+             max_workers=None, sweep=False):
         """
         Run representative profiles in serial or parallel and save to disc
 
@@ -1064,8 +1282,25 @@ class RepProfiles(RepProfilesBase):
         max_workers : int, optional
             Number of parallel workers. 1 will run serial, None will use all
             available., by default None
+        sweep : bool, optional
+            Flag to compute all regions in a single pass over cf_dset,
+            only available for the meanoid rep_method, by default False
         """
-        if max_workers == 1:
+        if sweep and (self._rep_method not in ('mean', 'meanoid')
+                      or self._err_method not in ('mbe', 'mae', 'rmse',
+                                                  None)):
+            msg = ('Single sweep rep profiles are only available for the '
+                   'meanoid rep_method with the mbe, mae, or rmse '
+                   'err_method, not "{}" and "{}". Falling back to '
+                   'region-by-region rep profiles.'
+                   .format(self._rep_method, self._err_method))
+            logger.warning(msg)
+            warn(msg)
+            sweep = False
+
+        if sweep:
+            self._run_sweep()
+        elif max_workers == 1:
             self._run_serial()
         else:
             self._run_parallel(max_workers=max_workers)
@@ -1080,7 +1315,8 @@ class RepProfiles(RepProfilesBase):
     def run(cls, gen_fpath, rev_summary, reg_cols, gid_col='gen_gids',
             cf_dset='cf_profile', rep_method='meanoid', err_method='rmse',
             weight='gid_counts', n_profiles=1, fout=None,
-            save_rev_summary=True, scaled_precision=False, max_workers=None):
+            save_rev_summary=True, scaled_precision=False, max_workers=None,
+            sweep=False):
         """Run representative profiles by finding the closest single profile
         to the weighted meanoid for each SC region.
 
@@ -1121,6 +1357,12 @@ class RepProfiles(RepProfilesBase):
         max_workers : int, optional
             Number of parallel workers. 1 will run serial, None will use all
             available., by default None
+        sweep : bool, optional
+            Flag to build a sparse region x gen_gid weight matrix and compute
+            the meanoid and errors of all regions in a single chunked pass
+            over cf_dset instead of reading the profiles of every region
+            separately. Only available for the meanoid rep_method,
+            by default False
 
         Returns
         -------
@@ -1139,7 +1381,8 @@ class RepProfiles(RepProfilesBase):
                  n_profiles=n_profiles, weight=weight)
 
         rp._run(fout=fout, save_rev_summary=save_rev_summary,
-                scaled_precision=scaled_precision, max_workers=max_workers)
+                scaled_precision=scaled_precision, max_workers=max_workers,
+                sweep=sweep)
 
         return rp._profiles, rp._meta, rp._time_index
 
@@ -29,7 +29,8 @@ class AbstractAggFileHandler(ABC):
     """Simple framework to handle aggregation file context managers."""
 
     def __init__(self, excl_fpath, excl_dict=None, area_filter_kernel='queen',
-                 min_area=None, check_excl_layers=False):
+                 min_area=None, check_excl_layers=False, excl_cache_dir=None,
+                 excl_area=0.0081):
         """
         Parameters
         ----------
@@ -44,13 +45,20 @@ class AbstractAggFileHandler(ABC):
         check_excl_layers : bool
             Run a pre-flight check on each exclusion layer to ensure they
             contain un-excluded values
+        excl_cache_dir : str | None
+            Optional directory to cache the full-domain inclusion mask in.
+            None will generate the inclusion mask for every SC point.
+        excl_area : float
+            Area of an exclusion pixel in km2 for the contiguous area filter.
         """
 
         self._excl_fpath = excl_fpath
         self._excl = ExclusionMaskFromDict(excl_fpath, layers_dict=excl_dict,
                                            min_area=min_area,
                                            kernel=area_filter_kernel,
-                                           check_layers=check_excl_layers)
+                                           check_layers=check_excl_layers,
+                                           cache_dir=excl_cache_dir,
+                                           excl_area=excl_area)
 
     def __enter__(self):
         return self
@@ -108,6 +108,7 @@ def from_config(ctx, config_file, verbose):
                        min_area=config.min_area,
                        friction_fpath=config.friction_fpath,
                        friction_dset=config.friction_dset,
+                       excl_cache_dir=config.excl_cache_dir,
                        out_dir=config.dirout,
                        log_dir=config.logdir,
                        verbose=verbose)
@@ -133,6 +134,7 @@ def from_config(ctx, config_file, verbose):
         ctx.obj['MIN_AREA'] = config.min_area
         ctx.obj['FRICTION_FPATH'] = config.friction_fpath
         ctx.obj['FRICTION_DSET'] = config.friction_dset
+        ctx.obj['EXCL_CACHE_DIR'] = config.excl_cache_dir
         ctx.obj['OUT_DIR'] = config.dirout
         ctx.obj['LOG_DIR'] = config.logdir
         ctx.obj['VERBOSE'] = verbose
@@ -200,6 +202,10 @@ def from_config(ctx, config_file, verbose):
               'paired with the --friction_dset input arg.')
 @click.option('--friction_dset', '-fd', type=STR, default=None,
               help='Optional friction surface dataset in friction_fpath.')
+@click.option('--excl_cache_dir', '-ecd', type=STR, default=None,
+              help='Optional directory to cache the full-domain inclusion '
+              'mask in. The cached mask is re-used by later runs with the '
+              'same exclusions, default is None (no cache).')
 @click.option('--out_dir', '-o', type=STR, default='./',
               help='Directory to save aggregation summary output.')
 @click.option('--log_dir', '-ld', type=STR, default='./logs/',
@@ -211,7 +217,7 @@ def direct(ctx, excl_fpath, gen_fpath, res_fpath, tm_dset, excl_dict,
            check_excl_layers, res_class_dset, res_class_bins, cf_dset,
            lcoe_dset, data_layers, resolution, excl_area, power_density,
            area_filter_kernel, min_area, friction_fpath, friction_dset,
-           out_dir, log_dir, verbose):
+           excl_cache_dir, out_dir, log_dir, verbose):
     """reV Supply Curve Aggregation Summary CLI."""
     name = ctx.obj['NAME']
     ctx.obj['EXCL_FPATH'] = excl_fpath
@@ -232,6 +238,7 @@ def direct(ctx, excl_fpath, gen_fpath, res_fpath, tm_dset, excl_dict,
     ctx.obj['MIN_AREA'] = min_area
     ctx.obj['FRICTION_FPATH'] = friction_fpath
     ctx.obj['FRICTION_DSET'] = friction_dset
+    ctx.obj['EXCL_CACHE_DIR'] = excl_cache_dir
     ctx.obj['OUT_DIR'] = out_dir
     ctx.obj['LOG_DIR'] = log_dir
     ctx.obj['VERBOSE'] = verbose
@@ -273,7 +280,8 @@ def direct(ctx, excl_fpath, gen_fpath, res_fpath, tm_dset, excl_dict,
                 min_area=min_area,
                 friction_fpath=friction_fpath,
                 friction_dset=friction_dset,
-                check_excl_layers=check_excl_layers)
+                check_excl_layers=check_excl_layers,
+                excl_cache_dir=excl_cache_dir)
 
         except Exception as e:
             logger.exception('Supply curve Aggregation failed. Received the '
@@ -310,7 +318,7 @@ def get_node_cmd(name, excl_fpath, gen_fpath, res_fpath, tm_dset, excl_dict,
                  check_excl_layers, res_class_dset, res_class_bins, cf_dset,
                  lcoe_dset, data_layers, resolution, excl_area, power_density,
                  area_filter_kernel, min_area, friction_fpath, friction_dset,
-                 out_dir, log_dir, verbose):
+                 excl_cache_dir, out_dir, log_dir, verbose):
     """Get a CLI call command for the SC aggregation cli."""
 
     args = ('-ef {excl_fpath} '
@@ -330,6 +338,7 @@ def get_node_cmd(name, excl_fpath, gen_fpath, res_fpath, tm_dset, excl_dict,
             '-ma {min_area} '
             '-ff {friction_fpath} '
             '-fd {friction_dset} '
+            '-ecd {excl_cache_dir} '
             '-o {out_dir} '
             '-ld {log_dir} '
             )
@@ -351,6 +360,7 @@ def get_node_cmd(name, excl_fpath, gen_fpath, res_fpath, tm_dset, excl_dict,
                        min_area=SLURM.s(min_area),
                        friction_fpath=SLURM.s(friction_fpath),
                        friction_dset=SLURM.s(friction_dset),
+                       excl_cache_dir=SLURM.s(excl_cache_dir),
                        out_dir=SLURM.s(out_dir),
                        log_dir=SLURM.s(log_dir),
                        )
@@ -406,6 +416,7 @@ def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
     min_area = ctx.obj['MIN_AREA']
     friction_fpath = ctx.obj['FRICTION_FPATH']
     friction_dset = ctx.obj['FRICTION_DSET']
+    excl_cache_dir = ctx.obj.get('EXCL_CACHE_DIR', None)
     out_dir = ctx.obj['OUT_DIR']
     log_dir = ctx.obj['LOG_DIR']
     verbose = ctx.obj['VERBOSE']
@@ -419,7 +430,7 @@ def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
                        cf_dset, lcoe_dset, data_layers,
                        resolution, excl_area,
                        power_density, area_filter_kernel, min_area,
-                       friction_fpath, friction_dset,
+                       friction_fpath, friction_dset, excl_cache_dir,
                        out_dir, log_dir, verbose)
 
     status = Status.retrieve_job_status(out_dir, 'supply-curve-aggregation',
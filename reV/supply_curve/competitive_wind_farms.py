@@ -33,10 +33,13 @@ class CompetitiveWindFarms:
         """
         self._wind_dirs = self._parse_wind_dirs(wind_dirs)
 
-        self._sc_gids, self._sc_point_gids, self._mask = \
-            self._parse_sc_points(sc_points, offshore=offshore)
+        out = self._parse_sc_points(sc_points, offshore=offshore)
+        self._sc_gids, self._sc_gid_indptr, self._sc_gid_indices = out
+        self._valid = np.diff(self._sc_gid_indptr) > 0
+        self._mask = self._valid.copy()
 
         self._offshore = offshore
+        self._n_dirs = n_dirs
 
         valid = np.isin(self.sc_point_gids, self._wind_dirs.index)
         if not np.all(valid):
@@ -46,17 +49,16 @@ class CompetitiveWindFarms:
             logger.error(msg)
             raise RuntimeError(msg)
 
-        mask = self._wind_dirs.index.isin(self._sc_point_gids.keys())
+        mask = self._wind_dirs.index.isin(self.sc_point_gids)
         self._wind_dirs = self._wind_dirs.loc[mask]
         self._upwind, self._downwind = self._get_neighbors(self._wind_dirs,
+                                                           len(self._mask),
                                                            n_dirs=n_dirs)
 
     def __repr__(self):
-        gids = len(self._upwind)
-        # pylint: disable=unsubscriptable-object
-        neighbors = len(self._upwind.values[0])
+        gids = np.count_nonzero(self._valid)
         msg = ("{} with {} sc_point_gids and {} prominent directions"
-               .format(self.__class__.__name__, gids, neighbors))
+               .format(self.__class__.__name__, gids, self._n_dirs))
 
         return msg
 
@@ -102,7 +104,7 @@ class CompetitiveWindFarms:
     def mask(self):
         """
         Supply curve point boolean mask, used for efficient exclusion
-        False == excluded sc_point_gid
+        False == excluded (or missing) sc_point_gid
 
         Returns
         -------
@@ -119,10 +121,7 @@ class CompetitiveWindFarms:
         -------
         ndarray
         """
-        sc_point_gids = np.array(list(self._sc_point_gids.keys()), dtype=int)
-        mask = self.mask[sc_point_gids]
-
-        return sc_point_gids[mask]
+        return np.where(self._valid & self._mask)[0]
 
     @property
     def sc_gids(self):
@@ -133,11 +132,7 @@ class CompetitiveWindFarms:
         -------
         ndarray
         """
-        sc_gids = \
-            np.concatenate([self._sc_point_gids[gid]
-                            for gid in self.sc_point_gids])
-
-        return sc_gids
+        return self.map_sc_point_gid_to_sc_gid(self.sc_point_gids)
 
     @staticmethod
     def _parse_table(table):
@@ -204,12 +199,13 @@ class CompetitiveWindFarms:
 
         Returns
         -------
-        sc_gids : pandas.DataFrame
-            sc_gid to sc_point_gid mapping
-        sc_point_gids : pandas.DataFrame
-            sc_point_gid to sc_gid mapping
-        mask : ndarray
-            Mask array to mask excluded sc_point_gids
+        sc_gids : ndarray
+            Dense sc_gid to sc_point_gid mapping, -1 for missing sc_gids
+        indptr : ndarray
+            CSR row pointers of the sc_point_gid to sc_gid mapping, sc_gids
+            of sc_point_gid i are indices[indptr[i]:indptr[i + 1]]
+        indices : ndarray
+            sc_gids sorted by sc_point_gid
         """
         sc_points = CompetitiveWindFarms._parse_table(sc_points)
         if 'offshore' in sc_points and not offshore:
@@ -218,21 +214,49 @@ class CompetitiveWindFarms:
             mask = sc_points['offshore'] == 0
             sc_points = sc_points.loc[mask]
 
-        mask = np.ones(int(1 + sc_points['sc_point_gid'].max()), dtype=bool)
+        sc_points = sc_points.drop_duplicates(subset='sc_gid')
+        sc_gid = sc_points['sc_gid'].values.astype(int)
+        sc_point_gid = sc_points['sc_point_gid'].values.astype(int)
 
-        sc_points = sc_points[['sc_gid', 'sc_point_gid']]
-        sc_gids = sc_points.set_index('sc_gid')
-        sc_gids = {k: int(v[0]) for k, v in sc_gids.iterrows()}
+        sc_gids = np.full((int(1 + sc_gid.max()), ), -1, dtype=int)
+        sc_gids[sc_gid] = sc_point_gid
 
-        sc_point_gids = \
-            sc_points.groupby('sc_point_gid')['sc_gid'].unique().to_frame()
-        sc_point_gids = {int(k): v['sc_gid']
-                         for k, v in sc_point_gids.iterrows()}
+        order = np.argsort(sc_point_gid, kind='stable')
+        counts = np.bincount(sc_point_gid)
+        indptr = np.zeros((len(counts) + 1, ), dtype=int)
+        indptr[1:] = np.cumsum(counts)
+        indices = sc_gid[order]
 
-        return sc_gids, sc_point_gids, mask
+        return sc_gids, indptr, indices
 
     @staticmethod
-    def _get_neighbors(wind_dirs, n_dirs=2):
+    def _csr_rows(indptr, indices, rows):
+        """
+        Extract and concatenate multiple rows from a CSR adjacency
+
+        Parameters
+        ----------
+        indptr : ndarray
+            CSR row pointers
+        indices : ndarray
+            CSR column indices
+        rows : ndarray
+            Rows to extract
+
+        Returns
+        -------
+        ndarray
+            Concatenated indices of the requested rows
+        """
+        starts = indptr[rows]
+        counts = indptr[rows + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        offsets += np.arange(counts.sum())
+
+        return indices[offsets]
+
+    @classmethod
+    def _get_neighbors(cls, wind_dirs, n_gids, n_dirs=2):
         """
         Parse prominent direction neighbors
 
@@ -241,15 +265,19 @@ class CompetitiveWindFarms:
         wind_dirs : pandas.DataFrame | str
             Neighboring supply curve point gids and power-rose value at each
             cardinal direction for each available sc point gid
+        n_gids : int
+            Number of sc_point_gid rows in the neighbor adjacency
         n_dirs : int, optional
             Number of prominent directions to use, by default 2
 
         Returns
         -------
-        upwind : pandas.DataFrame
-            Upwind neighbor gids for n prominent wind directions
-        downwind : pandas.DataFrame
-            Downwind neighbor gids for n prominent wind directions
+        upwind : tuple
+            CSR (indptr, indices) of the upwind neighbor gids for n
+            prominent wind directions for each sc_point_gid
+        downwind : tuple
+            CSR (indptr, indices) of the downwind neighbor gids for n
+            prominent wind directions for each sc_point_gid
         """
         cols = [c for c in wind_dirs
                 if (c.endswith('_gid') and not c.startswith('sc'))]
@@ -268,29 +296,72 @@ class CompetitiveWindFarms:
         downwind_gids = wind_dirs[cols].values
         downwind_gids = np.take_along_axis(downwind_gids, neighbors, axis=1)
 
-        downwind = {}
-        upwind = {}
-        for i, gid in enumerate(wind_dirs.index.values):
-            downwind[gid] = downwind_gids[i]
-            upwind[gid] = upwind_gids[i]
+        gids = wind_dirs.index.values.astype(int)
+        upwind = cls._make_neighbor_csr(gids, upwind_gids, n_gids)
+        downwind = cls._make_neighbor_csr(gids, downwind_gids, n_gids)
 
         return upwind, downwind
 
+    @staticmethod
+    def _make_neighbor_csr(gids, neighbors, n_gids):
+        """
+        Convert a (gids x n_dirs) neighbor array into a CSR adjacency over
+        sc_point_gid
+
+        Parameters
+        ----------
+        gids : ndarray
+            sc_point_gid of each row in neighbors
+        neighbors : ndarray
+            (n, n_dirs) array of neighboring sc_point_gids
+        n_gids : int
+            Number of sc_point_gid rows in the adjacency
+
+        Returns
+        -------
+        indptr : ndarray
+            CSR row pointers
+        indices : ndarray
+            Neighboring sc_point_gids
+        """
+        neighbors = neighbors[np.argsort(gids, kind='stable')]
+        if np.issubdtype(neighbors.dtype, np.floating):
+            neighbors = np.where(np.isnan(neighbors), -1, neighbors)
+
+        counts = np.zeros((n_gids, ), dtype=int)
+        counts[gids] = neighbors.shape[1]
+        indptr = np.zeros((n_gids + 1, ), dtype=int)
+        indptr[1:] = np.cumsum(counts)
+        indices = neighbors.astype(int).ravel()
+
+        return indptr, indices
+
     def map_sc_point_gid_to_sc_gid(self, sc_point_gid):
         """
         Map given sc_point_gid to equivalent sc_gid(s)
 
         Parameters
         ----------
-        sc_point_gid : int
-            Supply curve point gid to map to equivalent supply curve gid(s)
+        sc_point_gid : int | ndarray
+            Supply curve point gid(s) to map to equivalent supply curve
+            gid(s)
 
         Returns
         -------
-        int | list
+        ndarray
             Equivalent supply curve gid(s)
         """
-        return self._sc_point_gids[sc_point_gid]
+        if np.ndim(sc_point_gid):
+            sc_gids = self._csr_rows(self._sc_gid_indptr,
+                                     self._sc_gid_indices,
+                                     np.asarray(sc_point_gid, dtype=int))
+        else:
+            sc_point_gid = int(sc_point_gid)
+            sc_gids = self._sc_gid_indices[
+                self._sc_gid_indptr[sc_point_gid]:
+                self._sc_gid_indptr[sc_point_gid + 1]]
+
+        return sc_gids
 
     def map_sc_gid_to_sc_point_gid(self, sc_gid):
         """
@@ -306,7 +377,13 @@ class CompetitiveWindFarms:
         int
             Equivalent supply point curve gid
         """
-        return self._sc_gids[sc_gid]
+        sc_point_gid = self.check_sc_gid(sc_gid)
+        if sc_point_gid is None:
+            msg = "Invalid supply curve gid {}".format(sc_gid)
+            logger.error(msg)
+            raise KeyError(msg)
+
+        return sc_point_gid
 
     def check_sc_gid(self, sc_gid):
         """
@@ -325,8 +402,11 @@ class CompetitiveWindFarms:
             (offshore)
         """
         sc_point_gid = None
-        if sc_gid in self._sc_gids:
-            sc_point_gid = self._sc_gids[sc_gid]
+        sc_gid = int(sc_gid)
+        if 0 <= sc_gid < len(self._sc_gids):
+            sc_point_gid = int(self._sc_gids[sc_gid])
+            if sc_point_gid < 0:
+                sc_point_gid = None
 
         return sc_point_gid
 
@@ -340,10 +420,13 @@ class CompetitiveWindFarms:
             Supply point curve gid to get upwind neighbors
         Returns
         -------
-        int | list
+        ndarray
             upwind neighborings
         """
-        return self._upwind[sc_point_gid]
+        indptr, indices = self._upwind
+        sc_point_gid = int(sc_point_gid)
+
+        return indices[indptr[sc_point_gid]:indptr[sc_point_gid + 1]]
 
     def map_downwind(self, sc_point_gid):
         """
@@ -355,10 +438,13 @@ class CompetitiveWindFarms:
             Supply point curve gid to get downwind neighbors
         Returns
         -------
-        int | list
+        ndarray
             downwind neighborings
         """
-        return self._downwind[sc_point_gid]
+        indptr, indices = self._downwind
+        sc_point_gid = int(sc_point_gid)
+
+        return indices[indptr[sc_point_gid]:indptr[sc_point_gid + 1]]
 
     def exclude_sc_point_gid(self, sc_point_gid):
         """
@@ -375,14 +461,42 @@ class CompetitiveWindFarms:
         bool
             Flag if gid is valid and was masked
         """
-        if sc_point_gid in self._sc_point_gids:
+        sc_point_gid = int(sc_point_gid)
+        out = bool(0 <= sc_point_gid < len(self._valid)
+                   and self._valid[sc_point_gid])
+        if out:
             self._mask[sc_point_gid] = False
-            out = True
-        else:
-            out = False
 
         return out
 
+    def exclude_neighbors(self, sc_point_gid, downwind=False):
+        """
+        Exclude the prominent direction neighbors of a supply curve point
+
+        Parameters
+        ----------
+        sc_point_gid : int
+            Supply curve point gid whose neighbors should be masked
+        downwind : bool, optional
+            Flag to remove downwind neighbors as well as upwind neighbors,
+            by default False
+
+        Returns
+        -------
+        ndarray
+            Valid neighboring sc_point_gids that were masked (including
+            neighbors that had already been masked)
+        """
+        gids = self.map_upwind(sc_point_gid)
+        if downwind:
+            gids = np.concatenate((gids, self.map_downwind(sc_point_gid)))
+
+        gids = gids[(gids >= 0) & (gids < len(self._valid))]
+        gids = gids[self._valid[gids]]
+        self._mask[gids] = False
+
+        return gids
+
     def remove_noncompetitive_farm(self, sc_points, sort_on='total_lcoe',
                                    downwind=False):
         """
@@ -415,17 +529,10 @@ class CompetitiveWindFarms:
 
         sc_point_gids = sc_points['sc_point_gid'].values.astype(int)
 
-        for i in range(len(sc_points)):
-            gid = sc_point_gids[i]
-            if self.mask[gid]:
-                upwind_gids = self['upwind', gid]
-                for n in upwind_gids:
-                    self.exclude_sc_point_gid(n)
-
-                if downwind:
-                    downwind_gids = self['downwind', gid]
-                    for n in downwind_gids:
-                        self.exclude_sc_point_gid(n)
+        mask = self._mask
+        for gid in sc_point_gids.tolist():
+            if mask[gid]:
+                self.exclude_neighbors(gid, downwind=downwind)
 
         sc_gids = self.sc_gids
         mask = sc_points['sc_gid'].isin(sc_gids)
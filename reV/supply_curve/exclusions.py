@@ -3,8 +3,11 @@
 Generate reV inclusion mask from exclusion layers
 """
 from collections import OrderedDict
+import hashlib
+import json
 import logging
 import numpy as np
+import os
 from scipy import ndimage
 from warnings import warn
 
@@ -318,8 +321,13 @@ class ExclusionMask:
                           [1, 1, 1],
                           [0, 1, 0]])}
 
+    # target tile size (pixels per axis) when building the full inclusion
+    # mask, tiles are expanded to be aligned with the layer chunks
+    TILE_SIZE = 2048
+
     def __init__(self, excl_h5, layers=None, min_area=None,
-                 kernel='queen', hsds=False, check_layers=False):
+                 kernel='queen', hsds=False, check_layers=False,
+                 cache_dir=None, excl_area=0.0081):
         """
         Parameters
         ----------
@@ -337,11 +345,27 @@ class ExclusionMask:
         check_layers : bool
             Run a pre-flight check on each layer to ensure they contain
             un-excluded values
+        cache_dir : str | None
+            Optional directory to cache the full inclusion mask in. The mask
+            is built once for the whole domain in chunk-aligned tiles and
+            saved to a .npy file keyed by the exclusion layers, min_area,
+            and kernel. Mask requests are then read from the (memory-mapped)
+            cache file. Note that the contiguous area filter is applied to
+            the full domain when building the cache instead of to the
+            expanded window around each mask request. None will generate
+            masks from the exclusion layers on every request.
+        excl_area : float
+            Area of each exclusion pixel in km^2 for the contiguous area
+            filter, default assumes 90m resolution.
         """
         self._layers = OrderedDict()
         self._excl_h5 = ExclusionLayers(excl_h5, hsds=hsds)
         self._excl_layers = None
         self._check_layers = check_layers
+        self._hsds = hsds
+        self._cache_dir = cache_dir
+        self._cached_mask = None
+        self._excl_area = excl_area
 
         if layers is not None:
             if not isinstance(layers, list):
@@ -531,6 +555,66 @@ class ExclusionMask:
                 raise ExclusionLayerError(msg)
 
         self._layers[layer_name] = layer
+        self._cached_mask = None
+
+    @property
+    def cache_key(self):
+        """Get a unique hash for the inclusion mask defined by the exclusions
+        file, the layer definitions, min_area, kernel, and excl_area.
+
+        Returns
+        -------
+        str
+        """
+        h5_file = self.excl_h5.h5_file
+        key = {'excl_h5': h5_file,
+               'layers': [vars(layer) for layer in self.layers],
+               'min_area': self._min_area,
+               'kernel': self._kernel,
+               'excl_area': self._excl_area}
+        if not self._hsds:
+            key['excl_h5'] = os.path.abspath(h5_file)
+            key['mtime'] = os.path.getmtime(h5_file)
+
+        key = json.dumps(key, sort_keys=True, default=str)
+
+        return hashlib.md5(key.encode('utf-8')).hexdigest()
+
+    @property
+    def cache_fpath(self):
+        """Get the filepath to the cached inclusion mask.
+
+        Returns
+        -------
+        str | None
+            Filepath to the .npy inclusion mask cache file, None if no
+            cache_dir was input.
+        """
+        fpath = None
+        if self._cache_dir is not None:
+            fpath = os.path.join(self._cache_dir,
+                                 'inclusion_mask_{}.npy'
+                                 .format(self.cache_key))
+
+        return fpath
+
+    @property
+    def cached_mask(self):
+        """Get the memory-mapped full inclusion mask from the cache file. The
+        cache file will be built if it does not exist yet.
+
+        Returns
+        -------
+        np.memmap | None
+            Memory-mapped inclusion mask for the full exclusion domain, None
+            if no cache_dir was input or there are no layers to cache.
+        """
+        if (self._cached_mask is None and self._cache_dir is not None
+                and self.layers):
+            fpath = self.build_cache()
+            self._cached_mask = np.load(fpath, mmap_mode='r')
+
+        return self._cached_mask
 
     @property
     def nodata_lookup(self):
@@ -642,6 +726,139 @@ class ExclusionMask:
 
         return new_slice, sub_slice
 
+    def _get_halo(self, excl_area):
+        """Get the number of overlapping pixels needed around each mask tile
+        so that the contiguous area filter gives the same result as
+        filtering the full domain at once.
+
+        Parameters
+        ----------
+        excl_area : float
+            Area of each exclusion pixel in km^2.
+
+        Returns
+        -------
+        halo : int
+            Number of pixels to expand each tile by in every direction.
+        """
+        halo = 0
+        if self._min_area is not None:
+            halo = int(np.ceil(self._min_area / excl_area))
+
+        return halo
+
+    def _get_tile_shape(self):
+        """Get the mask tile shape aligned with the first layer's chunks.
+
+        Returns
+        -------
+        tile_shape : tuple
+            (rows, cols) shape of each tile.
+        """
+        tile_shape = (self.TILE_SIZE, self.TILE_SIZE)
+        layer_name = list(self.layer_names)[0]
+        chunks = self.excl_h5.h5[layer_name].chunks
+        if chunks is not None:
+            chunks = chunks[-2:]
+            tile_shape = tuple(int(np.ceil(self.TILE_SIZE / c) * c)
+                               for c in chunks)
+
+        return tile_shape
+
+    def _generate_tile(self, row_slice, col_slice, halo=0,
+                       excl_area=0.0081):
+        """Generate the inclusion mask for a single tile using a halo of
+        overlapping pixels for the contiguous area filter.
+
+        Parameters
+        ----------
+        row_slice : slice
+            Row slice of the tile in the full exclusion domain.
+        col_slice : slice
+            Column slice of the tile in the full exclusion domain.
+        halo : int
+            Number of pixels to expand the tile by in every direction before
+            applying the contiguous area filter.
+        excl_area : float
+            Area of each exclusion pixel in km^2 for the contiguous area
+            filter.
+
+        Returns
+        -------
+        mask : ndarray
+            Inclusion mask for the tile.
+        """
+        r0 = max(0, row_slice.start - halo)
+        c0 = max(0, col_slice.start - halo)
+        r1 = min(self.shape[0], row_slice.stop + halo)
+        c1 = min(self.shape[1], col_slice.stop + halo)
+
+        mask = self._combine_layers((slice(r0, r1), slice(c0, c1)))
+        if self._min_area is not None:
+            mask = self._area_filter(mask, min_area=self._min_area,
+                                     kernel=self._kernel,
+                                     excl_area=excl_area)
+
+        sub_slice = (slice(row_slice.start - r0, row_slice.stop - r0),
+                     slice(col_slice.start - c0, col_slice.stop - c0))
+
+        return mask[sub_slice]
+
+    def build_cache(self):
+        """Build the full-domain inclusion mask in chunk-aligned tiles and
+        save it to the cache directory. Does nothing if the cache file for
+        this inclusion mask already exists.
+
+        Returns
+        -------
+        fpath : str
+            Filepath to the .npy inclusion mask cache file.
+        """
+        if self._cache_dir is None:
+            msg = 'Cannot build inclusion mask cache without a cache_dir!'
+            logger.error(msg)
+            raise ExclusionLayerError(msg)
+
+        fpath = self.cache_fpath
+        if os.path.exists(fpath):
+            logger.debug('Using cached inclusion mask: {}'.format(fpath))
+            return fpath
+
+        if not os.path.exists(self._cache_dir):
+            os.makedirs(self._cache_dir, exist_ok=True)
+
+        halo = self._get_halo(self._excl_area)
+        tile_shape = self._get_tile_shape()
+        logger.info('Building inclusion mask cache "{}" with tile shape {} '
+                    'and halo of {} pixels.'.format(fpath, tile_shape, halo))
+
+        # write to a process-unique file so that concurrent builds of the
+        # same cache cannot collide, then move into place
+        tmp_fpath = fpath.replace('.npy', '_{}.tmp'.format(os.getpid()))
+        mask = np.lib.format.open_memmap(tmp_fpath, mode='w+',
+                                         dtype=np.float16, shape=self.shape)
+        try:
+            for r in range(0, self.shape[0], tile_shape[0]):
+                row_slice = slice(r, min(r + tile_shape[0], self.shape[0]))
+                for c in range(0, self.shape[1], tile_shape[1]):
+                    col_slice = slice(c, min(c + tile_shape[1],
+                                             self.shape[1]))
+                    mask[row_slice, col_slice] = self._generate_tile(
+                        row_slice, col_slice, halo=halo,
+                        excl_area=self._excl_area)
+
+            mask.flush()
+            del mask
+            os.replace(tmp_fpath, fpath)
+        except Exception:
+            logger.exception('Failed to build inclusion mask cache: {}'
+                             .format(fpath))
+            if os.path.exists(tmp_fpath):
+                os.remove(tmp_fpath)
+            raise
+
+        return fpath
+
     def _generate_ones_mask(self, ds_slice):
         """
         Generate mask of all ones
@@ -660,6 +877,33 @@ class ExclusionMask:
 
         return mask
 
+    def _combine_layers(self, ds_slice):
+        """
+        Combine all of the layer masks for a slice of the exclusion domain.
+
+        Parameters
+        ----------
+        ds_slice : tuple
+            dataset slice of interest along axis 0 and 1
+
+        Returns
+        -------
+        mask : ndarray
+            Multiplicative inclusion mask with all layers multiplied together
+            ("and" operation) without the contiguous area filter.
+        """
+        mask = None
+        for layer in self.layers:
+            layer_slice = (layer.layer, ) + ds_slice
+            layer_mask = layer[self.excl_h5[layer_slice]]
+
+            if mask is None:
+                mask = layer_mask
+            else:
+                mask = np.minimum(mask, layer_mask)
+
+        return mask
+
     def _generate_mask(self, *ds_slice):
         """
         Generate multiplicative inclusion mask from exclusion layers.
@@ -682,22 +926,19 @@ class ExclusionMask:
         if len(ds_slice) == 1 & isinstance(ds_slice[0], tuple):
             ds_slice = ds_slice[0]
 
+        if self.cached_mask is not None:
+            return np.array(self.cached_mask[ds_slice])
+
         if self._min_area is not None:
             ds_slice, sub_slice = self._increase_mask_slice(ds_slice, n=1)
 
         if self.layers:
-            for layer in self.layers:
-                layer_slice = (layer.layer, ) + ds_slice
-                layer_mask = layer[self.excl_h5[layer_slice]]
-
-                if mask is None:
-                    mask = layer_mask
-                else:
-                    mask = np.minimum(mask, layer_mask)
+            mask = self._combine_layers(ds_slice)
 
             if self._min_area is not None:
                 mask = self._area_filter(mask, min_area=self._min_area,
-                                         kernel=self._kernel)
+                                         kernel=self._kernel,
+                                         excl_area=self._excl_area)
                 mask = mask[sub_slice]
         else:
             if self._min_area is not None:
@@ -744,7 +985,8 @@ class ExclusionMaskFromDict(ExclusionMask):
     Class to initialize ExclusionMask from a dictionary defining layers
     """
     def __init__(self, excl_h5, layers_dict=None, min_area=None,
-                 kernel='queen', hsds=False, check_layers=False):
+                 kernel='queen', hsds=False, check_layers=False,
+                 cache_dir=None, excl_area=0.0081):
         """
         Parameters
         ----------
@@ -762,6 +1004,13 @@ class ExclusionMaskFromDict(ExclusionMask):
         check_layers : bool
             Run a pre-flight check on each layer to ensure they contain
             un-excluded values
+        cache_dir : str | None
+            Optional directory to cache the full inclusion mask in,
+            see ExclusionMask. None will generate masks from the exclusion
+            layers on every request.
+        excl_area : float
+            Area of each exclusion pixel in km^2 for the contiguous area
+            filter, default assumes 90m resolution.
         """
         if layers_dict is not None:
             layers = []
@@ -771,7 +1020,8 @@ class ExclusionMaskFromDict(ExclusionMask):
             layers = None
 
         super().__init__(excl_h5, layers=layers, min_area=min_area,
-                         kernel=kernel, hsds=hsds, check_layers=check_layers)
+                         kernel=kernel, hsds=hsds, check_layers=check_layers,
+                         cache_dir=cache_dir, excl_area=excl_area)
 
     @classmethod
     def run(cls, excl_h5, layers_dict=None, min_area=None,
@@ -5,6 +5,7 @@ Created on Fri Jun 21 13:24:31 2019
 
 @author: gbuster
 """
+import copy
 import logging
 import numpy as np
 import pandas as pd
@@ -98,6 +99,8 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
         self._pd_obj = None
         self._power_density = power_density
         self._friction_layer = friction_layer
+        self._friction_data = None
+        self._data_layer_cache = {}
 
         super().__init__(gid, excl, gen, tm_dset, gen_index,
                          excl_dict=excl_dict, resolution=resolution,
@@ -309,11 +312,11 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
             the SC domain. If friction layer is not input to this class,
             None is returned.
         """
-        friction_data = None
-        if self._friction_layer is not None:
-            friction_data = self._friction_layer[self.rows, self.cols]
+        if (self._friction_layer is not None
+                and self._friction_data is None):
+            self._friction_data = self._friction_layer[self.rows, self.cols]
 
-        return friction_data
+        return self._friction_data
 
     @property
     def power_density(self):
@@ -397,13 +400,7 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
         if data_layers is not None:
             for name, attrs in data_layers.items():
 
-                if 'fobj' not in attrs:
-                    with ExclusionLayers(attrs['fpath']) as f:
-                        raw = f[attrs['dset'], self.rows, self.cols]
-                        nodata = f.get_nodata_value(attrs['dset'])
-                else:
-                    raw = attrs['fobj'][attrs['dset'], self.rows, self.cols]
-                    nodata = attrs['fobj'].get_nodata_value(attrs['dset'])
+                raw, nodata = self._get_data_layer(name, attrs)
 
                 data = raw.flatten()[self.bool_mask]
                 excl_mult = self.excl_data_flat[self.bool_mask]
@@ -437,6 +434,39 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
 
         return summary
 
+    def _get_data_layer(self, name, attrs):
+        """Get the raw data for a data layer in the full SC point extent.
+        The data is cached so that it is only read once for all resource
+        classes in this SC point.
+
+        Parameters
+        ----------
+        name : str
+            Data layer label name.
+        attrs : dict
+            Data layer attributes with "dset" and "fpath" or "fobj".
+
+        Returns
+        -------
+        raw : np.ndarray
+            2D data layer array in the SC point extent (no exclusions).
+        nodata : int | float | None
+            Data layer nodata value.
+        """
+
+        if name not in self._data_layer_cache:
+            if 'fobj' not in attrs:
+                with ExclusionLayers(attrs['fpath']) as f:
+                    raw = f[attrs['dset'], self.rows, self.cols]
+                    nodata = f.get_nodata_value(attrs['dset'])
+            else:
+                raw = attrs['fobj'][attrs['dset'], self.rows, self.cols]
+                nodata = attrs['fobj'].get_nodata_value(attrs['dset'])
+
+            self._data_layer_cache[name] = (raw, nodata)
+
+        return self._data_layer_cache[name]
+
     @staticmethod
     def _agg_data_layer_method(data, excl_mult, method):
         """Aggregate the data array using specified method.
@@ -488,6 +518,73 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
 
         return data
 
+    def split_res_classes(self, res_class_bins):
+        """Split this SC point into all resource classes in a single pass.
+
+        This SC point must have been initialized without a resource class
+        bin. The exclusions, techmap, and SC point centroid are shared by
+        every resource class point, and the resource class of every
+        exclusion pixel is found with one vectorized comparison against all
+        of the bins.
+
+        Parameters
+        ----------
+        res_class_bins : list
+            List of two-entry lists dictating the resource class bins.
+
+        Returns
+        -------
+        points : dict
+            Dictionary mapping the resource class index (position in
+            res_class_bins) to a SupplyCurvePointSummary for that resource
+            class. Resource classes that are completely excluded are not
+            included.
+        """
+
+        if self._res_class_bin is not None:
+            msg = ('Cannot split SC point gid {} into resource classes, it '
+                   'has already been initialized for resource class bin: {}'
+                   .format(self._gid, self._res_class_bin))
+            logger.error(msg)
+            raise ValueError(msg)
+
+        # pre-compute attributes that are shared by every resource class
+        _ = self.centroid
+        base_excl = (self.excl_data == 0).flatten()
+        res = self.res_data[self._gen_gids]
+        bins = np.array(res_class_bins, dtype=np.float64)
+        lower = np.min(bins, axis=1)[:, np.newaxis]
+        upper = np.max(bins, axis=1)[:, np.newaxis]
+        excludes = base_excl | (res < lower) | (res >= upper)
+
+        points = {}
+        for ri, (res_bin, exclude) in enumerate(zip(res_class_bins,
+                                                    excludes)):
+            gen_gids = self._gen_gids.copy()
+            gen_gids[exclude] = -1
+            if (gen_gids != -1).sum() == 0:
+                continue
+
+            res_gids = self._res_gids.copy()
+            res_gids[exclude] = -1
+            excl_data = self._excl_data.copy()
+            excl_data[exclude.reshape(excl_data.shape)] = 0.0
+
+            point = copy.copy(self)
+            point._close = False
+            point._res_class_bin = res_bin
+            point._gen_gids = point._gids = gen_gids
+            point._res_gids = point._h5_gids = res_gids
+            point._excl_data = excl_data
+            point._excl_data_flat = excl_data.flatten()
+            point._res_gid_set = None
+            point._gen_gid_set = None
+            point._h5_gid_set = None
+            point._mean_res = None
+            points[ri] = point
+
+        return points
+
     def point_summary(self, args=None, data_layers=None):
         """
         Get a summary dictionary of a single supply curve point.
@@ -623,3 +720,105 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
             summary = point.point_summary(args=args, data_layers=data_layers)
 
         return summary
+
+    @classmethod
+    def summarize_res_classes(cls, gid, excl_fpath, gen_fpath, tm_dset,
+                              gen_index, res_class_bins, excl_dict=None,
+                              res_class_dset=None, excl_area=0.0081,
+                              power_density=None, cf_dset='cf_mean-means',
+                              lcoe_dset='lcoe_fcr-means', resolution=64,
+                              exclusion_shape=None, close=False,
+                              offshore_flags=None, friction_layer=None,
+                              args=None, data_layers=None):
+        """Get summary dictionaries of a single supply curve point for all
+        resource classes.
+
+        The SC point exclusions, techmap, and data layers are only read once
+        and then split into every resource class.
+
+        Parameters
+        ----------
+        gid : int
+            gid for supply curve point to analyze.
+        excl_fpath : str
+            Filepath to exclusions h5.
+        gen_fpath : str
+            Filepath to .h5 reV generation output results.
+        tm_dset : str
+            Dataset name in the techmap file containing the
+            exclusions-to-resource mapping data.
+        gen_index : np.ndarray
+            Array of generation gids with array index equal to resource gid.
+            Array value is -1 if the resource index was not used in the
+            generation run.
+        res_class_bins : list
+            List of two-entry lists dictating the resource class bins.
+            Can be [None] if no resource classes are requested.
+        excl_dict : dict | None
+            Dictionary of exclusion LayerMask arugments {layer: {kwarg: value}}
+            None if excl input is pre-initialized.
+        res_class_dset : str | np.ndarray | None
+            Dataset in the generation file dictating resource classes.
+            Can be pre-extracted resource data in np.ndarray.
+            None if no resource classes.
+        excl_area : float
+            Area of an exclusion cell (square km).
+        power_density : float | None | pd.DataFrame
+            Constant power density float, None, or opened dataframe with
+            (resource) "gid" and "power_density columns".
+        cf_dset : str | np.ndarray
+            Dataset name from gen containing capacity factor mean values.
+            Can be pre-extracted generation output data in np.ndarray.
+        lcoe_dset : str | np.ndarray
+            Dataset name from gen containing LCOE mean values.
+            Can be pre-extracted generation output data in np.ndarray.
+        resolution : int | None
+            SC resolution, must be input in combination with gid.
+        exclusion_shape : tuple
+            Shape of the exclusions extent (rows, cols). Inputing this will
+            speed things up considerably.
+        close : bool
+            Flag to close object file handlers on exit.
+        offshore_flags : np.ndarray | None
+            Array of offshore boolean flags if available from wind generation
+            data. None if offshore flag is not available.
+        friction_layer : None | FrictionMask
+            Friction layer with scalar friction values if valid friction inputs
+            were entered. Otherwise, None to not apply friction layer.
+        args : tuple | list, optional
+            List of summary arguments to include. None defaults to all
+            available args defined in the class attr, by default None
+        data_layers : dict, optional
+            Aggregation data layers. Must be a dictionary keyed by data label
+            name. Each value must be another dictionary with "dset", "method",
+            and "fpath", by default None
+
+        Returns
+        -------
+        summaries : dict
+            Dictionary mapping the resource class index (position in
+            res_class_bins) to the summary dictionary for that resource
+            class. Resource classes that are completely excluded are not
+            included.
+        """
+        kwargs = {"excl_dict": excl_dict, "res_class_dset": res_class_dset,
+                  "res_class_bin": None, "excl_area": excl_area,
+                  "power_density": power_density, "cf_dset": cf_dset,
+                  "lcoe_dset": lcoe_dset, "resolution": resolution,
+                  "exclusion_shape": exclusion_shape, "close": close,
+                  "offshore_flags": offshore_flags,
+                  'friction_layer': friction_layer}
+
+        summaries = {}
+        with cls(gid, excl_fpath, gen_fpath, tm_dset, gen_index,
+                 **kwargs) as point:
+            if res_class_dset is None or res_class_bins[0] is None:
+                points = {0: point}
+            else:
+                points = point.split_res_classes(res_class_bins)
+
+            for ri, res_point in points.items():
+                summaries[ri] = res_point.point_summary(
+                    args=args, data_layers=data_layers)
+
+        return summaries
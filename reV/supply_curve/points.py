@@ -128,25 +128,15 @@ class AbstractSupplyCurvePoint(ABC):
 
         nrows = int(np.ceil(shape[0] / resolution))
         ncols = int(np.ceil(shape[1] / resolution))
-        super_shape = (nrows, ncols)
-        arr = np.arange(nrows * ncols).reshape(super_shape)
-        try:
-            loc = np.where(arr == gid)
-            row = loc[0][0]
-            col = loc[1][0]
-        except IndexError:
+        if gid < 0 or gid >= nrows * ncols:
             raise IndexError('Gid {} out of bounds for extent shape {} and '
                              'resolution {}.'.format(gid, shape, resolution))
 
-        if row + 1 != nrows:
-            row_slice = slice(row * resolution, (row + 1) * resolution)
-        else:
-            row_slice = slice(row * resolution, shape[0])
-
-        if col + 1 != ncols:
-            col_slice = slice(col * resolution, (col + 1) * resolution)
-        else:
-            col_slice = slice(col * resolution, shape[1])
+        row, col = divmod(int(gid), ncols)
+        row_slice = slice(row * resolution,
+                          min((row + 1) * resolution, shape[0]))
+        col_slice = slice(col * resolution,
+                          min((col + 1) * resolution, shape[1]))
 
         return row_slice, col_slice
 
@@ -1403,15 +1393,41 @@ class SupplyCurveExtent:
         """
 
         if self._points is None:
-            sc_col_ind, sc_row_ind = np.meshgrid(np.arange(self.n_cols),
-                                                 np.arange(self.n_rows))
-            self._points = pd.DataFrame({'row_ind': sc_row_ind.flatten(),
-                                         'col_ind': sc_col_ind.flatten()})
+            sc_row_ind, sc_col_ind = self.get_sc_row_col_ind(
+                np.arange(len(self)))
+            self._points = pd.DataFrame({'row_ind': sc_row_ind,
+                                         'col_ind': sc_col_ind})
 
             self._points.index.name = 'gid'
 
         return self._points
 
+    def get_sc_row_col_ind(self, gids):
+        """Get the supply curve grid row and column indices of sc point gids.
+
+        Parameters
+        ----------
+        gids : int | list | np.ndarray
+            Supply curve point gid(s).
+
+        Returns
+        -------
+        sc_row_ind : int | np.ndarray
+            Supply curve grid row index of each gid.
+        sc_col_ind : int | np.ndarray
+            Supply curve grid column index of each gid.
+        """
+
+        arr = np.asarray(gids)
+        if np.any(arr < 0) or np.any(arr >= len(self)):
+            raise SupplyCurveError('Requested gid(s) "{}" out of bounds for '
+                                   'supply curve points with length "{}".'
+                                   .format(gids, len(self)))
+
+        sc_row_ind, sc_col_ind = np.divmod(arr, self.n_cols)
+
+        return sc_row_ind, sc_col_ind
+
     def get_excl_slices(self, gid):
         """Get the row and column slices of the exclusions grid corresponding
         to the supply curve point gid.
@@ -1434,8 +1450,7 @@ class SupplyCurveExtent:
                                    'supply curve points with length "{}".'
                                    .format(gid, len(self)))
 
-        sc_row_ind = self.points.loc[gid, 'row_ind']
-        sc_col_ind = self.points.loc[gid, 'col_ind']
+        sc_row_ind, sc_col_ind = self.get_sc_row_col_ind(gid)
         row_slice = self.excl_row_slices[sc_row_ind]
         col_slice = self.excl_col_slices[sc_col_ind]
 
@@ -1521,15 +1536,8 @@ class SupplyCurveExtent:
             (except for the last array in the list which is the remainder).
         """
 
-        chunks = []
-        i = 0
-        while True:
-            if i == len(arr):
-                break
-            else:
-                chunks.append(arr[i:i + resolution])
-
-            i = np.min((len(arr), i + resolution))
+        chunks = [arr[i:i + resolution]
+                  for i in range(0, len(arr), resolution)]
 
         return chunks
 
@@ -1551,16 +1559,9 @@ class SupplyCurveExtent:
             (except for the last array in the list which is the remainder).
         """
 
-        slices = []
-        i = 0
-        while True:
-            if i == len(arr):
-                break
-            else:
-                s, e = arr[i:i + resolution][[0, -1]]
-                slices.append(slice(s, e + 1))
-
-            i = np.min((len(arr), i + resolution))
+        starts = np.arange(0, len(arr), resolution)
+        ends = np.minimum(starts + resolution, len(arr)) - 1
+        slices = [slice(s, e + 1) for s, e in zip(arr[starts], arr[ends])]
 
         return slices
 
@@ -1569,6 +1570,10 @@ class SupplyCurveExtent:
         Determine which sc_point_gids contain resource gids and are thus
         valid supply curve points
 
+        The techmap is read one supply curve row (strip of exclusion rows) at
+        a time and reduced to a validity flag for every sc point in the row,
+        so the full techmap is never held in memory.
+
         Parameters
         ----------
         tm_dset : str
@@ -1579,16 +1584,13 @@ class SupplyCurveExtent:
         valid_gids : ndarray
             Vector of valid sc_point_gids that contain resource gis
         """
-        valid_gids = []
-        tm = self._excls[tm_dset]
-        gid = 0
-        for r in range(self.n_rows):
-            r = slice(r * self._res, (r + 1) * self._res)
-            for c in range(self.n_cols):
-                c = slice(c * self._res, (c + 1) * self._res)
-                if np.any(tm[r, c] != -1):
-                    valid_gids.append(gid)
+        col_starts = np.arange(0, self.exclusions.shape[1], self._res)
+        valid = np.zeros((self.n_rows, self.n_cols), dtype=bool)
+        for i, row_slice in enumerate(self.excl_row_slices):
+            tm = self._excls[tm_dset, row_slice, :]
+            mapped_cols = np.any(tm != -1, axis=0)
+            valid[i] = np.logical_or.reduceat(mapped_cols, col_starts)
 
-                gid += 1
+        valid_gids = np.where(valid.flatten())[0]
 
-        return np.array(valid_gids, dtype=np.uint32)
+        return valid_gids.astype(np.uint32)
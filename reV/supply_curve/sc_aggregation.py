@@ -12,6 +12,7 @@ import numpy as np
 import os
 import pandas as pd
 from scipy.spatial import cKDTree
+from tempfile import TemporaryDirectory
 from warnings import warn
 
 from reV.handlers.exclusions import ExclusionLayers
@@ -19,7 +20,7 @@ from reV.offshore.offshore import Offshore as OffshoreClass
 from reV.supply_curve.aggregation import (AbstractAggFileHandler,
                                           AbstractAggregation,
                                           Aggregation)
-from reV.supply_curve.exclusions import FrictionMask
+from reV.supply_curve.exclusions import ExclusionMaskFromDict, FrictionMask
 from reV.supply_curve.points import SupplyCurveExtent
 from reV.supply_curve.point_summary import SupplyCurvePointSummary
 from reV.utilities.exceptions import (EmptySupplyCurvePointError,
@@ -42,7 +43,8 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
     def __init__(self, excl_fpath, gen_fpath, data_layers=None,
                  power_density=None, excl_dict=None, friction_fpath=None,
                  friction_dset=None, area_filter_kernel='queen', min_area=None,
-                 check_excl_layers=False):
+                 check_excl_layers=False, excl_cache_dir=None,
+                 excl_area=0.0081):
         """
         Parameters
         ----------
@@ -74,11 +76,18 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
         check_excl_layers : bool
             Run a pre-flight check on each exclusion layer to ensure they
             contain un-excluded values
+        excl_cache_dir : str | None
+            Optional directory to cache the full-domain inclusion mask in.
+            None will generate the inclusion mask for every SC point.
+        excl_area : float
+            Area of an exclusion pixel in km2 for the contiguous area filter.
         """
         super().__init__(excl_fpath, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
-                         check_excl_layers=check_excl_layers)
+                         check_excl_layers=check_excl_layers,
+                         excl_cache_dir=excl_cache_dir,
+                         excl_area=excl_area)
 
         self._gen = Resource(gen_fpath)
         # pre-initialize any import attributes
@@ -145,23 +154,52 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
 
         if isinstance(self._power_density, str):
             self._pdf = self._power_density
+            self._power_density = self.read_power_density(self._pdf)
 
-            if self._pdf.endswith('.csv'):
-                self._power_density = pd.read_csv(self._pdf)
-                if ('gid' in self._power_density
-                        and 'power_density' in self._power_density):
-                    self._power_density = self._power_density.set_index('gid')
-                else:
-                    msg = ('Variable power density file must include "gid" '
-                           'and "power_density" columns, but received: {}'
-                           .format(self._power_density.columns.values))
-                    logger.error(msg)
-                    raise FileInputError(msg)
+    @staticmethod
+    def read_power_density(pdf):
+        """Read a variable power density csv file or a power density table
+        that was published to a .npy file by
+        SupplyCurveAggregation._publish_power_density.
+
+        Parameters
+        ----------
+        pdf : str
+            Filepath to variable power density csv file with "gid" and
+            "power_density" columns or to a published .npy file.
+
+        Returns
+        -------
+        power_density : pd.DataFrame
+            Variable power density table with (resource) "gid" index and
+            "power_density" column.
+        """
+
+        if pdf.endswith('.csv'):
+            power_density = pd.read_csv(pdf)
+            if ('gid' in power_density
+                    and 'power_density' in power_density):
+                power_density = power_density.set_index('gid')
             else:
-                msg = ('Variable power density file must be csv but received: '
-                       '{}'.format(self._pdf))
+                msg = ('Variable power density file must include "gid" '
+                       'and "power_density" columns, but received: {}'
+                       .format(power_density.columns.values))
                 logger.error(msg)
                 raise FileInputError(msg)
+        elif pdf.endswith('.npy'):
+            # rows are the resource gids and the power densities
+            arr = np.load(pdf, mmap_mode='r')
+            gids = pd.Index(arr[0].astype(np.int64), name='gid')
+            power_density = pd.DataFrame(arr[1:].T, index=gids,
+                                         columns=['power_density'],
+                                         copy=False)
+        else:
+            msg = ('Variable power density file must be csv but received: '
+                   '{}'.format(pdf))
+            logger.error(msg)
+            raise FileInputError(msg)
+
+        return power_density
 
     def close(self):
         """Close all file handlers."""
@@ -520,7 +558,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                  gids=None, res_class_dset=None, res_class_bins=None,
                  cf_dset='cf_mean-means', lcoe_dset='lcoe_fcr-means',
                  data_layers=None, power_density=None,
-                 friction_fpath=None, friction_dset=None):
+                 friction_fpath=None, friction_dset=None,
+                 excl_cache_dir=None):
         """
         Parameters
         ----------
@@ -574,6 +613,12 @@ class SupplyCurveAggregation(AbstractAggregation):
             Dataset name in friction_fpath for the friction surface data.
             Must be paired with friction_fpath. Must be same shape as
             exclusions.
+        excl_cache_dir : str | None
+            Optional directory to cache the full-domain inclusion mask in.
+            The mask is built once and re-used by every SC point and by any
+            later run with the same exclusion layers, min_area, and
+            area_filter_kernel. None will generate the inclusion mask for
+            every SC point.
         """
 
         super().__init__(excl_fpath, tm_dset, excl_dict=excl_dict,
@@ -591,6 +636,7 @@ class SupplyCurveAggregation(AbstractAggregation):
         self._friction_fpath = friction_fpath
         self._friction_dset = friction_dset
         self._data_layers = data_layers
+        self._excl_cache_dir = excl_cache_dir
 
         logger.debug('Resource class bins: {}'.format(self._res_class_bins))
 
@@ -735,6 +781,94 @@ class SupplyCurveAggregation(AbstractAggregation):
 
         return res_data, res_class_bins, cf_data, lcoe_data, offshore_flag
 
+    @staticmethod
+    def _publish_input_data(out_dir, gen_index, inputs):
+        """Save the SC point agg input arrays to .npy files in a scratch
+        directory so that they can be memory-mapped by parallel workers.
+
+        Parameters
+        ----------
+        out_dir : str
+            Scratch directory to save the .npy files to.
+        gen_index : np.ndarray | None
+            Array of generation gids with array index equal to resource gid.
+        inputs : tuple
+            Output of _get_input_data (res_data, res_class_bins, cf_data,
+            lcoe_data, offshore_flags).
+
+        Returns
+        -------
+        gen_index : str | None
+            Filepath to the gen_index .npy file.
+        inputs : tuple
+            Same as the input but with all numeric arrays replaced by
+            filepaths to .npy files.
+        """
+
+        names = ('gen_index', 'res_data', 'res_class_bins', 'cf_data',
+                 'lcoe_data', 'offshore_flags')
+        published = []
+        for name, arr in zip(names, (gen_index, ) + tuple(inputs)):
+            if isinstance(arr, np.ndarray) and arr.dtype.kind != 'O':
+                fpath = os.path.join(out_dir, '{}.npy'.format(name))
+                np.save(fpath, arr)
+                arr = fpath
+
+            published.append(arr)
+
+        return published[0], tuple(published[1:])
+
+    @staticmethod
+    def _publish_power_density(out_dir, power_density):
+        """Save a variable power density table to a .npy file in a scratch
+        directory so that it can be memory-mapped by parallel workers
+        instead of being pickled into every future.
+
+        Parameters
+        ----------
+        out_dir : str
+            Scratch directory to save the .npy file to.
+        power_density : float | pd.DataFrame | None
+            Constant power density, variable power density table with
+            (resource) "gid" index and "power_density" column, or None.
+
+        Returns
+        -------
+        power_density : float | str | None
+            Filepath to the .npy file if the input was a variable power
+            density table, otherwise the input pass through.
+        """
+
+        if isinstance(power_density, pd.DataFrame):
+            arr = np.vstack((power_density.index.values,
+                             power_density['power_density'].values))
+            fpath = os.path.join(out_dir, 'power_density.npy')
+            np.save(fpath, arr.astype(np.float64))
+            power_density = fpath
+
+        return power_density
+
+    @staticmethod
+    def _load_input_array(arr):
+        """Memory-map an SC point agg input array if it has been published
+        to a .npy file by _publish_input_data.
+
+        Parameters
+        ----------
+        arr : str | np.ndarray | list | None
+            Filepath to a published .npy file or an input pass through.
+
+        Returns
+        -------
+        arr : np.ndarray | list | None
+            Read-only memory-mapped array or the input pass through.
+        """
+
+        if isinstance(arr, str) and arr.endswith('.npy'):
+            arr = np.load(arr, mmap_mode='r')
+
+        return arr
+
     @staticmethod
     def run_serial(excl_fpath, gen_fpath, tm_dset, gen_index,
                    excl_dict=None, area_filter_kernel='queen', min_area=None,
@@ -742,7 +876,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                    args=None, res_class_dset=None, res_class_bins=None,
                    cf_dset='cf_mean-means', lcoe_dset='lcoe_fcr-means',
                    data_layers=None, power_density=None, friction_fpath=None,
-                   friction_dset=None, excl_area=0.0081):
+                   friction_dset=None, excl_area=0.0081, input_data=None,
+                   excl_cache_dir=None):
         """Standalone method to create agg summary - can be parallelized.
 
         Parameters
@@ -754,10 +889,11 @@ class SupplyCurveAggregation(AbstractAggregation):
         tm_dset : str
             Dataset name in the exclusions file containing the
             exclusions-to-resource mapping data.
-        gen_index : np.ndarray
+        gen_index : np.ndarray | str
             Array of generation gids with array index equal to resource gid.
             Array value is -1 if the resource index was not used in the
-            generation run.
+            generation run. Can also be a filepath to a .npy file with the
+            gen_index array that will be memory-mapped.
         excl_dict : dict | None
             Dictionary of exclusion LayerMask arugments {layer: {kwarg: value}}
         area_filter_kernel : str
@@ -789,10 +925,12 @@ class SupplyCurveAggregation(AbstractAggregation):
             Aggregation data layers. Must be a dictionary keyed by data label
             name. Each value must be another dictionary with "dset", "method",
             and "fpath".
-        power_density : float | str | None
-            Power density in MW/km2 or filepath to variable power
-            density file. None will attempt to infer a constant
-            power density from the generation meta data technology
+        power_density : float | str | pd.DataFrame | None
+            Power density in MW/km2, filepath to variable power
+            density csv file or .npy file (from
+            _publish_power_density), or variable power density
+            table. None will attempt to infer a constant power
+            density from the generation meta data technology
         friction_fpath : str | None
             Filepath to friction surface data (cost based exclusions).
             Must be paired with friction_dset.
@@ -802,6 +940,16 @@ class SupplyCurveAggregation(AbstractAggregation):
             exclusions.
         excl_area : float
             Area of an exclusion cell (square km).
+        input_data : tuple | None
+            Pre-extracted output of _get_input_data where arrays can be
+            filepaths to .npy files (from _publish_input_data) that will be
+            memory-mapped. None will read the input data from gen_fpath.
+        excl_cache_dir : str | None
+            Optional directory to cache the full-domain inclusion mask in.
+            The mask is built once and re-used by every SC point and by any
+            later run with the same exclusion layers, min_area, and
+            area_filter_kernel. None will generate the inclusion mask for
+            every SC point.
 
         Returns
         -------
@@ -810,6 +958,7 @@ class SupplyCurveAggregation(AbstractAggregation):
         """
 
         summary = []
+        gen_index = SupplyCurveAggregation._load_input_array(gen_index)
 
         with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
             points = sc.points
@@ -825,49 +974,52 @@ class SupplyCurveAggregation(AbstractAggregation):
                        'min_area': min_area,
                        'friction_fpath': friction_fpath,
                        'friction_dset': friction_dset,
-                       'check_excl_layers': check_excl_layers}
+                       'check_excl_layers': check_excl_layers,
+                       'excl_cache_dir': excl_cache_dir,
+                       'excl_area': excl_area}
         with SupplyCurveAggFileHandler(excl_fpath, gen_fpath,
                                        **file_kwargs) as fh:
-            inputs = SupplyCurveAggregation._get_input_data(fh.gen,
-                                                            gen_fpath,
-                                                            res_class_dset,
-                                                            res_class_bins,
-                                                            cf_dset,
-                                                            lcoe_dset)
+            if input_data is None:
+                inputs = SupplyCurveAggregation._get_input_data(
+                    fh.gen, gen_fpath, res_class_dset, res_class_bins,
+                    cf_dset, lcoe_dset)
+            else:
+                inputs = [SupplyCurveAggregation._load_input_array(arr)
+                          for arr in input_data]
 
             n_finished = 0
             for gid in gids:
-                for ri, res_bin in enumerate(inputs[1]):
-                    try:
-                        pointsum = SupplyCurvePointSummary.summarize(
-                            gid,
-                            fh.exclusions,
-                            fh.gen,
-                            tm_dset,
-                            gen_index,
-                            res_class_dset=inputs[0],
-                            res_class_bin=res_bin,
-                            cf_dset=inputs[2],
-                            lcoe_dset=inputs[3],
-                            data_layers=fh.data_layers,
-                            resolution=resolution,
-                            exclusion_shape=exclusion_shape,
-                            power_density=fh.power_density,
-                            args=args,
-                            excl_dict=excl_dict,
-                            excl_area=excl_area,
-                            close=False,
-                            offshore_flags=inputs[4],
-                            friction_layer=fh.friction_layer)
-
-                    except EmptySupplyCurvePointError:
-                        pass
-
-                    except Exception:
-                        logger.exception('SC gid {} failed!'.format(gid))
-                        raise
-
-                    else:
+                try:
+                    pointsums = SupplyCurvePointSummary.summarize_res_classes(
+                        gid,
+                        fh.exclusions,
+                        fh.gen,
+                        tm_dset,
+                        gen_index,
+                        inputs[1],
+                        res_class_dset=inputs[0],
+                        cf_dset=inputs[2],
+                        lcoe_dset=inputs[3],
+                        data_layers=fh.data_layers,
+                        resolution=resolution,
+                        exclusion_shape=exclusion_shape,
+                        power_density=fh.power_density,
+                        args=args,
+                        excl_dict=excl_dict,
+                        excl_area=excl_area,
+                        close=False,
+                        offshore_flags=inputs[4],
+                        friction_layer=fh.friction_layer)
+
+                except EmptySupplyCurvePointError:
+                    pass
+
+                except Exception:
+                    logger.exception('SC gid {} failed!'.format(gid))
+                    raise
+
+                else:
+                    for ri, pointsum in pointsums.items():
                         pointsum['sc_point_gid'] = gid
                         pointsum['sc_row_ind'] = points.loc[gid, 'row_ind']
                         pointsum['sc_col_ind'] = points.loc[gid, 'col_ind']
@@ -910,40 +1062,74 @@ class SupplyCurveAggregation(AbstractAggregation):
                     .format(self._gids[0], self._gids[-1], self._resolution,
                             max_workers, len(chunks)))
 
+        # read the gen input data once and publish it to the workers as
+        # memory-mapped scratch files instead of having every worker re-read
+        with Resource(self._gen_fpath) as gen:
+            inputs = self._get_input_data(gen, self._gen_fpath,
+                                          self._res_class_dset,
+                                          self._res_class_bins,
+                                          self._cf_dset, self._lcoe_dset)
+
+        if self._excl_cache_dir is not None:
+            # build the inclusion mask cache once before the workers read it
+            with ExclusionMaskFromDict(self._excl_fpath,
+                                       layers_dict=self._excl_dict,
+                                       min_area=self._min_area,
+                                       kernel=self._area_filter_kernel,
+                                       cache_dir=self._excl_cache_dir,
+                                       excl_area=excl_area) as f:
+                if f.layers:
+                    f.build_cache()
+
+        power_density = self._power_density
+        if isinstance(power_density, str):
+            power_density = SupplyCurveAggFileHandler.read_power_density(
+                power_density)
+
         n_finished = 0
         futures = []
         summary = []
         loggers = [__name__, 'reV.supply_curve.point_summary']
-        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
-
-            # iterate through split executions, submitting each to worker
-            for gid_set in chunks:
-                # submit executions and append to futures list
-                futures.append(exe.submit(
-                    self.run_serial,
-                    self._excl_fpath, self._gen_fpath,
-                    self._tm_dset, self._gen_index,
-                    excl_dict=self._excl_dict,
-                    res_class_dset=self._res_class_dset,
-                    res_class_bins=self._res_class_bins,
-                    cf_dset=self._cf_dset, lcoe_dset=self._lcoe_dset,
-                    data_layers=self._data_layers,
-                    resolution=self._resolution,
-                    power_density=self._power_density,
-                    friction_fpath=self._friction_fpath,
-                    friction_dset=self._friction_dset,
-                    area_filter_kernel=self._area_filter_kernel,
-                    min_area=self._min_area,
-                    gids=gid_set, args=args, excl_area=excl_area,
-                    check_excl_layers=self._check_excl_layers))
-
-            # gather results
-            for future in as_completed(futures):
-                n_finished += 1
-                logger.info('Parallel aggregation futures collected: '
-                            '{} out of {}'
-                            .format(n_finished, len(chunks)))
-                summary += future.result()
+        with TemporaryDirectory(prefix='sc_agg_') as scratch_dir:
+            gen_index, input_data = self._publish_input_data(
+                scratch_dir, self._gen_index, inputs)
+            power_density = self._publish_power_density(scratch_dir,
+                                                        power_density)
+            del inputs
+
+            with SpawnProcessPool(max_workers=max_workers,
+                                  loggers=loggers) as exe:
+
+                # iterate through split executions, submitting each to worker
+                for gid_set in chunks:
+                    # submit executions and append to futures list
+                    futures.append(exe.submit(
+                        self.run_serial,
+                        self._excl_fpath, self._gen_fpath,
+                        self._tm_dset, gen_index,
+                        excl_dict=self._excl_dict,
+                        res_class_dset=self._res_class_dset,
+                        res_class_bins=self._res_class_bins,
+                        cf_dset=self._cf_dset, lcoe_dset=self._lcoe_dset,
+                        data_layers=self._data_layers,
+                        resolution=self._resolution,
+                        power_density=power_density,
+                        friction_fpath=self._friction_fpath,
+                        friction_dset=self._friction_dset,
+                        area_filter_kernel=self._area_filter_kernel,
+                        min_area=self._min_area,
+                        gids=gid_set, args=args, excl_area=excl_area,
+                        check_excl_layers=self._check_excl_layers,
+                        input_data=input_data,
+                        excl_cache_dir=self._excl_cache_dir))
+
+                # gather results
+                for future in as_completed(futures):
+                    n_finished += 1
+                    logger.info('Parallel aggregation futures collected: '
+                                '{} out of {}'
+                                .format(n_finished, len(chunks)))
+                    summary += future.result()
 
         return summary
 
@@ -1111,7 +1297,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                                       min_area=self._min_area,
                                       gids=self._gids, args=args,
                                       excl_area=self._excl_area,
-                                      check_excl_layers=chk)
+                                      check_excl_layers=chk,
+                                      excl_cache_dir=self._excl_cache_dir)
         else:
             summary = self.run_parallel(args=args, excl_area=self._excl_area,
                                         max_workers=max_workers)
@@ -1144,7 +1331,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                 friction_fpath=None, friction_dset=None,
                 args=None, excl_area=None, max_workers=None,
                 offshore_capacity=600, offshore_gid_counts=494,
-                offshore_pixel_area=4, offshore_meta_cols=None):
+                offshore_pixel_area=4, offshore_meta_cols=None,
+                excl_cache_dir=None):
         """Get the supply curve points aggregation summary.
 
         Parameters
@@ -1218,6 +1406,13 @@ class SupplyCurveAggregation(AbstractAggregation):
             Offshore class variable DEFAULT_META_COLS, and any
             additional requested cols will be added to DEFAULT_META_COLS.
 
+        excl_cache_dir : str | None
+            Optional directory to cache the full-domain inclusion mask in.
+            The mask is built once and re-used by every SC point and by any
+            later run with the same exclusion layers, min_area, and
+            area_filter_kernel. None will generate the inclusion mask for
+            every SC point.
+
         Returns
         -------
         summary : DataFrame
@@ -1231,7 +1426,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                   power_density=power_density, gids=gids,
                   friction_fpath=friction_fpath, friction_dset=friction_dset,
                   area_filter_kernel=area_filter_kernel, min_area=min_area,
-                  check_excl_layers=check_excl_layers, excl_area=excl_area)
+                  check_excl_layers=check_excl_layers, excl_area=excl_area,
+                  excl_cache_dir=excl_cache_dir)
 
         summary = agg.summarize(args=args,
                                 max_workers=max_workers,
@@ -13,6 +13,7 @@ from warnings import warn
 
 from reV.handlers.transmission import TransmissionCosts as TC
 from reV.handlers.transmission import TransmissionFeatures as TF
+from reV.handlers.transmission import TransmissionFeatureArrays as TFA
 from reV.supply_curve.competitive_wind_farms import CompetitiveWindFarms
 from reV.utilities.exceptions import SupplyCurveInputError, SupplyCurveError
 
@@ -25,6 +26,16 @@ class SupplyCurve:
     """
     Class to handle LCOT calcuation and SupplyCurve sorting
     """
+
+    # number of supply curve to transmission feature connections to compute
+    # costs for in each parallel chunk. LCOT is only computed in parallel
+    # for trans tables with more connections than this.
+    LCOT_CHUNK_SIZE = 5e6
+
+    # trans table columns needed to compute connection costs
+    LCOT_COLUMNS = ('trans_line_gid', 'category', 'dist_mi', 'avail_cap',
+                    'ac_cap', 'trans_gids', 'transmission_multiplier')
+
     def __init__(self, sc_points, trans_table, fcr, sc_features=None,
                  transmission_costs=None, line_limited=False,
                  connectable=True, max_workers=None, consider_friction=True,
@@ -498,51 +509,47 @@ class SupplyCurve:
             max_workers = os.cpu_count()
 
         gid_mask = ~pd.isna(trans_table['sc_gid'])
+        cols = [c for c in SupplyCurve.LCOT_COLUMNS if c in trans_table]
+        table = trans_table.loc[gid_mask, cols]
+
+        capacity = None
+        if connectable:
+            n_caps = trans_table[gid_mask].groupby('sc_gid')['capacity']
+            n_caps = n_caps.nunique()
+            if (n_caps > 1).any():
+                sc_gid = n_caps.index[(n_caps > 1).values][0]
+                capacity = trans_table.loc[trans_table['sc_gid'] == sc_gid,
+                                           'capacity'].unique()
+                msg = ('Each supply curve point should only have '
+                       'a single capacity, but {} has {}'
+                       .format(sc_gid, capacity))
+                logger.error(msg)
+                raise RuntimeError(msg)
+
+            capacity = trans_table.loc[gid_mask, 'capacity'].values
 
         logger.info('Computing LCOT costs for all possible connections...')
-        if max_workers > 1:
-            groups = trans_table[gid_mask].groupby('sc_gid')
+        n_chunks = int(np.ceil(len(table) / SupplyCurve.LCOT_CHUNK_SIZE))
+        if max_workers > 1 and n_chunks > 1:
+            chunks = np.array_split(np.arange(len(table)), n_chunks)
             loggers = [__name__, 'reV.handlers.transmission']
             with SpawnProcessPool(max_workers=max_workers,
                                   loggers=loggers) as exe:
                 futures = []
-                for sc_gid, sc_table in groups:
-                    if connectable:
-                        capacity = sc_table['capacity'].unique()
-                        if len(capacity) == 1:
-                            capacity = capacity[0]
-                        else:
-                            msg = ('Each supply curve point should only have '
-                                   'a single capacity, but {} has {}'
-                                   .format(sc_gid, capacity))
-                            logger.error(msg)
-                            raise RuntimeError(msg)
-                    else:
-                        capacity = None
-
-                    futures.append(exe.submit(TC.feature_costs, sc_table,
-                                              capacity=capacity,
+                for chunk in chunks:
+                    cap = capacity[chunk] if connectable else None
+                    futures.append(exe.submit(TC.feature_costs,
+                                              table.iloc[chunk],
+                                              capacity=cap,
                                               line_limited=line_limited,
                                               **trans_costs))
 
                 cost = [future.result() for future in futures]
                 cost = np.hstack(cost)
         else:
-            feature = TC(trans_table, line_limited=line_limited,
-                         **trans_costs)
-            cost = []
-            for _, row in trans_table[gid_mask].iterrows():
-                if connectable:
-                    capacity = row['capacity']
-                else:
-                    capacity = None
-
-                tm = row.get('transmission_multiplier', 1)
-                cost.append(feature.cost(row['trans_line_gid'], row['dist_mi'],
-                                         capacity=capacity,
-                                         transmission_multiplier=tm))
-
-            cost = np.array(cost, dtype='float32')
+            cost = TC.feature_costs(table, capacity=capacity,
+                                    line_limited=line_limited,
+                                    **trans_costs)
 
         cf_mean_arr = trans_table.loc[gid_mask, 'mean_cf'].values
         lcot = (cost * fcr) / (cf_mean_arr * 8760)
@@ -586,19 +593,13 @@ class SupplyCurve:
         gid = comp_wind_dirs.check_sc_gid(sc_gid)
         if gid is not None:
             if comp_wind_dirs.mask[gid]:
-                exclude_gids = comp_wind_dirs['upwind', gid]
-                if downwind:
-                    exclude_gids = np.append(exclude_gids,
-                                             comp_wind_dirs['downwind', gid])
-                for n in exclude_gids:
-                    check = comp_wind_dirs.exclude_sc_point_gid(n)
-                    if check:
-                        sc_gids = comp_wind_dirs['sc_gid', n]
-                        for sc_id in sc_gids:
-                            if self._mask[sc_id]:
-                                logger.debug('Excluding sc_gid {}'
-                                             .format(sc_id))
-                                self._mask[sc_id] = False
+                exclude_gids = comp_wind_dirs.exclude_neighbors(
+                    gid, downwind=downwind)
+                sc_gids = comp_wind_dirs['sc_gid', exclude_gids]
+                sc_gids = sc_gids[self._mask[sc_gids]]
+                if len(sc_gids):
+                    logger.debug('Excluding sc_gids {}'.format(sc_gids))
+                    self._mask[sc_gids] = False
 
         return comp_wind_dirs
 
@@ -678,6 +679,7 @@ class SupplyCurve:
 
         trans_sc_gids = trans_table['sc_gid'].values.astype(int)
         trans_gids = trans_table['trans_line_gid'].values
+        feature_gids = trans_gids.astype(int).tolist()
         trans_cap = trans_table['avail_cap'].values
         capacities = trans_table['capacity'].values
         categories = trans_table['category'].values
@@ -686,15 +688,17 @@ class SupplyCurve:
         lcots = trans_table['lcot'].values
         total_lcoes = trans_table['total_lcoe'].values
 
+        features = TFA(self._trans_features)
+        connect = features.connect
+        sc_mask = self._mask
+        feature_caps = capacities.tolist()
+
         connected = 0
         progress = 0
-        for i in range(len(trans_table)):
-            sc_gid = trans_sc_gids[i]
-            if self._mask[sc_gid]:
-                trans_gid = trans_gids[i]
-                connect = self._trans_features.connect(trans_gid,
-                                                       capacities[i])
-                if connect:
+        for i, sc_gid in enumerate(trans_sc_gids.tolist()):
+            if sc_mask[sc_gid]:
+                if connect(feature_gids[i], feature_caps[i]):
+                    trans_gid = trans_gids[i]
                     connected += 1
                     logger.debug('Connecting sc gid {}'.format(sc_gid))
                     self._mask[sc_gid] = False
@@ -722,6 +726,8 @@ class SupplyCurve:
                             self._exclude_noncompetitive_wind_farms(
                                 comp_wind_dirs, sc_gid, downwind=downwind)
 
+        features.update_features(self._trans_features)
+
         index = range(0, int(1 + np.max(self._sc_gids)))
         connections = pd.DataFrame(conn_lists, index=index)
         connections.index.name = 'sc_gid'
@@ -10,10 +10,12 @@ Created on Fri Jun 21 16:05:47 2019
 """
 import h5py
 from concurrent.futures import as_completed
+import hashlib
 import numpy as np
 import os
 from scipy.spatial import cKDTree
 import logging
+from tempfile import TemporaryDirectory
 from warnings import warn
 
 from reV.supply_curve.points import SupplyCurveExtent
@@ -52,6 +54,7 @@ class TechMapping:
         """
 
         self._distance_upper_bound = distance_upper_bound
+        self._fingerprint = None
         self._excl_fpath = excl_fpath
         self._res_fpath = res_fpath
         self._dset = dset
@@ -145,6 +148,393 @@ class TechMapping:
 
         return self._distance_upper_bound
 
+    @staticmethod
+    def _get_fingerprint(lats, lons, distance_upper_bound):
+        """Get a unique hash for a tech mapping based on the resource grid
+        coordinates and the distance upper bound.
+
+        Parameters
+        ----------
+        lats : np.ndarray
+            Resource meta latitudes in resource gid order.
+        lons : np.ndarray
+            Resource meta longitudes in resource gid order.
+        distance_upper_bound : float
+            Upper boundary distance for KNN lookup.
+
+        Returns
+        -------
+        str
+        """
+        fingerprint = hashlib.md5()
+        fingerprint.update(np.ascontiguousarray(lats, dtype=np.float32))
+        fingerprint.update(np.ascontiguousarray(lons, dtype=np.float32))
+        fingerprint.update(str(float(distance_upper_bound)).encode('utf-8'))
+
+        return fingerprint.hexdigest()
+
+    @property
+    def fingerprint(self):
+        """Get the resource grid fingerprint for this tech mapping. This is
+        saved as an attribute of the techmap dataset so that techmaps can be
+        re-used for any resource data on the same grid.
+
+        Returns
+        -------
+        str
+        """
+        if self._fingerprint is None:
+            with Resource(self._res_fpath, str_decode=False) as res:
+                lats = res.get_meta_arr('latitude')
+                lons = res.get_meta_arr('longitude')
+
+            self._fingerprint = self._get_fingerprint(
+                lats, lons, self.distance_upper_bound)
+
+        return self._fingerprint
+
+    def _find_cached_dset(self):
+        """Find a techmap dataset in excl_fpath that was created for the same
+        resource grid fingerprint.
+
+        Returns
+        -------
+        dset : str | None
+            Name of the techmap dataset with a matching fingerprint. The
+            requested dset is preferred if it matches. None if there is no
+            matching techmap.
+        """
+        cached = None
+        with h5py.File(self._excl_fpath, 'r') as f:
+            names = [self._dset] if self._dset in f else []
+            names += [name for name in f if name != self._dset]
+            for name in names:
+                if (isinstance(f[name], h5py.Dataset)
+                        and f[name].attrs.get('fingerprint')
+                        == self.fingerprint):
+                    cached = name
+                    break
+
+        return cached
+
+    def _alias_tech_map(self, cached_dset):
+        """Alias the requested techmap dset to a pre-existing techmap with the
+        same fingerprint (hard link, no data is copied).
+
+        Parameters
+        ----------
+        cached_dset : str
+            Name of the pre-existing techmap dataset in excl_fpath.
+        """
+        if cached_dset != self._dset:
+            logger.info('Aliasing tech map "{}" to pre-existing tech map "{}" '
+                        'with the same resource grid fingerprint in {}'
+                        .format(self._dset, cached_dset, self._excl_fpath))
+            with h5py.File(self._excl_fpath, 'a') as f:
+                if self._dset in f:
+                    del f[self._dset]
+
+                f[self._dset] = f[cached_dset]
+        else:
+            logger.info('Tech map "{}" in {} already matches the resource '
+                        'grid fingerprint, skipping tech mapping.'
+                        .format(self._dset, self._excl_fpath))
+
+    def _unlink_alias(self):
+        """Remove the techmap dset from excl_fpath if it is an alias (hard
+        link) of another techmap so that it is not updated in place."""
+        with h5py.File(self._excl_fpath, 'a') as f:
+            if self._dset in f:
+                if h5py.h5o.get_info(f[self._dset].id).rc > 1:
+                    logger.info('Unlinking aliased tech map "{}" in {}'
+                                .format(self._dset, self._excl_fpath))
+                    del f[self._dset]
+
+    def _get_changed_tiles(self):
+        """Get the tech mapping tiles (supply curve gids at the map_chunk
+        resolution) that are affected by resource points that changed since
+        the existing techmap dset was created.
+
+        Returns
+        -------
+        gids : np.ndarray | None
+            Tile gids that need to be re-mapped. None if the existing techmap
+            cannot be incrementally updated (no pre-existing techmap, the
+            original resource file is not available, or the distance upper
+            bound changed).
+        """
+        with h5py.File(self._excl_fpath, 'r') as f:
+            if self._dset not in f:
+                return None
+
+            old_fpath = f[self._dset].attrs.get('fpath', None)
+            old_dub = f[self._dset].attrs.get('distance_upper_bound', None)
+
+        if (old_fpath is None or old_dub is None
+                or not os.path.exists(old_fpath)
+                or not np.isclose(old_dub, self.distance_upper_bound)):
+            return None
+
+        coords = []
+        for fpath in (old_fpath, self._res_fpath):
+            with Resource(fpath, str_decode=False) as res:
+                coords.append(np.vstack((res.get_meta_arr('latitude'),
+                                         res.get_meta_arr('longitude'))).T)
+
+        n = max(len(coords[0]), len(coords[1]))
+        padded = np.full((2, n, 2), np.nan, dtype=np.float64)
+        padded[0, :len(coords[0])] = coords[0]
+        padded[1, :len(coords[1])] = coords[1]
+        changed = np.where(~np.all(padded[0] == padded[1], axis=1))[0]
+        points = np.vstack((padded[0, changed], padded[1, changed]))
+        points = points[~np.isnan(points).any(axis=1)]
+
+        gids = []
+        dub = self.distance_upper_bound
+        if len(points):
+            with SupplyCurveExtent(self._excl_fpath,
+                                   resolution=self._map_chunk) as sc:
+                with h5py.File(self._excl_fpath, 'r') as f:
+                    for gid in range(self._n_sc):
+                        lat_range, lon_range = self._get_tile_bounds(
+                            gid, sc, f)
+                        mask = ((points[:, 0] >= lat_range[0] - dub)
+                                & (points[:, 0] <= lat_range[1] + dub)
+                                & (points[:, 1] >= lon_range[0] - dub)
+                                & (points[:, 1] <= lon_range[1] + dub))
+                        if mask.any():
+                            gids.append(gid)
+
+        logger.info('Found {} changed resource points affecting {} out of {} '
+                    'tech mapping tiles.'
+                    .format(len(changed), len(gids), self._n_sc))
+
+        return np.array(gids, dtype=np.uint32)
+
+    @staticmethod
+    def _get_tile_bounds(gid, sc, f):
+        """Get the coordinate bounds of a tech mapping tile from the
+        coordinates along its edges.
+
+        Parameters
+        ----------
+        gid : int
+            Supply curve gid of the tile at the map_chunk resolution.
+        sc : SupplyCurveExtent
+            reV supply curve extent object at the map_chunk resolution.
+        f : h5py.File
+            Open exclusions h5 file with latitude and longitude datasets.
+
+        Returns
+        -------
+        lat_range : tuple
+            Latitude (min, max) values of the tile.
+        lon_range : tuple
+            Longitude (min, max) values of the tile.
+        """
+        row_slice, col_slice = sc.get_excl_slices(gid)
+        r0, r1 = row_slice.start, row_slice.stop - 1
+        c0, c1 = col_slice.start, col_slice.stop - 1
+
+        bounds = []
+        for dset in ('latitude', 'longitude'):
+            edges = np.concatenate((f[dset][r0, col_slice],
+                                    f[dset][r1, col_slice],
+                                    f[dset][row_slice, c0],
+                                    f[dset][row_slice, c1]))
+            bounds.append((edges.min(), edges.max()))
+
+        return bounds[0], bounds[1]
+
+    def _incremental_remap(self, gids):
+        """Re-map only the input tiles and update the techmap dset in
+        excl_fpath in place.
+
+        Parameters
+        ----------
+        gids : np.ndarray
+            Tile gids (supply curve gids at the map_chunk resolution) to
+            re-map.
+        """
+        out_dir = os.path.dirname(os.path.abspath(self._excl_fpath))
+        with TemporaryDirectory(prefix='techmap_', dir=out_dir) as td:
+            fpath_tmp = os.path.join(td, 'techmap.h5')
+            if len(gids):
+                self._stream_resource_map(fpath_tmp, gids=gids)
+
+            logger.info('Updating {} tiles in tech map "{}" in {}'
+                        .format(len(gids), self._dset, self._excl_fpath))
+            with SupplyCurveExtent(self._excl_fpath,
+                                   resolution=self._map_chunk) as sc:
+                slices = [sc.get_excl_slices(gid) for gid in gids]
+
+            with h5py.File(self._excl_fpath, 'a') as f:
+                if len(gids):
+                    with h5py.File(fpath_tmp, 'r') as f_tmp:
+                        for row_slice, col_slice in slices:
+                            f[self._dset][row_slice, col_slice] = \
+                                f_tmp[self._dset][row_slice, col_slice]
+
+                attrs = f[self._dset].attrs
+                attrs['fpath'] = self._res_fpath
+                attrs['distance_upper_bound'] = self.distance_upper_bound
+                attrs['fingerprint'] = self.fingerprint
+
+    def _update_from_cache(self):
+        """Re-use a pre-existing techmap in excl_fpath if possible.
+
+        Returns
+        -------
+        bool
+            True if the techmap dset in excl_fpath is up to date via an
+            existing techmap with the same fingerprint or an incremental
+            re-map. False if a full tech mapping run is required.
+        """
+        cached = self._find_cached_dset()
+        if cached is not None:
+            self._alias_tech_map(cached)
+            return True
+
+        self._unlink_alias()
+        gids = self._get_changed_tiles()
+        if gids is not None and len(gids) < self._n_sc:
+            self._incremental_remap(gids)
+            return True
+
+        return False
+
+    def _read_tech_map(self):
+        """Read the techmap and coordinates from excl_fpath.
+
+        Returns
+        -------
+        lats : np.ndarray
+            2D un-projected latitude array of tech exclusion points.
+        lons : np.ndarray
+            2D un-projected longitude array of tech exclusion points.
+        ind : np.ndarray
+            Index values of the NN resource point. -1 if no res point found.
+            2D integer array with shape equal to the exclusions extent shape.
+        """
+        with h5py.File(self._excl_fpath, 'r') as f:
+            lats = f['latitude'][...]
+            lons = f['longitude'][...]
+            ind = f[self._dset][...]
+
+        return lats, lons, ind
+
+    @staticmethod
+    def _load_array(arr):
+        """Load an array that can be a filepath to a .npy file.
+
+        Parameters
+        ----------
+        arr : np.ndarray | str
+            Array or filepath to .npy file that will be memory-mapped.
+
+        Returns
+        -------
+        arr : np.ndarray
+        """
+        if isinstance(arr, str):
+            arr = np.load(arr, mmap_mode='r')
+
+        return arr
+
+    @staticmethod
+    def _get_res_coords(res_fpath, coord_labels=('latitude', 'longitude')):
+        """Get the resource coordinates indexed for fast spatial lookups.
+
+        Parameters
+        ----------
+        res_fpath : str
+            Filepath to .h5 resource file that we're mapping to.
+        coord_labels : tuple
+            Labels for the coordinate meta columns.
+
+        Returns
+        -------
+        coords : np.ndarray
+            (n, 2) array of resource (latitude, longitude) sorted by latitude.
+        order : np.ndarray
+            Resource gids corresponding to the sorted coords.
+        """
+        with Resource(res_fpath, str_decode=False) as res:
+            res_meta = np.vstack((res.get_meta_arr(coord_labels[0]),
+                                  res.get_meta_arr(coord_labels[1]))).T
+
+        order = np.argsort(res_meta[:, 0], kind='stable')
+
+        return res_meta[order], order
+
+    def _publish_res_coords(self, out_dir):
+        """Read the resource coordinates once and save the lat-sorted index
+        to .npy files that can be memory-mapped by the workers.
+
+        Parameters
+        ----------
+        out_dir : str
+            Scratch directory to save the resource coordinate index to.
+
+        Returns
+        -------
+        res_coords : tuple
+            Filepaths to the .npy files with the lat-sorted resource coords
+            and the corresponding resource gids.
+        """
+        coords, order = self._get_res_coords(self._res_fpath)
+        res_coords = (os.path.join(out_dir, 'res_coords.npy'),
+                      os.path.join(out_dir, 'res_gids.npy'))
+        np.save(res_coords[0], coords)
+        np.save(res_coords[1], order)
+
+        return res_coords
+
+    @staticmethod
+    def _reduce_res_coords(res_coords, lat_range, lon_range, margin=0.1):
+        """Get the resource points within a bounding box from the lat-sorted
+        resource coordinate index.
+
+        Parameters
+        ----------
+        res_coords : tuple
+            Lat-sorted resource coordinates and the corresponding resource
+            gids (arrays or filepaths to .npy files).
+        lat_range : tuple
+            Latitude (min, max) values of the bounding box.
+        lon_range : tuple
+            Longitude (min, max) values of the bounding box.
+        margin : float
+            Margin when reducing the resource lat/lon.
+
+        Returns
+        -------
+        res_meta : np.ndarray
+            (n, 2) array of (latitude, longitude) of the resource points in
+            the bounding box, in resource gid order.
+        res_gids : np.ndarray
+            Resource gids of the points in res_meta.
+        """
+        coords, order = [TechMapping._load_array(arr) for arr in res_coords]
+
+        lat_min = lat_range[0] - margin
+        lat_max = lat_range[1] + margin
+        i0 = np.searchsorted(coords[:, 0], lat_min, side='left')
+        i1 = np.searchsorted(coords[:, 0], lat_max, side='right')
+        band = np.asarray(coords[i0:i1])
+        band_gids = np.asarray(order[i0:i1])
+
+        mask = ((band[:, 0] > lat_min)
+                & (band[:, 0] < lat_max)
+                & (band[:, 1] > lon_range[0] - margin)
+                & (band[:, 1] < lon_range[1] + margin))
+
+        res_gids = band_gids[mask]
+        res_meta = band[mask]
+        isort = np.argsort(res_gids)
+
+        return res_meta[isort], res_gids[isort]
+
     @staticmethod
     def _unpack_coords(gids, sc, excl_fpath,
                        coord_labels=('latitude', 'longitude')):
@@ -232,34 +622,39 @@ class TechMapping:
         n_finished = 0
         futures = {}
         loggers = __name__
-        with SpawnProcessPool(max_workers=self._max_workers,
-                              loggers=loggers) as exe:
-
-            # iterate through split executions, submitting each to worker
-            for i, gid_set in enumerate(gid_chunks):
-                # submit executions and append to futures list
-                futures[exe.submit(self.map_resource_gids,
-                                   gid_set,
-                                   self._excl_fpath,
-                                   self._res_fpath,
-                                   self.distance_upper_bound,
-                                   self._map_chunk)] = i
-
-            for future in as_completed(futures):
-                n_finished += 1
-                logger.info('Parallel TechMapping futures collected: '
-                            '{} out of {}'
-                            .format(n_finished, len(futures)))
-
-                i = futures[future]
-                result = future.result()
+        with TemporaryDirectory(prefix='techmap_') as scratch_dir:
+            res_coords = self._publish_res_coords(scratch_dir)
+
+            with SpawnProcessPool(max_workers=self._max_workers,
+                                  loggers=loggers) as exe:
+
+                # iterate through split executions, submitting each to worker
+                for i, gid_set in enumerate(gid_chunks):
+                    # submit executions and append to futures list
+                    futures[exe.submit(self.map_resource_gids,
+                                       gid_set,
+                                       self._excl_fpath,
+                                       self._res_fpath,
+                                       self.distance_upper_bound,
+                                       self._map_chunk,
+                                       res_coords=res_coords)] = i
 
                 res = self._map_chunk
-                with SupplyCurveExtent(self._excl_fpath, resolution=res) as sc:
-                    for j, gid in enumerate(gid_chunks[i]):
-                        i_out_arr = sc.get_flat_excl_ind(gid)
-                        ind_all[i_out_arr] = result[0][j]
-                        coords_all[i_out_arr, :] = result[1][j]
+                with SupplyCurveExtent(self._excl_fpath,
+                                       resolution=res) as sc:
+                    for future in as_completed(futures):
+                        n_finished += 1
+                        logger.info('Parallel TechMapping futures '
+                                    'collected: {} out of {}'
+                                    .format(n_finished, len(futures)))
+
+                        i = futures[future]
+                        result = future.result()
+
+                        for j, gid in enumerate(gid_chunks[i]):
+                            i_out_arr = sc.get_flat_excl_ind(gid)
+                            ind_all[i_out_arr] = result[0][j]
+                            coords_all[i_out_arr, :] = result[1][j]
 
         ind_all = ind_all.reshape(self._excl_shape)
         lats = coords_all[:, 0].reshape(self._excl_shape)
@@ -267,9 +662,84 @@ class TechMapping:
 
         return lats, lons, ind_all
 
+    def _stream_resource_map(self, fpath_out, chunks=(128, 128), gids=None):
+        """Map all resource gids to exclusion gids in parallel and write the
+        results for each tile to an h5 file as soon as the tile completes,
+        without holding the full extent in memory.
+
+        Parameters
+        ----------
+        fpath_out : str
+            .h5 filepath to write the tech mapping index dataset to. This
+            file must not be read by the mapping workers.
+        chunks : tuple
+            Chunk shape of the 2D output dataset. The map_chunk should be a
+            multiple of the chunk shape for chunk-aligned writes.
+        gids : np.ndarray | None
+            Tile gids (supply curve gids at the map_chunk resolution) to map.
+            Tiles that are not mapped are left as -1 in the output. None will
+            map all tiles.
+        """
+
+        if gids is None:
+            gids = np.array(list(range(self._n_sc)), dtype=np.uint32)
+
+        gid_chunks = np.array_split(gids, int(np.ceil(len(gids) / 2)))
+        chunks = (np.min((self._excl_shape[0], chunks[0])),
+                  np.min((self._excl_shape[1], chunks[1])))
+
+        n_finished = 0
+        futures = {}
+        loggers = __name__
+        with TemporaryDirectory(prefix='techmap_') as scratch_dir:
+            res_coords = self._publish_res_coords(scratch_dir)
+
+            with SpawnProcessPool(max_workers=self._max_workers,
+                                  loggers=loggers) as exe:
+
+                for i, gid_set in enumerate(gid_chunks):
+                    futures[exe.submit(self.map_resource_gids,
+                                       gid_set,
+                                       self._excl_fpath,
+                                       self._res_fpath,
+                                       self.distance_upper_bound,
+                                       self._map_chunk,
+                                       res_coords=res_coords,
+                                       return_coords=False)] = i
+
+                res = self._map_chunk
+                with SupplyCurveExtent(self._excl_fpath,
+                                       resolution=res) as sc:
+                    with h5py.File(fpath_out, 'w') as f:
+                        dset = f.create_dataset(self._dset,
+                                                shape=self._excl_shape,
+                                                dtype=np.int32,
+                                                chunks=chunks,
+                                                fillvalue=-1)
+
+                        for future in as_completed(futures):
+                            n_finished += 1
+                            logger.info('Streaming TechMapping futures '
+                                        'collected: {} out of {}'
+                                        .format(n_finished, len(futures)))
+
+                            i = futures[future]
+                            ind_out = future.result()[0]
+
+                            for j, gid in enumerate(gid_chunks[i]):
+                                ind = ind_out[j]
+                                if np.ndim(ind) > 0:
+                                    row_slice, col_slice = \
+                                        sc.get_excl_slices(gid)
+                                    shape = (row_slice.stop - row_slice.start,
+                                             col_slice.stop - col_slice.start)
+                                    dset[row_slice, col_slice] = \
+                                        ind.reshape(shape)
+
     @staticmethod
     def map_resource_gids(gids, excl_fpath, res_fpath, distance_upper_bound,
-                          map_chunk, margin=0.1):
+                          map_chunk, margin=0.1, res_coords=None,
+                          return_coords=True):
         """Map exclusion gids to the resource meta.
 
         Parameters
@@ -289,15 +759,23 @@ class TechMapping:
             Calculation chunk used for the tech mapping calc.
         margin : float
             Margin when reducing the resource lat/lon.
+        res_coords : tuple | None
+            Pre-extracted lat-sorted resource coordinates and resource gids
+            (arrays or filepaths to .npy files that will be memory-mapped)
+            from _get_res_coords. None will read the resource meta from
+            res_fpath.
+        return_coords : bool
+            Flag to return the tech exclusion point coordinates.
 
         Returns
         -------
         ind : list
             List of arrays of index values from the NN. List entries correspond
             to input gids.
-        coords : np.ndarray
+        coords : np.ndarray | None
             List of arrays of the un-projected latitude, longitude array of
             tech exclusion points. List entries correspond to input gids.
+            None if return_coords is False.
         """
 
         logger.debug('Getting tech layer coordinates for chunks {} through {}'
@@ -310,21 +788,16 @@ class TechMapping:
             coords_out, lat_range, lon_range = TechMapping._unpack_coords(
                 gids, sc, excl_fpath, coord_labels=coord_labels)
 
-        with Resource(res_fpath, str_decode=False) as res:
-            res_meta = np.vstack((res.get_meta_arr(coord_labels[0]),
-                                  res.get_meta_arr(coord_labels[1]))).T
-
-        mask = ((res_meta[:, 0] > lat_range[0] - margin)
-                & (res_meta[:, 0] < lat_range[1] + margin)
-                & (res_meta[:, 1] > lon_range[0] - margin)
-                & (res_meta[:, 1] < lon_range[1] + margin))
+        if res_coords is None:
+            res_coords = TechMapping._get_res_coords(res_fpath,
+                                                     coord_labels=coord_labels)
 
-        # pylint: disable-msg=C0121
-        mask_ind = np.where(mask == True)[0]  # noqa: E712
+        res_meta, mask_ind = TechMapping._reduce_res_coords(
+            res_coords, lat_range, lon_range, margin=margin)
 
-        if np.sum(mask) > 0:
+        if len(mask_ind) > 0:
             # pylint: disable=not-callable
-            res_tree = cKDTree(res_meta[mask, :])
+            res_tree = cKDTree(res_meta)
 
             logger.debug('Running tech mapping for chunks {} through {}'
                          .format(gids[0], gids[-1]))
@@ -339,11 +812,15 @@ class TechMapping:
             for _ in gids:
                 ind_out.append(-1)
 
+        if not return_coords:
+            coords_out = None
+
         return ind_out, coords_out
 
     @staticmethod
     def save_tech_map(lats, lons, ind, fpath_out, res_fpath, dset,
-                      distance_upper_bound, chunks=(128, 128)):
+                      distance_upper_bound, chunks=(128, 128),
+                      fingerprint=None):
         """Save tech mapping indices and coordinates to an h5 output file.
 
         Parameters
@@ -367,6 +844,8 @@ class TechMapping:
             Distance upper bound to save as attr.
         chunks : tuple
             Chunk shape of the 2D output datasets.
+        fingerprint : str | None
+            Resource grid fingerprint to save as attr.
         """
 
         if not fpath_out.endswith('.h5'):
@@ -403,13 +882,103 @@ class TechMapping:
 
             f[dset].attrs['fpath'] = res_fpath
             f[dset].attrs['distance_upper_bound'] = distance_upper_bound
+            if fingerprint is not None:
+                f[dset].attrs['fingerprint'] = fingerprint
+
+        logger.info('Successfully saved tech map "{}" to {}'
+                    .format(dset, fpath_out))
+
+    @staticmethod
+    def _copy_tech_map(fpath_src, fpath_out, res_fpath, dset,
+                       distance_upper_bound, fingerprint=None):
+        """Copy a tech mapping index dataset from a scratch h5 file into the
+        exclusions file without reading it into memory.
+
+        Parameters
+        ----------
+        fpath_src : str
+            .h5 filepath with the tech mapping index dataset to copy.
+        fpath_out : str
+            .h5 filepath to save tech mapping results.
+        res_fpath : str
+            Filepath to .h5 resource file that we're mapping to.
+        dset : str
+            Dataset name in fpath_src and fpath_out.
+        distance_upper_bound : float
+            Distance upper bound to save as attr.
+        fingerprint : str | None
+            Resource grid fingerprint to save as attr.
+        """
+
+        logger.info('Writing tech map "{}" to {}'.format(dset, fpath_out))
+
+        with h5py.File(fpath_src, 'r') as f_src:
+            with h5py.File(fpath_out, 'a') as f:
+                if dset in list(f):
+                    wmsg = ('TechMap results dataset "{}" is being replaced '
+                            'in pre-existing Exclusions TechMapping file "{}"'
+                            .format(dset, fpath_out))
+                    logger.warning(wmsg)
+                    warn(wmsg, FileInputWarning)
+                    del f[dset]
+
+                f_src.copy(f_src[dset], f, name=dset)
+                f[dset].attrs['fpath'] = res_fpath
+                f[dset].attrs['distance_upper_bound'] = distance_upper_bound
+                if fingerprint is not None:
+                    f[dset].attrs['fingerprint'] = fingerprint
 
         logger.info('Successfully saved tech map "{}" to {}'
                     .format(dset, fpath_out))
 
+    @classmethod
+    def run_streaming(cls, excl_fpath, res_fpath, dset,
+                      distance_upper_bound=0.03, map_chunk=2560,
+                      max_workers=None, use_cache=False):
+        """Run parallel mapping with bounded memory, streaming the results of
+        each completed tile to disk before saving the tech map to excl_fpath.
+
+        Parameters
+        ----------
+        excl_fpath : str
+            Filepath to exclusions h5 (tech layer). dset will be
+            created in excl_fpath.
+        res_fpath : str
+            Filepath to .h5 resource file that we're mapping to.
+        dset : str
+            Dataset name in excl_fpath to save mapping results to.
+        distance_upper_bound : float | None
+            Upper boundary distance for KNN lookup between exclusion points and
+            resource points. None will calculate a good distance based on the
+            resource meta data coordinates.
+        map_chunk : int | None
+            Calculation chunk used for the tech mapping calc.
+        max_workers : int | None
+            Number of cores to run mapping on. None uses all available cpus.
+        use_cache : bool
+            Flag to re-use a techmap in excl_fpath with the same resource
+            grid fingerprint or to only re-map the tiles affected by changed
+            resource points. Off by default.
+        """
+        kwargs = {"distance_upper_bound": distance_upper_bound,
+                  "map_chunk": map_chunk, "max_workers": max_workers}
+        out_dir = os.path.dirname(os.path.abspath(excl_fpath))
+        with cls(excl_fpath, res_fpath, dset, **kwargs) as mapper:
+            if use_cache and mapper._update_from_cache():
+                return
+
+            # stream to a scratch file since the workers read excl_fpath
+            with TemporaryDirectory(prefix='techmap_', dir=out_dir) as td:
+                fpath_tmp = os.path.join(td, 'techmap.h5')
+                mapper._stream_resource_map(fpath_tmp)
+                mapper._copy_tech_map(fpath_tmp, excl_fpath, res_fpath, dset,
+                                      mapper.distance_upper_bound,
+                                      fingerprint=mapper.fingerprint)
+
     @classmethod
     def run(cls, excl_fpath, res_fpath, dset, save_flag=True,
-            distance_upper_bound=0.03, map_chunk=2560, max_workers=None):
+            distance_upper_bound=0.03, map_chunk=2560, max_workers=None,
+            use_cache=False):
         """Run parallel mapping and save to h5 file.
 
         Parameters
@@ -425,6 +994,11 @@ class TechMapping:
             Flag to write techmap to excl_fpath.
         kwargs : dict
             Keyword args to initialize the TechMapping object.
+        use_cache : bool
+            Flag to re-use a techmap in excl_fpath with the same resource
+            grid fingerprint or to only re-map the tiles affected by changed
+            resource points. Off by default and only used if save_flag is
+            True.
 
         Returns
         -------
@@ -441,11 +1015,16 @@ class TechMapping:
         kwargs = {"distance_upper_bound": distance_upper_bound,
                   "map_chunk": map_chunk, "max_workers": max_workers}
         with cls(excl_fpath, res_fpath, dset, **kwargs) as mapper:
+            if save_flag and use_cache and mapper._update_from_cache():
+                return mapper._read_tech_map()
+
             lats, lons, ind = mapper._parallel_resource_map()
             distance_upper_bound = mapper._distance_upper_bound
 
         if save_flag:
+            mapper._unlink_alias()
             mapper.save_tech_map(lats, lons, ind, excl_fpath, res_fpath,
-                                 dset, distance_upper_bound)
+                                 dset, distance_upper_bound,
+                                 fingerprint=mapper.fingerprint)
 
         return lats, lons, ind
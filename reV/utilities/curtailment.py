@@ -5,6 +5,7 @@ Created on Fri Mar  1 13:47:30 2019
 
 @author: gbuster
 """
+from collections import OrderedDict
 import numpy as np
 from warnings import warn
 
@@ -12,10 +13,134 @@ from reV.utilities.exceptions import HandlerWarning
 
 from rex.utilities.solar_position import SolarPosition
 
+# Cache of solar zenith angle time series keyed by
+# (time index hash, rounded latitude, rounded longitude)
+_ZENITH_CACHE = OrderedDict()
+_ZENITH_CACHE_MB = {'limit': 100, 'size': 0}
+
+
+def clear_zenith_cache():
+    """Clear the cache of solar zenith angles."""
+    _ZENITH_CACHE.clear()
+    _ZENITH_CACHE_MB['size'] = 0
+
+
+def _cache_zenith(key, zenith):
+    """Add a zenith angle time series to the cache and evict the least
+    recently used time series beyond the cache size limit.
+
+    Parameters
+    ----------
+    key : tuple
+        (time index hash, rounded latitude, rounded longitude)
+    zenith : np.ndarray
+        1D float32 array of solar zenith angles.
+    """
+    _ZENITH_CACHE[key] = zenith
+    _ZENITH_CACHE_MB['size'] += zenith.nbytes / 1e6
+    while _ZENITH_CACHE_MB['size'] > _ZENITH_CACHE_MB['limit']:
+        _, old = _ZENITH_CACHE.popitem(last=False)
+        _ZENITH_CACHE_MB['size'] -= old.nbytes / 1e6
+
+
+def get_zenith(time_index, lat_lon, decimals=3):
+    """Get the solar zenith angles for unique rounded coordinates.
+
+    Zenith angles are cached by (time_index, rounded lat/lon) so that they
+    are only computed once per location for each time index, e.g. across
+    the splits that are run by a persistent worker.
+
+    Parameters
+    ----------
+    time_index : pd.DatetimeIndex
+        Time index to compute the solar zenith angles for.
+    lat_lon : np.ndarray
+        (n, 2) array of site latitudes and longitudes.
+    decimals : int
+        Number of decimals to round the coordinates to. Sites with the same
+        rounded coordinates share one zenith angle time series.
+
+    Returns
+    -------
+    zenith : np.ndarray
+        (time, n_unique) float32 array of solar zenith angles for the unique
+        rounded coordinates.
+    inverse : np.ndarray
+        Index of the unique coordinates for each site, i.e. the zenith
+        angles of the sites are zenith[:, inverse].
+    """
+    ti_key = hash(np.asarray(time_index.asi8).tobytes())
+    coords = np.round(np.asarray(lat_lon, dtype=np.float64), decimals)
+    unique, inverse = np.unique(coords, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+
+    zenith = np.empty((len(time_index), len(unique)), dtype=np.float32)
+    missing = []
+    for i, (lat, lon) in enumerate(unique):
+        key = (ti_key, lat, lon)
+        if key in _ZENITH_CACHE:
+            _ZENITH_CACHE.move_to_end(key)
+            zenith[:, i] = _ZENITH_CACHE[key]
+        else:
+            missing.append(i)
+
+    if missing:
+        zenith[:, missing] = SolarPosition(time_index,
+                                           unique[missing]).zenith
+        for i in missing:
+            key = (ti_key, unique[i, 0], unique[i, 1])
+            _cache_zenith(key, zenith[:, i].copy())
+
+    return zenith, inverse
+
+
+def _sample_probability(mask, sites, probability, random_seed=0):
+    """Randomly keep curtailment in effect with a given probability.
+
+    Random numbers are only drawn where the curtailment conditions are met.
+    Each site draws from its own random number generator seeded with
+    [random_seed, site gid], so that the result for a site does not depend
+    on which other sites are curtailed in the same call (e.g. with resource
+    prefetch or different sites per worker).
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        (time, sites) boolean curtailment mask, updated in-place.
+    sites : list
+        Resource gids of the sites (columns) in mask.
+    probability : float
+        Probability of curtailment where the curtailment conditions are met.
+    random_seed : int | NoneType
+        Base number to seed the numpy random number generators. Numpy random
+        will be seeded with the system time if this is None.
+
+    Returns
+    -------
+    mask : np.ndarray
+        Curtailment mask with the randomly skipped curtailment removed.
+    """
+    if random_seed is None:
+        rng = np.random.RandomState()
+        idx = np.nonzero(mask)
+        mask[idx] = rng.random_sample(len(idx[0])) < probability
+    else:
+        for i, gid in enumerate(sites):
+            idx = np.flatnonzero(mask[:, i])
+            if len(idx):
+                rng = np.random.RandomState([random_seed, int(gid)])
+                mask[idx, i] = rng.random_sample(len(idx)) < probability
+
+    return mask
+
 
 def curtail(resource, curtailment, random_seed=0):
     """Curtail the SAM wind resource object based on project points.
 
+    All curtailment conditions are combined into a single boolean mask that
+    is applied to the windspeed array in-place. Solar zenith angles are only
+    computed for the curtailment months and are cached (see get_zenith).
+
     Parameters
     ----------
     resource : rex.sam_resource.SAMResource
@@ -25,8 +150,8 @@ def curtail(resource, curtailment, random_seed=0):
     random_seed : int | NoneType
         Number to seed the numpy random number generator. Used to generate
         reproducable psuedo-random results if the probability of curtailment
-        is not set to 1. Numpy random will be seeded with the system time if
-        this is None.
+        is not set to 1. Each site is seeded with [random_seed, site gid].
+        Numpy random will be seeded with the system time if this is None.
 
     Returns
     -------
@@ -35,24 +160,24 @@ def curtail(resource, curtailment, random_seed=0):
         where curtailment is in effect.
     """
 
-    shape = resource.shape
+    windspeed = resource._res_arrays['windspeed']
 
-    # start with curtailment everywhere
-    curtail_mult = np.zeros(shape)
+    # Curtail resource when not that windy
+    mask = windspeed < curtailment.wind_speed
 
-    # Curtail resource when in curtailment months
-    mask = np.isin(resource.time_index.month, curtailment.months)
-    mask = np.tile(np.expand_dims(mask, axis=1), shape[1])
-    curtail_mult = np.where(mask, curtail_mult, 1)
+    # Curtail resource only in curtailment months
+    months = np.isin(resource.time_index.month, curtailment.months)
+    mask[~months] = False
 
-    # Curtail resource when curtailment is possible and is nighttime
-    sza = SolarPosition(
-        resource.time_index,
-        resource.meta[['latitude', 'longitude']].values).zenith
-    mask = (sza > curtailment.dawn_dusk)
-    curtail_mult = np.where(mask, curtail_mult, 1)
+    # Curtail resource when it is nighttime
+    if months.any():
+        zenith, inverse = get_zenith(resource.time_index[months],
+                                     resource.lat_lon)
+        night = zenith > curtailment.dawn_dusk
+        mask[months] &= night[:, inverse]
 
-    # Curtail resource when curtailment is possible and not raining
+    # Curtail resource when not raining
+    temp = None
     if curtailment.precipitation:
         if 'precipitationrate' not in resource._res_arrays:
             warn('Curtailment has a precipitation threshold of "{}", but '
@@ -63,28 +188,26 @@ def curtail(resource, curtailment, random_seed=0):
                          list(resource._res_arrays.keys())),
                  HandlerWarning)
         else:
-            mask = (resource._res_arrays['precipitationrate']
-                    < curtailment.precipitation)
-            curtail_mult = np.where(mask, curtail_mult, 1)
+            temp = np.empty_like(mask)
+            np.less(resource._res_arrays['precipitationrate'],
+                    curtailment.precipitation, out=temp)
+            mask &= temp
 
-    # Curtail resource when curtailment is possible and temperature is high
+    # Curtail resource when temperature is high
     if curtailment.temperature:
-        mask = (resource._res_arrays['temperature']
-                > curtailment.temperature)
-        curtail_mult = np.where(mask, curtail_mult, 1)
-
-    # Curtail resource when curtailment is possible and not that windy
-    mask = (resource._res_arrays['windspeed']
-            < curtailment.wind_speed)
-    curtail_mult = np.where(mask, curtail_mult, 1)
+        if temp is None:
+            temp = np.empty_like(mask)
+        np.greater(resource._res_arrays['temperature'],
+                   curtailment.temperature, out=temp)
+        mask &= temp
 
-    # Apply probability mask when curtailment is possible.
+    # Apply probability only where curtailment is possible.
     if curtailment.probability != 1:
-        np.random.seed(seed=random_seed)
-        mask = np.random.rand(shape[0], shape[1]) < curtailment.probability
-        curtail_mult = np.where(mask, curtail_mult, 1)
+        mask = _sample_probability(mask, resource.sites,
+                                   curtailment.probability,
+                                   random_seed=random_seed)
 
-    # Apply curtailment multiplier directly to resource
-    resource.curtail_windspeed(resource.sites, curtail_mult)
+    # Apply curtailment mask directly to the windspeed in-place
+    np.putmask(windspeed, mask, 0)
 
     return resource
@@ -87,6 +87,90 @@ def test_PV_lat_tilt(res, site_index):
     assert sim.parameters['tilt'] == meta['latitude']
 
 
+def test_sim_reuse(res):
+    """Test that re-using a SAM object for multiple sites with the same
+    config gives the same result as a new SAM object for every site."""
+    sam_file = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    pp = ProjectPoints(slice(0, 100), sam_file, 'pv')
+    out_req = ['cf_mean', 'cf_profile']
+
+    sim = None
+    for i, [res_df, meta] in enumerate(res):
+        _, inputs = pp[res_df.name]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            new = Pvwattsv5(resource=res_df, meta=meta, parameters=inputs,
+                            output_request=list(out_req))
+            if sim is None:
+                sim = Pvwattsv5(resource=res_df, meta=meta,
+                                parameters=inputs,
+                                output_request=list(out_req))
+            else:
+                sim.set_site(resource=res_df, meta=meta, parameters=inputs,
+                             output_request=list(out_req))
+            new._gen_exec()
+            sim._gen_exec()
+
+        assert sim.site == res_df.name
+        assert sim.outputs['cf_mean'] == new.outputs['cf_mean']
+        assert np.array_equal(sim.outputs['cf_profile'],
+                              new.outputs['cf_profile'])
+        if i == 4:
+            break
+
+
+def test_sim_pool():
+    """Test the persistent pool of SAM objects for re-use across splits."""
+    sam_file = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    pp = ProjectPoints(slice(0, 10), sam_file, 'pv')
+    config_id, inputs = pp[0]
+
+    key = Pvwattsv5._get_sim_key(config_id, inputs)
+    assert key == Pvwattsv5._get_sim_key(config_id, dict(inputs))
+    assert key != Pvwattsv5._get_sim_key(config_id,
+                                         dict(inputs, tilt=-1))
+
+    Pvwattsv5._SIM_POOL.clear()
+    for i in range(Pvwattsv5.SIM_POOL_SIZE + 2):
+        Pvwattsv5._add_sim(('test', i), i)
+
+    assert len(Pvwattsv5._SIM_POOL) == Pvwattsv5.SIM_POOL_SIZE
+    assert Pvwattsv5._get_sim(('test', 0)) is None
+    assert Pvwattsv5._get_sim(('test', 2)) == 2
+    assert list(Pvwattsv5._SIM_POOL)[-1] == ('test', 2)
+    Pvwattsv5._SIM_POOL.clear()
+
+
+def test_site_resources(res):
+    """Test that the vectorized resource arrays give the same SAM result as
+    the single-site resource dataframes."""
+    sam_file = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    pp = ProjectPoints(slice(0, 100), sam_file, 'pv')
+    out_req = ['cf_mean', 'cf_profile']
+
+    site_resources, _ = Pvwattsv5.get_site_resources(
+        res, res.meta['timezone'].values)
+
+    for i, [res_df, meta] in enumerate(res):
+        _, inputs = pp[res_df.name]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            df_sim = Pvwattsv5(resource=res_df, meta=meta, parameters=inputs,
+                               output_request=list(out_req))
+            arr_sim = Pvwattsv5(resource=site_resources[i], meta=meta,
+                                parameters=inputs,
+                                output_request=list(out_req))
+            df_sim._gen_exec()
+            arr_sim._gen_exec()
+
+        assert arr_sim.site == res_df.name
+        assert arr_sim.outputs['cf_mean'] == df_sim.outputs['cf_mean']
+        assert np.array_equal(arr_sim.outputs['cf_profile'],
+                              df_sim.outputs['cf_profile'])
+        if i == 4:
+            break
+
+
 @pytest.mark.parametrize('dt', ('1h', '30min', '5min'))
 def test_time_interval(dt):
     """Test the method to get the 'time interval' from the time index obj."""
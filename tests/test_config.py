@@ -140,6 +140,52 @@ def test_config_mapping():
             assert cid == df.loc[site].values[0]
 
 
+def test_sites_by_config():
+    """Test the grouping of project points sites by SAM config."""
+    fpp = os.path.join(TESTDATADIR, 'project_points/pp_offshore.csv')
+    sam_files = {'onshore': os.path.join(
+                 TESTDATADIR, 'SAM/wind_gen_standard_losses_0.json'),
+                 'offshore': os.path.join(
+                 TESTDATADIR, 'SAM/wind_gen_standard_losses_1.json')}
+    df = pd.read_csv(fpp, index_col=0)
+    pp = ProjectPoints(fpp, sam_files, 'windpower')
+    pc = PointsControl(pp, sites_per_split=7)
+    for pc_split in pc:
+        sites_by_config = pc_split.sites_by_config
+        n = sum(len(sites) for sites in sites_by_config.values())
+        assert n == len(pc_split.sites)
+        for cid, sites in sites_by_config.items():
+            assert all(df.loc[sites, 'config'] == cid)
+            assert pc_split.project_points.get_sites_from_config(cid) \
+                == list(sites)
+            for site in sites:
+                assert pc_split[site][0] == cid
+
+    with pytest.raises(KeyError):
+        pc_split[-1]
+
+
+def test_site_index():
+    """Test the ProjectPoints gid to site list index lookup."""
+    sam_files = os.path.join(TESTDATADIR,
+                             'SAM/wind_gen_standard_losses_0.json')
+    pp = ProjectPoints(slice(10, 500, 5), sam_files, 'windpower')
+
+    gids = [15, 20, 100, 495]
+    truth = [pp.sites.index(gid) for gid in gids]
+    assert pp.index(gids[0]) == truth[0]
+    assert np.array_equal(pp.index(gids), truth)
+    assert np.array_equal(pp.index(np.array(gids)), truth)
+
+    for bad in (11, 0, 500, [15, 16]):
+        with pytest.raises(KeyError):
+            pp.index(bad)
+
+    sub = ProjectPoints.split(10, 20, pp)
+    assert sub.index(sub.sites[0]) == 0
+    assert np.array_equal(sub.index(sub.sites), np.arange(10))
+
+
 def test_sam_config_kw_replace():
     """Test that the SAM config with old keys from pysam v1 gets updated on
     the fly and gets propogated to downstream splits."""
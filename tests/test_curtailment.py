@@ -11,11 +11,14 @@ import numpy as np
 import pandas as pd
 import pytest
 from reV.SAM.SAM import RevPySam
+from reV.config.curtailment import Curtailment
 from reV.config.project_points import ProjectPoints
 from reV import TESTDATADIR
-from reV.utilities.curtailment import curtail
+from reV.utilities.curtailment import (curtail, clear_zenith_cache,
+                                       get_zenith)
 from reV.generation.generation import Gen
 
+from rex.sam_resource import SAMResource
 from rex.utilities.solar_position import SolarPosition
 
 
@@ -227,6 +230,103 @@ def test_res_curtailment(year, site):
     return df, check_curtailment[:, site]
 
 
+def test_zenith_cache():
+    """Test the cached solar zenith angles against the solar position of
+    each site."""
+    clear_zenith_cache()
+    ti = pd.date_range('1-1-2012', '1-1-2013', freq='1h')[:-1]
+    lat_lon = np.array([[41.5, -71.5], [41.5, -71.5], [35.2, -105.1],
+                        [41.5, -71.5]])
+    truth = SolarPosition(ti, lat_lon).zenith
+
+    zenith, inverse = get_zenith(ti, lat_lon)
+    assert zenith.shape == (len(ti), 2)
+    assert zenith.dtype == np.float32
+    assert np.allclose(zenith[:, inverse], truth, atol=1e-3)
+
+    cached, cached_inverse = get_zenith(ti, lat_lon[::-1])
+    assert np.array_equal(cached[:, cached_inverse],
+                          zenith[:, inverse][:, ::-1])
+    clear_zenith_cache()
+
+
+def test_curtail_mask():
+    """Test that the combined curtailment mask zeros exactly the windspeeds
+    that meet all of the curtailment conditions."""
+    n = 20
+    ti = pd.date_range('1-1-2012', '1-1-2013', freq='1h')[:-1]
+    rng = np.random.RandomState(0)
+    resource = SAMResource(list(range(n)), 'windpower', ti)
+    resource['windspeed'] = rng.uniform(0, 20, (len(ti), n))
+    resource['temperature'] = rng.uniform(-10, 30, (len(ti), n))
+    resource.meta = pd.DataFrame({'latitude': rng.uniform(25, 48, n),
+                                  'longitude': rng.uniform(-120, -70, n)})
+    curtailment = Curtailment({'dawn_dusk': 'nautical', 'months': [4, 5],
+                               'precipitation': None, 'probability': 1,
+                               'temperature': 5, 'wind_speed': 10.0})
+    windspeed = resource._res_arrays['windspeed'].copy()
+    temperature = resource._res_arrays['temperature']
+    # zenith angles are computed in float32 for coordinates rounded to 3
+    # decimals, see get_zenith()
+    lat_lon = np.round(resource.lat_lon, 3)
+    sza = SolarPosition(ti, lat_lon).zenith.astype(np.float32)
+
+    truth = (np.isin(ti.month, [4, 5])[:, np.newaxis]
+             & (sza > curtailment.dawn_dusk)
+             & (temperature > 5) & (windspeed < 10))
+    truth = np.where(truth, 0, windspeed)
+
+    out = curtail(resource, curtailment)
+    assert np.array_equal(out._res_arrays['windspeed'], truth)
+
+
+def test_curtail_probability_split():
+    """Test that probabilistic curtailment of a site does not depend on the
+    other sites that are curtailed with it."""
+    n = 20
+    ti = pd.date_range('1-1-2012', '1-1-2013', freq='1h')[:-1]
+    rng = np.random.RandomState(0)
+    windspeed = rng.uniform(0, 20, (len(ti), n))
+    meta = pd.DataFrame({'latitude': rng.uniform(25, 48, n),
+                         'longitude': rng.uniform(-120, -70, n)})
+    curtailment = Curtailment({'dawn_dusk': 'nautical', 'months': [4, 5],
+                               'precipitation': None, 'probability': 0.5,
+                               'temperature': None, 'wind_speed': 10.0})
+
+    out = []
+    for sites in (list(range(n)), list(range(5, 12))):
+        resource = SAMResource(sites, 'windpower', ti)
+        resource['windspeed'] = windspeed[:, sites]
+        resource.meta = meta.iloc[sites]
+        out.append(curtail(resource, curtailment, random_seed=1)
+                   ._res_arrays['windspeed'])
+
+    assert np.array_equal(out[0][:, 5:12], out[1])
+    assert (out[0] == 0).any()
+
+
+def test_prefetch_curtailment():
+    """Test that probabilistic curtailment gives the same results with and
+    without resource prefetching."""
+    res_file = os.path.join(TESTDATADIR, 'wtk/ri_100_wtk_2012.h5')
+    sam_files = os.path.join(TESTDATADIR,
+                             'SAM/wind_gen_standard_losses_0.json')
+    curtailment = {"dawn_dusk": "nautical", "months": [4, 5, 6, 7],
+                   "precipitation": None, "probability": 0.5,
+                   "temperature": None, "wind_speed": 10.0}
+    kwargs = {'tech': 'windpower', 'points': slice(3, 40),
+              'sam_files': sam_files, 'res_file': res_file,
+              'output_request': ('cf_profile',), 'curtailment': curtailment,
+              'sites_per_worker': 25, 'fout': None}
+
+    gen = Gen.reV_run(max_workers=1, **kwargs)
+    for max_workers in (1, 2):
+        gen_prefetch = Gen.reV_run(max_workers=max_workers, prefetch=True,
+                                   **kwargs)
+        for dset in ('cf_mean', 'cf_profile'):
+            assert np.array_equal(gen.out[dset], gen_prefetch.out[dset])
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -15,9 +15,11 @@ import numpy as np
 import shutil
 from pandas.testing import assert_frame_equal
 
+from reV.config.project_points import PointsControl, ProjectPoints
 from reV.econ.econ import Econ
 from reV import TESTDATADIR
 from reV.handlers.outputs import Outputs
+from reV.SAM.econ import LCOE
 
 
 RTOL = 0.01
@@ -71,23 +73,23 @@ def test_fout(year):
     fout = 'lcoe_out_{}.h5'.format(year)
     fpath = os.path.join(dirout, fout)
     points = slice(0, 100)
-    Econ.reV_run(points=points, sam_files=sam_files, cf_file=cf_file,
-                 cf_year=year, output_request='lcoe_fcr',
-                 max_workers=1, sites_per_worker=25,
-                 points_range=None, fout=fout, dirout=dirout)
+    try:
+        Econ.reV_run(points=points, sam_files=sam_files, cf_file=cf_file,
+                     cf_year=year, output_request='lcoe_fcr',
+                     max_workers=1, sites_per_worker=25,
+                     points_range=None, fout=fout, dirout=dirout)
+
+        with Outputs(fpath) as f:
+            lcoe = f['lcoe_fcr']
+
+        with h5py.File(r1f, mode='r') as f:
+            year_rows = {'2012': 0, '2013': 1}
+            r1_lcoe = f['pv']['lcoefcr'][year_rows[str(year)], 0:100] * 1000
+    finally:
+        if PURGE_OUT and os.path.exists(fpath):
+            os.remove(fpath)
 
-    with Outputs(fpath) as f:
-        lcoe = f['lcoe_fcr']
-
-    with h5py.File(r1f, mode='r') as f:
-        year_rows = {'2012': 0, '2013': 1}
-        r1_lcoe = f['pv']['lcoefcr'][year_rows[str(year)], 0:100] * 1000
-    result = np.allclose(lcoe, r1_lcoe, rtol=RTOL, atol=ATOL)
-
-    if PURGE_OUT:
-        os.remove(fpath)
-
-    assert result
+    assert np.allclose(lcoe, r1_lcoe, rtol=RTOL, atol=ATOL)
 
 
 @pytest.mark.parametrize('year', ('2012', '2013'))
@@ -103,30 +105,31 @@ def test_append_data(year):
     r1f = os.path.join(TESTDATADIR,
                        'ri_pv/scalar_outputs/project_outputs.h5')
     points = slice(0, 100)
-    Econ.reV_run(points=points, sam_files=sam_files, cf_file=cf_file,
-                 cf_year=year, output_request='lcoe_fcr',
-                 max_workers=1, sites_per_worker=25,
-                 points_range=None, append=True)
-
-    with Outputs(cf_file) as f:
-        new_dsets = f.dsets
-        cf_profile = f['cf_profile']
-        lcoe = f['lcoe_fcr']
-        meta = f.meta
-        ti = f.time_index
-
-    with Outputs(original_file) as f:
-        og_dsets = f.dsets
-        og_profiles = f['cf_profile']
-        og_meta = f.meta
-        og_ti = f.time_index
-
-    with h5py.File(r1f, mode='r') as f:
-        year_rows = {'2012': 0, '2013': 1}
-        r1_lcoe = f['pv']['lcoefcr'][year_rows[str(year)], 0:100] * 1000
-
-    if PURGE_OUT:
-        os.remove(cf_file)
+    try:
+        Econ.reV_run(points=points, sam_files=sam_files, cf_file=cf_file,
+                     cf_year=year, output_request='lcoe_fcr',
+                     max_workers=1, sites_per_worker=25,
+                     points_range=None, append=True)
+
+        with Outputs(cf_file) as f:
+            new_dsets = f.dsets
+            cf_profile = f['cf_profile']
+            lcoe = f['lcoe_fcr']
+            meta = f.meta
+            ti = f.time_index
+
+        with Outputs(original_file) as f:
+            og_dsets = f.dsets
+            og_profiles = f['cf_profile']
+            og_meta = f.meta
+            og_ti = f.time_index
+
+        with h5py.File(r1f, mode='r') as f:
+            year_rows = {'2012': 0, '2013': 1}
+            r1_lcoe = f['pv']['lcoefcr'][year_rows[str(year)], 0:100] * 1000
+    finally:
+        if PURGE_OUT and os.path.exists(cf_file):
+            os.remove(cf_file)
 
     assert np.allclose(lcoe, r1_lcoe, rtol=RTOL, atol=ATOL)
     assert np.allclose(cf_profile, og_profiles)
@@ -135,6 +138,38 @@ def test_append_data(year):
     assert all([d in new_dsets for d in og_dsets])
 
 
+@pytest.mark.parametrize('year', ('2012', '2013'))
+def test_vectorized_lcoe(year):
+    """Test the vectorized LCOE calculation against the SAM lcoefcr module."""
+    cf_file = os.path.join(TESTDATADIR,
+                           'gen_out/gen_ri_pv_{}_x000.h5'.format(year))
+    sam_files = os.path.join(TESTDATADIR,
+                             'SAM/i_lcoe_naris_pv_1axis_inv13.json')
+    pp = ProjectPoints(slice(0, 100), sam_files, 'econ', res_file=cf_file)
+    pc = PointsControl(pp, sites_per_split=100)
+    site_df = pp.df.set_index('gid', drop=True)
+
+    sam_out = LCOE.reV_run(pc, site_df.copy(), cf_file, year,
+                           output_request=['lcoe_fcr'], vectorize=False)
+    vec_out = LCOE.reV_run(pc, site_df.copy(), cf_file, year,
+                           output_request=['lcoe_fcr'], vectorize=True)
+
+    assert list(sam_out.keys()) == list(vec_out.keys())
+    sam_lcoe = [sam_out[site]['lcoe_fcr'] for site in pc.sites]
+    vec_lcoe = [vec_out[site]['lcoe_fcr'] for site in pc.sites]
+    assert np.allclose(sam_lcoe, vec_lcoe, rtol=1e-6, atol=0)
+
+    # site-specific cost inputs take precedence over the SAM config
+    site_df['capital_cost'] = np.linspace(3e7, 5e7, len(site_df))
+    sam_out = LCOE.reV_run(pc, site_df.copy(), cf_file, year,
+                           output_request=['lcoe_fcr'], vectorize=False)
+    vec_out = LCOE.reV_run(pc, site_df.copy(), cf_file, year,
+                           output_request=['lcoe_fcr'], vectorize=True)
+    sam_lcoe = [sam_out[site]['lcoe_fcr'] for site in pc.sites]
+    vec_lcoe = [vec_out[site]['lcoe_fcr'] for site in pc.sites]
+    assert np.allclose(sam_lcoe, vec_lcoe, rtol=1e-6, atol=0)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
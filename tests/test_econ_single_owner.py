@@ -13,6 +13,8 @@ import pytest
 import numpy as np
 
 from reV.econ.econ import Econ
+from reV.handlers.outputs import Outputs
+from reV.SAM.econ import Economic
 from reV import TESTDATADIR
 
 
@@ -59,6 +61,20 @@ def test_single_owner():
     return obj.out
 
 
+@pytest.mark.parametrize('sites', ([3, 0, 5, 4], [8, 1], [9]))
+def test_cf_site_read(sites):
+    """Test the single read of cf profiles for a set of sites against the
+    single-site reads."""
+    cf_file = os.path.join(TESTDATADIR, 'gen_out/wind_2012_x000.h5')
+
+    with Outputs(cf_file) as cfh:
+        data, gid_index = Economic._get_cf_sites(cfh, 'cf_profile', sites)
+        gids = list(cfh.meta['gid'])
+        for site in sites:
+            truth = cfh['cf_profile', :, gids.index(site)]
+            assert np.allclose(data[:, gid_index[site]], truth)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
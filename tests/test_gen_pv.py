@@ -8,15 +8,19 @@ Created on Thu Nov 29 09:54:51 2018
 @author: gbuster
 """
 
+from concurrent.futures import Future
 import os
+import time
 import h5py
 import pytest
 import numpy as np
 
-from reV.generation.generation import Gen
-from reV.config.project_points import ProjectPoints
+from reV.generation.generation import FlushWriter, Gen, RunManifest
+from reV.config.project_points import ProjectPoints, PointsControl
+from reV.SAM.generation import Pvwattsv5
 from reV import TESTDATADIR
 from reV.handlers.outputs import Outputs
+from reV.utilities.exceptions import ExecutionError
 
 
 RTOL = 0.0
@@ -317,6 +321,255 @@ def test_pvwatts_v5_v7():
     assert np.allclose(gen7.out['cf_mean'], gen5.out['cf_mean'], atol=3), msg
 
 
+@pytest.mark.parametrize('pool_size', [1, 2, 7])
+def test_parallel_pool_order(pool_size):
+    """Test that the persistent process pool with out of order futures
+    completion gives the same sequential outputs as a serial run."""
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_2012.h5'
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    output_request = ('cf_profile', 'cf_mean')
+    kwargs = {'tech': 'pvwattsv5', 'points': slice(0, 20),
+              'sam_files': sam_files, 'res_file': res_file,
+              'output_request': output_request, 'sites_per_worker': 3,
+              'fout': None}
+
+    gen_serial = Gen.reV_run(max_workers=1, **kwargs)
+    gen_parallel = Gen.reV_run(max_workers=3, pool_size=pool_size, **kwargs)
+
+    for dset in output_request:
+        assert np.array_equal(gen_serial.out[dset], gen_parallel.out[dset])
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_async_flush(max_workers):
+    """Test that flushing in a background writer thread with many small
+    double-buffered output chunks gives the same outputs on disk."""
+    year = 2012
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_{}.h5'.format(year)
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    rev2_out_dir = os.path.join(TESTDATADIR, 'ri_pv_reV2')
+    output_request = ('cf_profile', 'cf_mean')
+
+    data = {}
+    for async_flush in (False, True):
+        rev2_out = 'gen_ri_pv_async_{}_{}.h5'.format(async_flush, year)
+        gen = Gen.reV_run(tech='pvwattsv5', points=slice(0, 20),
+                          sam_files=sam_files, res_file=res_file,
+                          fout=rev2_out, dirout=rev2_out_dir,
+                          output_request=output_request,
+                          max_workers=max_workers, sites_per_worker=5,
+                          mem_util_lim=1e-5, async_flush=async_flush)
+        assert gen._writer is None
+
+        fpath = os.path.join(rev2_out_dir, rev2_out.replace('.h5', '_{}.h5'
+                                                            .format(year)))
+        with Outputs(fpath, 'r') as f:
+            data[async_flush] = {dset: f[dset] for dset in output_request}
+
+        if PURGE_OUT:
+            os.remove(fpath)
+            os.remove(RunManifest.get_fpath(fpath))
+
+    for dset in output_request:
+        assert np.array_equal(data[False][dset], data[True][dset])
+
+
+def test_prefetch():
+    """Test that prefetching the resource for chunk aligned sub-splits gives
+    the same outputs as reading the full split at once."""
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_2012.h5'
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    output_request = ('cf_profile', 'cf_mean', 'dni_mean')
+    kwargs = {'tech': 'pvwattsv5', 'points': slice(3, 40),
+              'sam_files': sam_files, 'res_file': res_file,
+              'output_request': output_request, 'sites_per_worker': 25,
+              'fout': None}
+
+    gen = Gen.reV_run(max_workers=1, **kwargs)
+    for max_workers in (1, 2):
+        gen_prefetch = Gen.reV_run(max_workers=max_workers, prefetch=True,
+                                   **kwargs)
+        for dset in output_request:
+            assert np.array_equal(gen.out[dset], gen_prefetch.out[dset])
+
+
+def test_prefetch_chunks():
+    """Test the splitting of points control into resource chunk aligned
+    sub-splits for resource prefetching."""
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    pp = ProjectPoints(list(range(3, 30)) + [45, 46], sam_files, 'pvwattsv5')
+    pc = PointsControl(pp, sites_per_split=100)
+
+    sub_pcs = Pvwattsv5._chunk_points_control(pc, 10)
+    truth = [list(range(3, 10)), list(range(10, 20)), list(range(20, 30)),
+             [45, 46]]
+    assert [list(sub.project_points.sites) for sub in sub_pcs] == truth
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_resume(max_workers):
+    """Test that resuming a run only re-runs the missing and failed sites
+    and completes the existing output file."""
+    year = 2012
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_{}.h5'.format(year)
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    rev2_out_dir = os.path.join(TESTDATADIR, 'ri_pv_reV2')
+    rev2_out = 'gen_ri_pv_resume_{}.h5'.format(max_workers)
+    fpath = os.path.join(rev2_out_dir, rev2_out.replace('.h5', '_{}.h5'
+                                                        .format(year)))
+    output_request = ('cf_profile', 'cf_mean')
+    kwargs = {'tech': 'pvwattsv5', 'points': slice(0, 20),
+              'sam_files': sam_files, 'res_file': res_file,
+              'output_request': output_request, 'max_workers': max_workers,
+              'sites_per_worker': 5, 'fout': rev2_out,
+              'dirout': rev2_out_dir}
+
+    gen = Gen.reV_run(**kwargs)
+    assert gen.manifest.completed == [[0, 20]]
+    assert not gen.manifest.failed
+    with Outputs(fpath, 'r') as f:
+        truth = {dset: f[dset] for dset in output_request}
+
+    # mimic a run that was interrupted after 12 sites with a failed site
+    manifest = RunManifest(gen.manifest.fpath, 20,
+                           sites_hash=gen.manifest.sites_hash,
+                           completed=[[0, 12]], failed=[3])
+    manifest.save()
+    with h5py.File(fpath, 'a') as f:
+        for dset in output_request:
+            f[dset][..., 12:] = 0
+            f[dset][..., 3] = 0
+
+    gen = Gen.reV_run(resume=True, **kwargs)
+    assert gen.manifest.completed == [[0, 20]]
+    assert not gen.manifest.failed
+    with Outputs(fpath, 'r') as f:
+        for dset in output_request:
+            assert np.array_equal(truth[dset], f[dset])
+
+    if PURGE_OUT:
+        os.remove(fpath)
+        os.remove(gen.manifest.fpath)
+
+
+class _FaultyGen(Gen):
+    """Gen class that fails for a few pathological sites."""
+
+    HANG = (5,)
+    ERROR = (2,)
+
+    @staticmethod
+    def run(points_control, **kwargs):
+        """Hang or raise if the split includes a pathological site."""
+        sites = points_control.project_points.sites
+        if any(site in sites for site in _FaultyGen.HANG):
+            time.sleep(30)
+        if any(site in sites for site in _FaultyGen.ERROR):
+            raise RuntimeError('Pathological site!')
+
+        return Gen.run(points_control, **kwargs)
+
+
+def test_fault_isolation():
+    """Test that failed futures are narrowed down to the offending sites and
+    that only those sites are set to zeros and reported."""
+    year = 2012
+    res_file = TESTDATADIR + '/nsrdb/ri_100_nsrdb_{}.h5'.format(year)
+    sam_files = TESTDATADIR + '/SAM/naris_pv_1axis_inv13.json'
+    output_request = ('cf_profile', 'cf_mean')
+    kwargs = {'tech': 'pvwattsv5', 'points': slice(0, 8),
+              'sam_files': sam_files, 'res_file': res_file,
+              'output_request': output_request, 'sites_per_worker': 2,
+              'fout': None}
+
+    gen = Gen.reV_run(max_workers=1, **kwargs)
+    gen_iso = _FaultyGen.reV_run(max_workers=2, timeout=5,
+                                 fault_isolation=True, **kwargs)
+
+    report = gen_iso.failure_report
+    assert report['gid'].tolist() == [2, 5]
+    assert report['error'].str.contains('Timed out').tolist() == [False,
+                                                                  True]
+
+    mask = np.isin(np.arange(8), [2, 5])
+    for dset in output_request:
+        truth = gen.out[dset]
+        test = gen_iso.out[dset]
+        assert np.array_equal(truth[..., ~mask], test[..., ~mask])
+        assert not test[..., mask].any()
+
+
+def test_run_manifest(tmpdir):
+    """Test the run manifest bookkeeping of written and failed sites."""
+    fpath = RunManifest.get_fpath(os.path.join(str(tmpdir), 'gen_2012.h5'))
+    assert fpath.endswith('gen_2012_manifest.json')
+
+    sites = np.arange(100, 120)
+    manifest = RunManifest(fpath, len(sites),
+                           sites_hash=RunManifest.hash_sites(sites))
+    manifest.update([[0, 5]], sites[:5], [101, 102])
+    manifest.update([[10, 15], [5, 8]], sites[5:8].tolist() + [110], [])
+    assert manifest.completed == [[0, 8], [10, 15]]
+    assert manifest.failed == {101, 102}
+
+    manifest = RunManifest.load(fpath)
+    assert manifest.n_completed == 13
+    truth = np.ones(len(sites), dtype=bool)
+    truth[:8] = False
+    truth[10:15] = False
+    truth[1:3] = True
+    assert np.array_equal(manifest.get_todo(sites), truth)
+
+    # re-writing a failed site clears it from the failed sites
+    manifest.update([[1, 2]], [101], [])
+    assert manifest.failed == {102}
+
+    with pytest.raises(ExecutionError):
+        manifest.get_todo(sites[:10])
+
+    # same number of sites but different gids
+    with pytest.raises(ExecutionError):
+        manifest.get_todo(sites + 100)
+
+
+def test_wait_futures_queued():
+    """Test that the timeout clock of a future only starts when a worker
+    starts its split, so that queued futures do not time out."""
+    futures = [Future() for _ in range(3)]
+    for future in futures[:2]:
+        # both futures are marked running, e.g. in the pool call queue
+        future.set_running_or_notify_cancel()
+
+    pending = {future: (i, None, i) for i, future in enumerate(futures)}
+    start_times = {0: time.time() - 10}
+    done, timed_out = Gen._wait_futures(pending, start_times, 1)
+    assert not done
+    assert timed_out == futures[:1]
+    assert not start_times
+
+    start_times = {1: time.time()}
+    futures[1].set_result(None)
+    done, timed_out = Gen._wait_futures(pending, start_times, 1)
+    assert done == futures[1:2]
+    assert not timed_out
+
+
+def test_flush_writer_error():
+    """Test that an error in the background writer thread is raised in the
+    main thread."""
+
+    def _write(x):
+        if x > 0:
+            raise ValueError('Bad write')
+
+    writer = FlushWriter(_write)
+    writer.submit(0)
+    writer.submit(1)
+    with pytest.raises(ExecutionError):
+        writer.submit(2)
+        writer.close()
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -6,8 +6,12 @@ import h5py
 import numpy as np
 import os
 import pytest
+import shutil
 
 from reV.handlers.collection import Collector
+from reV.handlers.outputs import Outputs
+from reV.utilities.exceptions import (CollectionRuntimeError,
+                                      CollectionWarning)
 from reV import TESTDATADIR
 
 from rex.utilities.loggers import init_logger
@@ -166,6 +170,144 @@ def test_means_lcoe():
         os.remove(h5_file)
 
 
+def test_parallel_collect():
+    """Test parallel single-pass collection of multiple datasets against the
+    serial collection"""
+    init_logger('reV.handlers.collection')
+    dsets = ['cf_profile', 'cf_mean', 'lcoe_fcr']
+    h5_serial = os.path.join(TEMP_DIR, 'cf_serial.h5')
+    h5_parallel = os.path.join(TEMP_DIR, 'cf_parallel.h5')
+    Collector.collect(h5_serial, H5_DIR, POINTS_PATH, dsets,
+                      file_prefix='peregrine_2012')
+    Collector.collect(h5_parallel, H5_DIR, POINTS_PATH, dsets,
+                      file_prefix='peregrine_2012', mem_util_lim=0.00002,
+                      max_workers=2)
+
+    with h5py.File(h5_serial, 'r') as f_s:
+        with h5py.File(h5_parallel, 'r') as f_p:
+            for dset in dsets:
+                assert np.array_equal(f_s[dset][...], f_p[dset][...])
+
+            assert np.array_equal(f_s['time_index'][...],
+                                  f_p['time_index'][...])
+
+    if PURGE_OUT:
+        os.remove(h5_serial)
+        os.remove(h5_parallel)
+
+
+def test_virtual_collect():
+    """Test zero-copy virtual dataset collection read through Outputs and
+    the materialization of the virtual datasets"""
+    init_logger('reV.handlers.collection')
+    dsets = ['cf_profile', 'cf_mean']
+    h5_serial = os.path.join(TEMP_DIR, 'cf_serial.h5')
+    h5_virtual = os.path.join(TEMP_DIR, 'cf_virtual.h5')
+    Collector.collect(h5_serial, H5_DIR, POINTS_PATH, dsets,
+                      file_prefix='peregrine_2012')
+    Collector.collect(h5_virtual, H5_DIR, POINTS_PATH, dsets,
+                      file_prefix='peregrine_2012', virtual=True)
+
+    assert sorted(Collector.get_virtual_dsets(h5_virtual)) == sorted(dsets)
+    with Outputs(h5_serial, mode='r') as f_s:
+        with Outputs(h5_virtual, mode='r') as f_v:
+            assert f_s.shape == f_v.shape
+            for dset in dsets:
+                assert np.allclose(f_s[dset], f_v[dset])
+                assert f_s.get_attrs(dset) == f_v.get_attrs(dset)
+
+    with pytest.warns(CollectionWarning):
+        Collector.purge_chunks(h5_virtual, H5_DIR, POINTS_PATH,
+                               file_prefix='peregrine_2012')
+
+    Collector.materialize(h5_virtual)
+    assert not any(Collector.get_virtual_dsets(h5_virtual))
+    with h5py.File(h5_serial, 'r') as f_s:
+        with h5py.File(h5_virtual, 'r') as f_v:
+            for dset in dsets:
+                assert np.array_equal(f_s[dset][...], f_v[dset][...])
+                assert dict(f_s[dset].attrs) == dict(f_v[dset].attrs)
+
+    if PURGE_OUT:
+        os.remove(h5_serial)
+        os.remove(h5_virtual)
+
+
+def test_chunk_sidecars(tmpdir):
+    """Test that the run manifest and failure report sidecars of the chunk
+    files are moved and purged with the chunk files."""
+    h5_dir = str(tmpdir)
+    prefix = 'peregrine_2012'
+    sidecars = []
+    for fpath in Collector.find_h5_files(H5_DIR, file_prefix=prefix):
+        fn = os.path.basename(fpath)
+        shutil.copy(fpath, os.path.join(h5_dir, fn))
+        for suffix in Collector.SIDECAR_SUFFIXES:
+            sidecar = os.path.splitext(fn)[0] + suffix
+            with open(os.path.join(h5_dir, sidecar), 'w') as f:
+                f.write('sidecar')
+            sidecars.append(sidecar)
+
+    h5_file = os.path.join(h5_dir, 'collection.h5')
+    Collector.collect(h5_file, h5_dir, POINTS_PATH, 'cf_mean',
+                      file_prefix=prefix)
+    Collector.move_chunks(h5_file, h5_dir, POINTS_PATH, file_prefix=prefix)
+    for sidecar in sidecars:
+        assert not os.path.exists(os.path.join(h5_dir, sidecar))
+        assert os.path.exists(os.path.join(h5_dir, 'chunk_files', sidecar))
+
+    h5_dir = os.path.join(h5_dir, 'chunk_files')
+    h5_file = os.path.join(h5_dir, 'collection.h5')
+    with Outputs(os.path.join(h5_dir, fn), mode='r') as f:
+        dsets = [d for d in f.datasets if d not in ('meta', 'time_index')]
+
+    Collector.collect(h5_file, h5_dir, POINTS_PATH, dsets,
+                      file_prefix=prefix)
+    Collector.purge_chunks(h5_file, h5_dir, POINTS_PATH, file_prefix=prefix)
+    assert os.listdir(h5_dir) == ['collection.h5']
+
+
+def test_materialize_properties(tmpdir):
+    """Test that materialized virtual datasets keep the creation properties
+    of the source datasets and that missing virtual sources raise."""
+    h5_dir = str(tmpdir)
+    prefix = 'peregrine_2012'
+    for fpath in Collector.find_h5_files(H5_DIR, file_prefix=prefix):
+        fp_copy = os.path.join(h5_dir, os.path.basename(fpath))
+        shutil.copy(fpath, fp_copy)
+        with h5py.File(fp_copy, 'a') as f:
+            data = f['cf_profile'][...]
+            attrs = dict(f['cf_profile'].attrs)
+            del f['cf_profile']
+            ds = f.create_dataset('cf_profile', data=data,
+                                  chunks=(8760, 8), compression='gzip',
+                                  compression_opts=4, shuffle=True)
+            for k, v in attrs.items():
+                ds.attrs[k] = v
+
+    h5_file = os.path.join(h5_dir, 'collection.h5')
+    Collector.collect(h5_file, h5_dir, POINTS_PATH, 'cf_profile',
+                      file_prefix=prefix, virtual=True)
+    Collector.materialize(h5_file)
+    with h5py.File(h5_file, 'r') as f:
+        ds = f['cf_profile']
+        assert not ds.is_virtual
+        assert ds.chunks == (8760, 8)
+        assert ds.compression == 'gzip'
+        assert ds.compression_opts == 4
+        assert ds.shuffle
+        truth = manual_collect(h5_dir, prefix, 'cf_profile')
+        assert np.array_equal(ds[...], truth)
+
+    Collector.collect(h5_file, h5_dir, POINTS_PATH, 'cf_profile',
+                      file_prefix=prefix, virtual=True)
+    os.remove(Collector.find_h5_files(h5_dir, file_prefix=prefix)[0])
+    with pytest.raises(CollectionRuntimeError):
+        Collector.materialize(h5_file)
+
+    assert Collector.get_virtual_dsets(h5_file) == ['cf_profile']
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
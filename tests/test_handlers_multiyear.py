@@ -239,6 +239,38 @@ def test_my_stdev(dset, group):
         os.remove(my_out)
 
 
+@pytest.mark.parametrize(('dset', 'max_workers'), [
+    ('cf_mean', 1),
+    ('cf_mean', 2),
+    ('cf_profile', 1),
+    ('cf_profile', 2)])
+def test_streaming_stats(dset, max_workers):
+    """
+    Test the streaming multi-year means and stdev on small site blocks for
+    scalar and profile datasets in serial and parallel
+
+    Parameters
+    ----------
+    dset : str
+        dset to compute statistics from
+    max_workers : int
+        Number of workers to compute the site blocks with
+    """
+    my_means = manual_means(H5_FILES, dset)
+    my_std = manual_stdev(H5_FILES, dset)
+
+    my_out = os.path.join(TEMP_DIR, "{}-MY.h5".format(dset))
+    MultiYear.collect_means(my_out, H5_FILES, dset, mem_util_lim=1e-6,
+                            max_workers=max_workers)
+
+    with MultiYear(my_out, mode='r') as my:
+        compare_arrays(my_means, my.means(dset), "Streamed Means")
+        compare_arrays(my_std, my.stdev(dset), "Streamed STDEV")
+
+    if PURGE_OUT:
+        os.remove(my_out)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -2,12 +2,15 @@
 """
 Transmission Feature Tests
 """
+import numpy as np
 import os
 import pandas as pd
 import pytest
 
 from reV import TESTDATADIR
+from reV.handlers.transmission import TransmissionCosts as TC
 from reV.handlers.transmission import TransmissionFeatures as TF
+from reV.handlers.transmission import TransmissionFeatureArrays as TFA
 
 TRANS_COSTS_1 = {'line_tie_in_cost': 200, 'line_cost': 1000,
                  'station_tie_in_cost': 50, 'center_tie_in_cost': 10,
@@ -127,6 +130,80 @@ def test_substation_load_spreading(i, trans_costs, trans_table):
         assert LINE_CAPS[i][line_id] == tf[line_id]['avail_cap'], msg
 
 
+@pytest.mark.parametrize(('trans_costs', 'capacity'),
+                         ((TRANS_COSTS_1, 100), (TRANS_COSTS_2, 100),
+                          (TRANS_COSTS_1, 350), (TRANS_COSTS_2, None)))
+def test_vectorized_feature_costs(trans_costs, capacity, trans_table):
+    """
+    Test the array-based connection costs against single feature costs
+    """
+    costs = TC.feature_costs(trans_table, capacity=capacity, **trans_costs)
+
+    tc = TC(trans_table, **trans_costs)
+    for i, (_, row) in enumerate(trans_table.iloc[:500].iterrows()):
+        truth = tc.cost(row['trans_line_gid'], row['dist_mi'],
+                        capacity=capacity)
+        if truth is None:
+            assert np.isnan(costs[i])
+        else:
+            assert np.float32(truth) == costs[i]
+
+
+@pytest.mark.parametrize(('trans_costs', 'line_limited'),
+                         ((TRANS_COSTS_1, False), (TRANS_COSTS_2, False),
+                          (TRANS_COSTS_1, True)))
+def test_feature_arrays_connect(trans_costs, line_limited, trans_table):
+    """
+    Test that a greedy connection sequence on the array backed features
+    exactly matches TransmissionFeatures.connect
+    """
+    tf = TF(trans_table, line_limited=line_limited, **trans_costs)
+    tfa = TFA(tf)
+
+    np.random.seed(42)
+    gids = trans_table['trans_line_gid'].values
+    gids = np.random.choice(gids, size=2000)
+    capacities = np.random.uniform(1, 200, size=2000)
+    for gid, capacity in zip(gids, capacities):
+        truth = tf.connect(gid, capacity)
+        assert tfa.connect(int(gid), float(capacity)) == truth
+
+    assert np.array_equal(tfa.available_mask, tf._available_mask)
+    for gid in tf._features:
+        truth = tf.available_capacity(gid)
+        test = tfa.available_capacity(int(gid))
+        if truth is None:
+            assert test is None
+        else:
+            assert np.array_equal(test, truth, equal_nan=True)
+
+
+@pytest.mark.parametrize('avail_cap', (True, False))
+def test_shuffled_feature_costs(avail_cap, trans_table):
+    """
+    Test that the connection costs are aligned with the rows of a shuffled
+    transmission table
+    """
+    table = trans_table.copy()
+    if avail_cap:
+        fc = TF.feature_capacity(table, available_capacity=0.1)
+        fc = fc.set_index('trans_line_gid')['avail_cap']
+        table['avail_cap'] = table['trans_line_gid'].map(fc)
+    elif 'avail_cap' in table:
+        table = table.drop(columns='avail_cap')
+
+    capacity = np.random.RandomState(0).uniform(1, 200, size=len(table))
+    truth = TC.feature_costs(table, capacity=capacity, **TRANS_COSTS_1)
+
+    order = np.random.RandomState(1).permutation(len(table))
+    shuffled = table.iloc[order]
+    costs = TC.feature_costs(shuffled, capacity=capacity[order],
+                             **TRANS_COSTS_1)
+
+    assert np.isnan(truth).any()
+    assert np.array_equal(costs, truth[order], equal_nan=True)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -264,6 +264,54 @@ def test_file_options():
         os.remove(fout)
 
 
+def _sweep_summary():
+    """Make a rev summary with jsonified gid lists for the sweep tests"""
+    sites = np.arange(100)
+    gen_gids = [json.dumps(sites[i:i + 5].tolist()) for i in range(0, 100, 5)]
+    gid_counts = [json.dumps(np.random.randint(1, 10, 5).tolist())
+                  for _ in gen_gids]
+    region = (['r0'] * 3) + (['r1'] * 7) + (['r2'] * 10)
+    timezone = np.random.choice([-4, -5, -6, -7], 20)
+    rev_summary = pd.DataFrame({'gen_gids': gen_gids,
+                                'res_gids': gen_gids,
+                                'gid_counts': gid_counts,
+                                'region': region,
+                                'timezone': timezone})
+
+    return rev_summary
+
+
+@pytest.mark.parametrize(('err_method', 'n_profiles'),
+                         (('rmse', 1), ('mae', 1), ('mbe', 1), ('rmse', 3)))
+def test_sweep(err_method, n_profiles):
+    """Test the single sweep rep profiles against the region-by-region
+    rep profiles."""
+    rev_summary = _sweep_summary()
+    kwargs = {'err_method': err_method, 'n_profiles': n_profiles,
+              'max_workers': 1}
+    p1, m1, _ = RepProfiles.run(GEN_FPATH, rev_summary, 'region', **kwargs)
+    p2, m2, _ = RepProfiles.run(GEN_FPATH, rev_summary, 'region',
+                                sweep=True, **kwargs)
+
+    for n in range(n_profiles):
+        assert np.allclose(p1[n], p2[n])
+
+    assert (m1['rep_gen_gid'] == m2['rep_gen_gid']).all()
+    assert (m1['rep_res_gid'] == m2['rep_res_gid']).all()
+
+
+def test_sweep_meanoid():
+    """Test the single sweep weighted meanoid of every region."""
+    rev_summary = _sweep_summary()
+    profiles, meta, _ = RepProfiles.run(GEN_FPATH, rev_summary, 'region',
+                                        err_method=None, sweep=True)
+
+    for i, region in enumerate(meta['region']):
+        mask = rev_summary['region'] == region
+        r = RegionRepProfile(GEN_FPATH, rev_summary[mask], err_method=None)
+        assert np.allclose(profiles[0][:, i], r.rep_profiles[:, 0])
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -5,6 +5,7 @@ Exclusions unit test module
 import numpy as np
 import os
 import pytest
+import shutil
 
 from reV import TESTDATADIR
 from reV.handlers.exclusions import ExclusionLayers
@@ -186,6 +187,79 @@ def test_inclusion_mask(scenario):
     assert np.allclose(truth, dict_test)
 
 
+@pytest.mark.parametrize(('scenario'),
+                         ['urban_pv', 'rural_pv', 'wind', 'weighted'])
+def test_cached_inclusion_mask(scenario):
+    """
+    Test that the tiled inclusion mask cache matches the full inclusion mask
+    and that mask windows are read from the cache file.
+
+    Parameters
+    ----------
+    scenario : str
+        Standard reV exclusion scenario
+    """
+    excl_h5 = os.path.join(TESTDATADIR, 'ri_exclusions', 'ri_exclusions.h5')
+    cache_dir = os.path.join(TESTDATADIR, 'ri_exclusions', 'mask_cache')
+    truth_path = os.path.join(TESTDATADIR, 'ri_exclusions',
+                              '{}.npy'.format(scenario))
+    truth = np.load(truth_path)
+
+    layers_dict = CONFIGS[scenario]
+    min_area = AREA.get(scenario, None)
+
+    tile_size = ExclusionMask.TILE_SIZE
+    ExclusionMask.TILE_SIZE = 64
+    try:
+        with ExclusionMaskFromDict(excl_h5, layers_dict=layers_dict,
+                                   min_area=min_area,
+                                   cache_dir=cache_dir) as f:
+            fpath = f.build_cache()
+            assert np.allclose(truth, f.mask)
+
+        assert os.path.exists(fpath)
+        with ExclusionMaskFromDict(excl_h5, layers_dict=layers_dict,
+                                   min_area=min_area,
+                                   cache_dir=cache_dir) as f:
+            assert f.cache_fpath == fpath
+            ds_slice = (slice(10, 74), slice(100, 164))
+            assert np.allclose(truth[ds_slice], f[ds_slice])
+    finally:
+        ExclusionMask.TILE_SIZE = tile_size
+        shutil.rmtree(cache_dir)
+
+
+def test_cache_excl_area():
+    """Test that the inclusion mask cache is keyed by the exclusion pixel
+    area and matches the on-the-fly mask for a non-default pixel area."""
+    excl_h5 = os.path.join(TESTDATADIR, 'ri_exclusions', 'ri_exclusions.h5')
+    cache_dir = os.path.join(TESTDATADIR, 'ri_exclusions', 'mask_cache')
+    layers_dict = CONFIGS['rural_pv']
+    min_area = AREA['rural_pv']
+    excl_area = 0.0324
+
+    with ExclusionMaskFromDict(excl_h5, layers_dict=layers_dict,
+                               min_area=min_area, excl_area=excl_area) as f:
+        truth = f.mask
+
+    tile_size = ExclusionMask.TILE_SIZE
+    ExclusionMask.TILE_SIZE = 64
+    try:
+        fpaths = []
+        for area in (0.0081, excl_area):
+            with ExclusionMaskFromDict(excl_h5, layers_dict=layers_dict,
+                                       min_area=min_area, excl_area=area,
+                                       cache_dir=cache_dir) as f:
+                assert f._get_halo(area) == int(np.ceil(min_area / area))
+                fpaths.append(f.build_cache())
+
+        assert fpaths[0] != fpaths[1]
+        assert np.allclose(truth, np.load(fpaths[1]))
+    finally:
+        ExclusionMask.TILE_SIZE = tile_size
+        shutil.rmtree(cache_dir)
+
+
 def test_bad_layer():
     """
     Test creation of inclusion mask
@@ -58,6 +58,20 @@ def test_slicer(gids, resolution):
             assert col_slice0 == col_slice1, msg
 
 
+@pytest.mark.parametrize('resolution', [7, 64, 163])
+def test_valid_sc_points(resolution):
+    """Test the block-reduced valid sc point calc against the full techmap."""
+
+    with SupplyCurveExtent(F_EXCL, resolution=resolution) as sc:
+        valid_gids = sc.valid_sc_points(TM_DSET)
+        tm = sc.exclusions[TM_DSET]
+        truth = [gid for gid in range(len(sc))
+                 if np.any(tm[sc.get_excl_slices(gid)] != -1)]
+
+    assert valid_gids.dtype == np.uint32
+    assert np.array_equal(valid_gids, truth)
+
+
 @pytest.mark.parametrize(('gid', 'resolution', 'excl_dict', 'time_series'),
                          [(37, 64, None, None),
                           (37, 64, EXCL_DICT, None),
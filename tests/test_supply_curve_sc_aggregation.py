@@ -8,9 +8,14 @@ import json
 import os
 import pandas as pd
 from pandas.testing import assert_frame_equal
+import numpy as np
 import pytest
 
-from reV.supply_curve.sc_aggregation import SupplyCurveAggregation
+from reV.supply_curve.aggregation import Aggregation
+from reV.supply_curve.point_summary import SupplyCurvePointSummary
+from reV.supply_curve.sc_aggregation import (SupplyCurveAggregation,
+                                             SupplyCurveAggFileHandler)
+from reV.utilities.exceptions import EmptySupplyCurvePointError
 from reV import TESTDATADIR
 
 EXCL = os.path.join(TESTDATADIR, 'ri_exclusions/ri_exclusions.h5')
@@ -73,7 +78,42 @@ def test_parallel_agg(resolution=64):
                                                       resolution=resolution,
                                                       gids=gids, max_workers=3)
 
-    assert all(summary_serial == summary_parallel)
+    assert_frame_equal(summary_serial, summary_parallel)
+
+
+def test_publish_input_data(tmpdir):
+    """Test that the SC agg inputs published for the parallel workers are
+    memory-mapped and equal to the original inputs."""
+    out_dir = str(tmpdir)
+    gen_index = np.arange(-1, 99)
+    inputs = (np.random.uniform(0, 10, 100), [[0, 4], [4, 100]],
+              np.random.uniform(0, 1, 100).astype(np.float32), None,
+              np.array([0, 1] * 50))
+
+    fp_index, published = SupplyCurveAggregation._publish_input_data(
+        out_dir, gen_index, inputs)
+    assert os.path.exists(fp_index)
+    assert published[1] == inputs[1]
+    assert published[3] is None
+
+    loaded = [SupplyCurveAggregation._load_input_array(arr)
+              for arr in (fp_index, ) + published]
+    for truth, arr in zip((gen_index, ) + inputs, loaded):
+        if isinstance(truth, np.ndarray):
+            assert isinstance(arr, np.memmap)
+            assert not arr.flags.writeable
+            assert arr.dtype == truth.dtype
+            assert np.array_equal(truth, arr)
+        else:
+            assert truth == arr
+
+    fvpd = os.path.join(TESTDATADIR, 'variable_power_density/vpd.csv')
+    vpd = SupplyCurveAggFileHandler.read_power_density(fvpd)
+    fpath = SupplyCurveAggregation._publish_power_density(out_dir, vpd)
+    assert fpath.endswith('.npy')
+    vpd_mmap = SupplyCurveAggFileHandler.read_power_density(fpath)
+    assert_frame_equal(vpd, vpd_mmap, check_dtype=False)
+    assert SupplyCurveAggregation._publish_power_density(out_dir, 36) == 36
 
 
 def test_aggregation_summary():
@@ -100,6 +140,38 @@ def test_aggregation_summary():
         assert_frame_equal(s, s_baseline, check_dtype=False)
 
 
+@pytest.mark.parametrize('gid', [10, 50, 100])
+def test_res_class_split(gid):
+    """Test that the single-pass resource class split of an SC point gives
+    the same summaries as initializing an SC point for every resource
+    class bin."""
+    gen_index = Aggregation._parse_gen_index(GEN)
+    bins = SupplyCurveAggregation._convert_bins(RES_CLASS_BINS)
+    kwargs = {'excl_dict': EXCL_DICT, 'res_class_dset': RES_CLASS_DSET,
+              'data_layers': DATA_LAYERS}
+
+    try:
+        split = SupplyCurvePointSummary.summarize_res_classes(
+            gid, EXCL, GEN, TM_DSET, gen_index, bins, **kwargs)
+    except EmptySupplyCurvePointError:
+        split = {}
+
+    for ri, res_bin in enumerate(bins):
+        try:
+            truth = SupplyCurvePointSummary.summarize(
+                gid, EXCL, GEN, TM_DSET, gen_index, res_class_bin=res_bin,
+                **kwargs)
+        except EmptySupplyCurvePointError:
+            assert ri not in split
+        else:
+            assert sorted(truth) == sorted(split[ri])
+            for k, v in truth.items():
+                if isinstance(v, float):
+                    assert np.allclose(v, split[ri][k], equal_nan=True)
+                else:
+                    assert v == split[ri][k]
+
+
 def test_aggregation_scalar_excl():
     """Test the aggregation summary with exclusions of 0.5"""
 
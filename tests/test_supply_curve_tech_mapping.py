@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 import pytest
 import os
+import shutil
 
 from reV import TESTDATADIR
 from reV.handlers.outputs import Outputs
@@ -41,6 +42,91 @@ def test_resource_tech_mapping():
     assert len(set(ind.flatten())) == 101, msg
 
 
+def test_streaming_tech_mapping():
+    """Run the streaming supply curve technology mapping and compare the
+    saved techmap to the baseline."""
+
+    excl_fpath = os.path.join(TESTDATADIR, 'ri_exclusions/tm_stream_test.h5')
+    shutil.copy(EXCL, excl_fpath)
+    try:
+        TechMapping.run_streaming(excl_fpath, RES, 'techmap_stream',
+                                  max_workers=2, map_chunk=128)
+
+        with ExclusionLayers(EXCL) as ex:
+            ind_truth = ex[TM_DSET]
+
+        with h5py.File(excl_fpath, 'r') as f:
+            ind = f['techmap_stream'][...]
+            assert f['techmap_stream'].attrs['fpath'] == RES
+
+        assert np.array_equal(ind, ind_truth)
+    finally:
+        os.remove(excl_fpath)
+
+
+def test_tech_mapping_cache():
+    """Test that a techmap with the same resource grid fingerprint is re-used
+    instead of re-running the tech mapping."""
+
+    excl_fpath = os.path.join(TESTDATADIR, 'ri_exclusions/tm_cache_test.h5')
+    shutil.copy(EXCL, excl_fpath)
+    try:
+        TechMapping.run(excl_fpath, RES, 'techmap_a', max_workers=2)
+        with TechMapping(excl_fpath, RES, 'techmap_b') as mapper:
+            fingerprint = mapper.fingerprint
+            assert mapper._find_cached_dset() == 'techmap_a'
+
+        _, _, ind = TechMapping.run(excl_fpath, RES, 'techmap_b',
+                                    max_workers=2, use_cache=True)
+
+        with h5py.File(excl_fpath, 'r') as f:
+            assert f['techmap_a'].attrs['fingerprint'] == fingerprint
+            assert f['techmap_b'] == f['techmap_a']
+            assert np.array_equal(ind, f['techmap_a'][...])
+            assert np.array_equal(ind, f[TM_DSET][...])
+    finally:
+        os.remove(excl_fpath)
+
+
+def test_tech_mapping_incremental():
+    """Test that only the tiles affected by changed resource points are
+    re-mapped and that the result matches a full tech mapping run."""
+
+    excl_fpath = os.path.join(TESTDATADIR, 'ri_exclusions/tm_inc_test.h5')
+    res_fpath = os.path.join(TESTDATADIR, 'nsrdb/tm_inc_test_nsrdb.h5')
+    shutil.copy(EXCL, excl_fpath)
+    shutil.copy(RES, res_fpath)
+    try:
+        TechMapping.run(excl_fpath, RES, 'techmap_inc', max_workers=2,
+                        map_chunk=128)
+
+        with h5py.File(res_fpath, 'a') as f:
+            meta = f['meta'][...]
+            meta['latitude'][[5, 50]] += 0.01
+            meta['longitude'][[5, 50]] -= 0.01
+            f['meta'][...] = meta
+
+        with TechMapping(excl_fpath, res_fpath, 'techmap_inc',
+                         map_chunk=128) as mapper:
+            assert mapper._find_cached_dset() is None
+            gids = mapper._get_changed_tiles()
+            assert 0 < len(gids) < mapper._n_sc
+
+        _, _, ind = TechMapping.run(excl_fpath, res_fpath, 'techmap_inc',
+                                    max_workers=2, map_chunk=128,
+                                    use_cache=True)
+        _, _, truth = TechMapping.run(excl_fpath, res_fpath, 'techmap_inc',
+                                      max_workers=2, map_chunk=128,
+                                      save_flag=False)
+
+        assert np.array_equal(ind, truth)
+        with h5py.File(excl_fpath, 'r') as f:
+            assert f['techmap_inc'].attrs['fpath'] == res_fpath
+    finally:
+        os.remove(excl_fpath)
+        os.remove(res_fpath)
+
+
 def plot_tech_mapping():
     """Run the supply curve technology mapping and plot the resulting mapped
     points."""
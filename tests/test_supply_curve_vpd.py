@@ -5,6 +5,7 @@ Created on Wed Jun 19 15:37:05 2019
 @author: gbuster
 """
 import pandas as pd
+from pandas.testing import assert_frame_equal
 import numpy as np
 import pytest
 import os
@@ -57,6 +58,21 @@ def test_vpd():
         assert diff < 1, msg
 
 
+def test_vpd_parallel():
+    """Test that parallel aggregation with the variable power density table
+    published to the workers gives the same results as serial aggregation"""
+
+    kwargs = {'excl_dict': EXCL_DICT, 'res_class_dset': None,
+              'res_class_bins': None, 'data_layers': DATA_LAYERS,
+              'power_density': FVPD, 'gids': list(range(0, 40))}
+    s_serial = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                              max_workers=1, **kwargs)
+    s_parallel = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                                max_workers=2, **kwargs)
+
+    assert_frame_equal(s_serial, s_parallel)
+
+
 def test_vpd_fractional_excl():
     """Test variable power density with fractional exclusions"""
 
@@ -2,6 +2,7 @@
 """
 Supply Curve computation integrated tests
 """
+import numpy as np
 import os
 import pandas as pd
 from pandas.testing import assert_frame_equal
@@ -125,6 +126,35 @@ def test_upwind_downwind_exclusion():
             assert gid not in sc_point_gids, msg
 
 
+def test_exclude_neighbors():
+    """
+    Test the CSR neighbor exclusion and sc_gid <-> sc_point_gid mappings
+    """
+    cwf = CompetitiveWindFarms(WIND_DIRS, SC_POINTS, n_dirs=2)
+    sc_points = pd.read_csv(SC_POINTS)
+
+    for _, row in sc_points.iterrows():
+        sc_point_gid = cwf['sc_point_gid', row['sc_gid']]
+        assert sc_point_gid == row['sc_point_gid']
+        assert row['sc_gid'] in cwf['sc_gid', sc_point_gid]
+
+    sc_point_gid = sc_points['sc_point_gid'].values[0]
+    upwind = cwf['upwind', sc_point_gid]
+    downwind = cwf['downwind', sc_point_gid]
+    excluded = cwf.exclude_neighbors(sc_point_gid, downwind=True)
+
+    valid = sc_points['sc_point_gid'].unique()
+    truth = [gid for gid in np.append(upwind, downwind) if gid in valid]
+    assert np.array_equal(excluded, truth)
+    assert not cwf.mask[excluded].any()
+    assert not np.isin(cwf.sc_point_gids, excluded).any()
+
+    sc_gids = cwf['sc_gid', excluded]
+    truth = sc_points.loc[sc_points['sc_point_gid'].isin(excluded), 'sc_gid']
+    assert np.array_equal(np.sort(sc_gids), np.sort(truth.values))
+    assert not np.isin(cwf.sc_gids, sc_gids).any()
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 